@@ -0,0 +1,84 @@
+import argparse
+import sys
+import time
+import concurrent.futures
+import pandas as pd
+
+# --- SIGNAL BACKTEST ---
+# How the technical signals (RSI, SMA trend, golden / death cross, Bollinger, MACD and
+# the overall status) did historically, over the on-disk price store. Usage:
+#   python backtest.py universe.txt --period 10y --workers 4
+#   python backtest.py universe.txt --sync            # download missing bars first
+# Each worker loads and evaluates its own chunk of tickers; the partial sums are merged.
+
+from logic.backtest import TitanBacktest, HORIZONS
+from screener import load_universe, init_worker, write_results
+
+CHUNK = 100 # Tickers per task
+
+def backtest_chunk(tickers, period, sync, horizons):
+    closes = TitanBacktest.load_closes(tickers, period, sync=sync)
+    if closes.empty: return None, 0
+    return TitanBacktest.partial_stats(closes, horizons), closes.shape[1]
+
+def backtest(tickers, period="10y", workers=1, sync=False, horizons=HORIZONS, progress=True):
+    chunks = [tickers[i:i + CHUNK] for i in range(0, len(tickers), CHUNK)]
+    partials, loaded = [], 0
+    started = time.time()
+
+    def collect(i, result):
+        nonlocal loaded
+        part, n = result
+        if part is not None: partials.append(part)
+        loaded += n
+        if progress: print(f"Backtested {i}/{len(chunks)} chunks ({time.time() - started:.1f}s)", file=sys.stderr)
+
+    if workers <= 1:
+        for i, chunk in enumerate(chunks, 1): collect(i, backtest_chunk(chunk, period, sync, horizons))
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                                                    initargs=(workers,)) as executor:
+            futures = [executor.submit(backtest_chunk, c, period, sync, horizons) for c in chunks]
+            for i, future in enumerate(concurrent.futures.as_completed(futures), 1):
+                try: collect(i, future.result())
+                except Exception as e: print(f"Backtest Error: {e}", file=sys.stderr)
+
+    if not partials: return pd.DataFrame(), 0
+    return TitanBacktest.summarize(partials), loaded
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Titan signal backtest")
+    parser.add_argument("universe", help="Ticker list (.txt, .csv or watchlist .json)")
+    parser.add_argument("--period", default="10y", help="History to test (price store period, e.g. 5y, 10y, max)")
+    parser.add_argument("--horizons", default=",".join(map(str, HORIZONS)), help="Forward horizons in trading days")
+    parser.add_argument("-w", "--workers", type=int, default=1, help="Worker processes")
+    parser.add_argument("--sync", action="store_true", help="Download missing bars into the price store first")
+    parser.add_argument("-o", "--out", help="Also write the table (.csv or .parquet)")
+    parser.add_argument("--quiet", action="store_true", help="No progress output")
+    args = parser.parse_args(argv)
+
+    tickers = load_universe(args.universe)
+    if not tickers:
+        print(f"No tickers in {args.universe}", file=sys.stderr)
+        return 1
+    horizons = tuple(int(h) for h in args.horizons.split(",") if h.strip())
+    workers = max(1, min(args.workers, -(-len(tickers) // CHUNK)))
+
+    results, loaded = backtest(tickers, args.period, workers, args.sync, horizons, not args.quiet)
+    if results.empty:
+        print("No stored price history for this universe. Run with --sync to download it.", file=sys.stderr)
+        return 1
+
+    print(f"{loaded}/{len(tickers)} tickers with history, period {args.period}")
+    with pd.option_context('display.width', 200, 'display.max_rows', None):
+        print(results.to_string(float_format=lambda v: f"{v:.4f}"))
+    if args.out:
+        try:
+            write_results(results, args.out)
+        except Exception as e:
+            print(f"Write Error: {e}", file=sys.stderr)
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
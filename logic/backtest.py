@@ -0,0 +1,178 @@
+import numpy as np
+import pandas as pd
+from logic.technicals import TitanTechnicals
+from logic.price_store import get_price_store
+
+# --- SIGNAL BACKTEST ---
+# The signals TitanTechnicals.analyze reports for the last bar, regenerated for every
+# bar of every ticker: each signal is a dates x tickers boolean matrix, built by the same
+# signal_masks() over full-history indicator matrices. Forward returns, hit rates and
+# drawdowns are then whole-matrix operations; the only row walk is the recursive EMA.
+# Results are additive partial sums, so ticker chunks can run in separate processes.
+HORIZONS = (5, 21, 63)  # Trading days after the signal
+MIN_BARS = 200          # Same warm-up as analyze(): no signals before SMA200 exists
+STATUS_SIGNALS = {"Status: Bullish": 1, "Status: Bearish": -1}
+BASELINE = "All days"
+
+def rolling_mean(x, window):
+    # Column-wise trailing mean; NaN until `window` valid values are in the window
+    valid = ~np.isnan(x)
+    c = np.cumsum(np.where(valid, x, 0.0), axis=0)
+    n = np.cumsum(valid, axis=0)
+    c[window:] = c[window:] - c[:-window]
+    n[window:] = n[window:] - n[:-window]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(n == window, c / window, np.nan)
+
+def rolling_std(x, window):
+    # Sample std (ddof=1, like pandas). Centered on each column's mean first so the
+    # sum-of-squares form does not lose precision.
+    center = np.nanmean(x, axis=0)
+    d = x - center
+    m = rolling_mean(d, window)
+    m2 = rolling_mean(d * d, window)
+    return np.sqrt(np.maximum(m2 - m * m, 0.0) * window / (window - 1))
+
+def shift_up(x, h):
+    # out[t] = x[t + h], NaN past the end
+    out = np.full_like(x, np.nan)
+    if h < len(x): out[:len(x) - h] = x[h:]
+    return out
+
+def forward_min(x, h):
+    # min(x[t+1 .. t+h]) per cell with log2(h) shifted minimums (window doubling)
+    out = shift_up(x, 1)
+    span = 1
+    while span < h:
+        step = min(span, h - span)
+        out = np.fmin(out, shift_up(out, step))
+        span += step
+    # fmin ignores NaN: rows whose window runs past the end are not complete
+    out[max(len(x) - h, 0):] = np.nan
+    return out
+
+class TitanBacktest:
+    @staticmethod
+    def indicators(x):
+        # x: dates x tickers closes -> the analyze_close() indicators for every bar
+        sma20 = rolling_mean(x, 20)
+        std20 = rolling_std(x, 20)
+
+        delta = np.diff(x, axis=0, prepend=np.nan)
+        gain = rolling_mean(np.where(delta > 0, delta, np.where(np.isnan(delta), np.nan, 0.0)), 14)
+        loss = rolling_mean(np.where(delta < 0, -delta, np.where(np.isnan(delta), np.nan, 0.0)), 14)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = 100 - (100 / (1 + gain / loss))
+
+        # EMAs are recursive (adjust=False): one walk over the rows, all tickers side by side
+        a12, a26, a9 = 2 / 13, 2 / 27, 2 / 10
+        macd = np.full_like(x, np.nan)
+        sig = np.full_like(x, np.nan)
+        ema12 = np.full(x.shape[1], np.nan)
+        ema26 = ema12.copy()
+        s = ema12.copy()
+        for i, row in enumerate(x):
+            ema12 = np.where(np.isnan(ema12), row, (1 - a12) * ema12 + a12 * row)
+            ema26 = np.where(np.isnan(ema26), row, (1 - a26) * ema26 + a26 * row)
+            m = ema12 - ema26
+            s = np.where(np.isnan(s), m, (1 - a9) * s + a9 * m)
+            macd[i], sig[i] = m, s
+
+        return {"price": x, "rsi": rsi, "sma50": rolling_mean(x, 50), "sma200": rolling_mean(x, MIN_BARS),
+                "upper_bb": sma20 + std20 * 2, "lower_bb": sma20 - std20 * 2, "macd": macd, "signal": sig}
+
+    @staticmethod
+    def signals(x):
+        # -> ({signal: dates x tickers bool}, {signal: bias}, ready); only bars with a full SMA200
+        ind = TitanBacktest.indicators(x)
+        ready = ~np.isnan(ind["sma200"])
+        with np.errstate(invalid='ignore'):
+            masks = {n: m & ready for n, m in TitanTechnicals.signal_masks(**ind).items()}
+        bias = dict(TitanTechnicals.signal_bias)
+
+        # Overall status, same vote as build_signals
+        bull = sum(m.astype(np.int8) for n, m in masks.items() if bias[n] > 0)
+        bear = sum(m.astype(np.int8) for n, m in masks.items() if bias[n] < 0)
+        masks["Status: Bullish"] = ready & (bull > bear)
+        masks["Status: Bearish"] = ready & (bear > bull)
+        bias.update(STATUS_SIGNALS)
+        return masks, bias, ready
+
+    @staticmethod
+    def partial_stats(closes, horizons=HORIZONS):
+        # closes: dates x tickers frame -> additive sums per (signal, horizon)
+        # Halted days carry the last close; nothing is carried past a ticker's last bar
+        x = closes.ffill().where(closes.bfill().notna()).to_numpy(dtype=np.float64)
+        masks, bias, ready = TitanBacktest.signals(x)
+        rows = []
+        with np.errstate(invalid='ignore', divide='ignore'):
+            # Per-ticker equity of trading each signal (long if bullish, short if bearish)
+            # one day at a time, for the strategy drawdown
+            step = shift_up(x, 1) / x - 1
+            step = np.where(np.isnan(step), 0.0, step)
+            drawdowns = {}
+            for name, m in masks.items():
+                equity = np.cumprod(1 + np.where(m, bias[name] * step, 0.0), axis=0)
+                dd = 1 - equity / np.maximum.accumulate(equity, axis=0)
+                traded = m.any(axis=0)
+                drawdowns[name] = (float(dd.max(axis=0)[traded].sum()), int(traded.sum()))
+
+            for h in horizons:
+                fwd = shift_up(x, h) / x - 1
+                adverse = forward_min(x, h) / x - 1   # Worst close within the horizon
+                favour = -forward_min(-x, h) / x - 1  # Best close within the horizon
+                known = ~np.isnan(fwd)
+                rows.append(TitanBacktest._sums(BASELINE, h, ready & known, fwd, 1, adverse, (0.0, 0)))
+                for name, m in masks.items():
+                    # Drawdown within the horizon against the position: a dip for longs, a rally for shorts
+                    against = adverse if bias[name] > 0 else -favour
+                    rows.append(TitanBacktest._sums(name, h, m & known, fwd, bias[name], against, drawdowns[name]))
+        return pd.DataFrame(rows)
+
+    @staticmethod
+    def _sums(name, horizon, hit_mask, fwd, bias, against, drawdown):
+        r = fwd[hit_mask]
+        return {"signal": name, "horizon": horizon, "n": int(hit_mask.sum()), "sum_ret": float(r.sum()),
+                "sum_sq": float((r * r).sum()), "hits": int((bias * r > 0).sum()),
+                "sum_mae": float(against[hit_mask].sum()), "dd_sum": drawdown[0], "dd_tickers": drawdown[1]}
+
+    @staticmethod
+    def summarize(partials):
+        # Partial sums (from one or many chunks) -> one row per (signal, horizon)
+        df = pd.concat(partials, ignore_index=True) if isinstance(partials, list) else partials
+        df = df.groupby(["signal", "horizon"], sort=False).sum()
+        n = df["n"].where(df["n"] > 0)
+        mean = df["sum_ret"] / n
+        base = mean.xs(BASELINE, level="signal")
+        out = pd.DataFrame({
+            "occurrences": df["n"],
+            "mean_return": mean,
+            "edge": mean - base.reindex(mean.index.get_level_values("horizon")).to_numpy(),
+            "volatility": np.sqrt(np.maximum(df["sum_sq"] / n - mean * mean, 0)),
+            "hit_rate": df["hits"] / n,
+            "mean_drawdown": df["sum_mae"] / n,
+            "strategy_max_dd": df["dd_sum"] / df["dd_tickers"].where(df["dd_tickers"] > 0)
+        })
+        # The baseline is "did the stock go up", not a trade
+        out.loc[BASELINE, "strategy_max_dd"] = np.nan
+        return out
+
+    @staticmethod
+    def load_closes(tickers, period="10y", sync=False, store=None):
+        # Closes from the on-disk price store (memory-mapped) -> dates x tickers frame.
+        # sync=True downloads what is missing first; otherwise only stored bars are used.
+        store = store or get_price_store()
+        series = {}
+        for t in tickers:
+            try:
+                df = store.history(t, period=period) if sync else store.read(t, period)
+            except Exception as e:
+                print(f"Backtest Error ({t}): {e}")
+                continue
+            if df is None or df.empty: continue
+            close = df['Close']
+            # Session dates, so tickers from different time zones line up
+            close.index = close.index.tz_localize(None).normalize() if close.index.tz is not None else close.index.normalize()
+            series[t] = close[~close.index.duplicated(keep='last')]
+        if not series: return pd.DataFrame()
+        return pd.concat(series, axis=1).sort_index()
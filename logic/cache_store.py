@@ -0,0 +1,183 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from contextlib import contextmanager
+try:
+    from zoneinfo import ZoneInfo
+    MARKET_TZ = ZoneInfo("America/New_York")
+except Exception:
+    MARKET_TZ = timezone(timedelta(hours=-5))
+
+# --- SECTIONED TICKER CACHE ---
+# One row per (ticker, section) in SQLite (WAL mode). Each write is its own
+# transaction, so a crash can only lose the entry being written, and startup
+# does not read anything until a ticker is actually requested.
+CACHE_DB = "titan_cache.db"
+
+# Which top-level keys of a fetch_data() entry belong to which section.
+# Everything not listed here is stored under "info".
+SECTION_KEYS = {
+    "technicals": ("tech", "tech_state"),
+    "sentiment": ("sentiment",),
+    "institutional": ("institutional",)
+}
+SECTIONS = ("info",) + tuple(SECTION_KEYS)
+
+# --- FRESHNESS POLICY (seconds) ---
+# "info" carries the live quote, so it expires in minutes; the fundamental score is
+# recomputed from the same info payload for free. Technicals expire when a daily bar
+# closes (see last_market_close), not on a timer.
+SECTION_TTLS = {
+    "info": 5 * 60,
+    "sentiment": 60 * 60,
+    "institutional": 2 * 24 * 3600
+}
+MARKET_CLOSE_HOUR = 16
+
+def last_market_close(now=None):
+    # Most recent weekday 16:00 New York time (holidays just cause one extra refresh)
+    t = datetime.fromtimestamp(now if now is not None else time.time(), MARKET_TZ)
+    close = t.replace(hour=MARKET_CLOSE_HOUR, minute=0, second=0, microsecond=0)
+    if t < close: close -= timedelta(days=1)
+    while close.weekday() >= 5: close -= timedelta(days=1)
+    return close.timestamp()
+
+def _json_default(obj):
+    # numpy scalars from the analysis modules
+    if hasattr(obj, 'item'): return obj.item()
+    raise TypeError(f"Cannot serialise {type(obj).__name__}")
+
+# --- SHARED SQLITE SETUP ---
+# Every store in titan_cache.db opens its connection the same way: autocommit (explicit
+# BEGIN where needed), usable from any thread (each store serialises with its own lock),
+# WAL so readers never block the writer.
+def open_db(path, schema=()):
+    conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    for statement in schema: conn.execute(statement)
+    return conn
+
+def lazy_singleton(factory):
+    # -> get(): one process-wide factory() instance, built on first use (double-checked)
+    instance, lock = [], threading.Lock()
+    def get():
+        if not instance:
+            with lock:
+                if not instance: instance.append(factory())
+        return instance[0]
+    return get
+
+def section_of(key):
+    for section, keys in SECTION_KEYS.items():
+        if key in keys: return section
+    return "info"
+
+class TitanCacheStore:
+    def __init__(self, path=CACHE_DB, legacy_file=None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = open_db(path, ("""CREATE TABLE IF NOT EXISTS entries (
+            ticker TEXT NOT NULL,
+            section TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            updated REAL NOT NULL,
+            PRIMARY KEY (ticker, section))""",))
+        if legacy_file: self.import_json(legacy_file)
+
+    # --- Reads ---
+    def get(self, ticker):
+        # Full entry (all sections merged), or None if nothing is cached
+        with self._lock:
+            rows = self._conn.execute("SELECT payload FROM entries WHERE ticker=?", (ticker,)).fetchall()
+        if not rows: return None
+        data = {}
+        for (payload,) in rows: data.update(json.loads(payload))
+        return data
+
+    def get_section(self, ticker, section):
+        with self._lock:
+            row = self._conn.execute("SELECT payload FROM entries WHERE ticker=? AND section=?", (ticker, section)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def updated(self, ticker):
+        # {section: unix time of last write}
+        with self._lock:
+            rows = self._conn.execute("SELECT section, updated FROM entries WHERE ticker=?", (ticker,)).fetchall()
+        return dict(rows)
+
+    def stale_sections(self, ticker, now=None):
+        # Sections that are missing or past their freshness policy
+        now = now if now is not None else time.time()
+        updated = self.updated(ticker)
+        stale = []
+        for section in SECTIONS:
+            ts = updated.get(section)
+            if ts is None: stale.append(section)
+            elif section == "technicals":
+                if ts < last_market_close(now): stale.append(section)
+            elif now - ts > SECTION_TTLS[section]: stale.append(section)
+        return stale
+
+    def tickers(self):
+        with self._lock:
+            return [r[0] for r in self._conn.execute("SELECT DISTINCT ticker FROM entries")]
+
+    def __contains__(self, ticker):
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM entries WHERE ticker=? LIMIT 1", (ticker,)).fetchone() is not None
+
+    # --- Writes ---
+    def put(self, ticker, data, sections=None):
+        # Split a full entry into its sections and write them atomically.
+        # sections limits the write to those sections (others stay untouched).
+        parts = {}
+        for key, value in data.items():
+            parts.setdefault(section_of(key), {})[key] = value
+        if sections is not None: parts = {s: p for s, p in parts.items() if s in sections}
+        now = time.time()
+        rows = [(ticker, s, json.dumps(p, default=_json_default), now) for s, p in parts.items()]
+        with self._lock:
+            with self._transaction():
+                self._conn.executemany("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)", rows)
+
+    def put_section(self, ticker, section, payload, merge=True):
+        with self._lock:
+            with self._transaction():
+                if merge:
+                    row = self._conn.execute("SELECT payload FROM entries WHERE ticker=? AND section=?", (ticker, section)).fetchone()
+                    if row: payload = dict(json.loads(row[0]), **payload)
+                self._conn.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                                   (ticker, section, json.dumps(payload, default=_json_default), time.time()))
+
+    def invalidate(self, ticker, section=None):
+        with self._lock:
+            if section is None: self._conn.execute("DELETE FROM entries WHERE ticker=?", (ticker,))
+            else: self._conn.execute("DELETE FROM entries WHERE ticker=? AND section=?", (ticker, section))
+
+    def import_json(self, filename):
+        # One-off migration from the old monolithic titan_cache.json (only into an empty store)
+        if not os.path.exists(filename): return 0
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM entries LIMIT 1").fetchone(): return 0
+        try:
+            with open(filename, 'r') as f: legacy = json.load(f)
+        except Exception as e:
+            print(f"Cache Import Error: {e}")
+            return 0
+        for ticker, data in legacy.items(): self.put(ticker, data)
+        print(f"Imported {len(legacy)} tickers from {filename}")
+        return len(legacy)
+
+    @contextmanager
+    def _transaction(self):
+        self._conn.execute("BEGIN")
+        try:
+            yield
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
@@ -0,0 +1,201 @@
+import os
+import pickle
+import hashlib
+import threading
+import yfinance as yf
+import pandas as pd
+from logic.scheduler import call_limited
+from logic.feeds import get_feed_fetcher
+
+# --- PROVIDER SELECTION ---
+# TITAN_PROVIDER=live    -> talk to Yahoo directly (default)
+# TITAN_PROVIDER=record  -> talk to Yahoo and save every response under TITAN_REPLAY_DIR
+# TITAN_PROVIDER=replay  -> serve saved responses from TITAN_REPLAY_DIR, no network at all
+PROVIDER_ENV = "TITAN_PROVIDER"
+REPLAY_DIR_ENV = "TITAN_REPLAY_DIR"
+DEFAULT_REPLAY_DIR = "titan_replay"
+
+RSS_URL = "https://finance.yahoo.com/rss/headline?s={ticker}"
+
+# Tickers per multi-ticker history request
+BATCH_SIZE = 100
+
+class TitanDataProvider:
+    # Every market-data call in the app goes through one of these.
+    # Backends only have to implement the five methods below.
+    name = "base"
+
+    def info(self, ticker):
+        raise NotImplementedError
+
+    def history(self, ticker, period="1y", interval="1d", start=None):
+        # start (date) overrides period when given, for delta fetches
+        raise NotImplementedError
+
+    def insider_transactions(self, ticker):
+        raise NotImplementedError
+
+    def statements(self, ticker):
+        # {"financials": df, "balance_sheet": df, "cashflow": df}
+        raise NotImplementedError
+
+    def news(self, ticker):
+        # List of plain dicts: title, link, source, author, published (9-tuple or None)
+        raise NotImplementedError
+
+    def news_many(self, tickers):
+        # {ticker: news(ticker)}; tickers whose feed fails are left out
+        results = {}
+        for t in tickers:
+            try:
+                results[t] = self.news(t)
+            except Exception as e:
+                print(f"News Error ({t}): {e}")
+        return results
+
+    def download(self, tickers, period="1y", interval="1d", chunk_size=BATCH_SIZE):
+        # One wide OHLCV frame for many tickers: columns are (field, ticker).
+        # Cost grows with the number of chunks, not the number of tickers.
+        tickers = list(dict.fromkeys(t.upper() for t in tickers))
+        frames = []
+        for i in range(0, len(tickers), chunk_size):
+            chunk = tickers[i:i + chunk_size]
+            frame = self.download_chunk(chunk, period, interval)
+            if frame is not None and not frame.empty: frames.append(frame)
+        if not frames: return pd.DataFrame()
+        return pd.concat(frames, axis=1).sort_index(axis=1)
+
+    def download_chunk(self, tickers, period, interval):
+        # Fallback for backends without a batch endpoint: one history call per ticker
+        frames = {}
+        for t in tickers:
+            try:
+                df = self.history(t, period=period, interval=interval)
+                if df is not None and not df.empty: frames[t] = df
+            except Exception as e:
+                print(f"Download Error ({t}): {e}")
+        if not frames: return None
+        return pd.concat(frames, axis=1).swaplevel(axis=1)
+
+class LiveProvider(TitanDataProvider):
+    # Every network call goes through call_limited: shared token bucket + backoff on throttling
+    name = "live"
+
+    def info(self, ticker):
+        return call_limited(lambda: yf.Ticker(ticker).info)
+
+    def history(self, ticker, period="1y", interval="1d", start=None):
+        if start is not None: return call_limited(yf.Ticker(ticker).history, start=start, interval=interval)
+        return call_limited(yf.Ticker(ticker).history, period=period, interval=interval)
+
+    def insider_transactions(self, ticker):
+        return call_limited(lambda: yf.Ticker(ticker).insider_transactions)
+
+    def statements(self, ticker):
+        stock = yf.Ticker(ticker)
+        return {
+            "financials": call_limited(lambda: stock.financials),
+            "balance_sheet": call_limited(lambda: stock.balance_sheet),
+            "cashflow": call_limited(lambda: stock.cashflow)
+        }
+
+    def download_chunk(self, tickers, period, interval):
+        frame = call_limited(yf.download, tickers, period=period, interval=interval, group_by='column',
+                             auto_adjust=True, threads=True, progress=False)
+        if frame is None or frame.empty: return None
+        # A single ticker can come back with flat columns
+        if not isinstance(frame.columns, pd.MultiIndex):
+            frame.columns = pd.MultiIndex.from_product([frame.columns, tickers])
+        # Drop tickers Yahoo could not resolve (all-NaN columns)
+        return frame.dropna(axis=1, how='all')
+
+    def news(self, ticker):
+        # Conditional GET: an unchanged feed costs a 304 and no parsing
+        return get_feed_fetcher().fetch(RSS_URL.format(ticker=ticker))
+
+    def news_many(self, tickers):
+        urls = {t: RSS_URL.format(ticker=t) for t in tickers}
+        feeds, errors = get_feed_fetcher().fetch_many(urls.values())
+        for url, e in errors.items(): print(f"News Error ({url}): {e}")
+        return {t: feeds[url] for t, url in urls.items() if url in feeds}
+
+class ReplayProvider(TitanDataProvider):
+    # mode="record": forward to the wrapped backend and write each response to disk.
+    # mode="replay": only read from disk; a missing recording raises LookupError.
+    name = "replay"
+
+    def __init__(self, root=DEFAULT_REPLAY_DIR, mode="replay", backend=None):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown replay mode: {mode}")
+        self.root = root
+        self.mode = mode
+        self.backend = backend or LiveProvider()
+        self._lock = threading.Lock()
+
+    def _path(self, method, ticker, *args):
+        key = "|".join(str(a) for a in args)
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+        safe = "".join(c if c.isalnum() or c in "-_." else "_" for c in ticker.upper())
+        return os.path.join(self.root, method, f"{safe}__{digest}.pkl")
+
+    def _call(self, method, ticker, *args):
+        path = self._path(method, ticker, *args)
+        if self.mode == "replay":
+            if not os.path.exists(path):
+                raise LookupError(f"No recording for {method}({ticker}{', ' if args else ''}{', '.join(map(str, args))})")
+            with open(path, 'rb') as f: return pickle.load(f)
+
+        if method == "download_chunk":
+            result = self.backend.download_chunk(args[0].split(","), *args[1:])
+        else:
+            result = getattr(self.backend, method)(ticker, *args)
+        # Write to a temp file first so a crash never leaves a half-written recording
+        with self._lock:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp, 'wb') as f: pickle.dump(result, f)
+            os.replace(tmp, path)
+        return result
+
+    def info(self, ticker):
+        return self._call("info", ticker)
+
+    def history(self, ticker, period="1y", interval="1d", start=None):
+        if start is not None: return self._call("history", ticker, f"start={start}", interval)
+        return self._call("history", ticker, period, interval)
+
+    def insider_transactions(self, ticker):
+        return self._call("insider_transactions", ticker)
+
+    def statements(self, ticker):
+        return self._call("statements", ticker)
+
+    def news(self, ticker):
+        return self._call("news", ticker)
+
+    def download_chunk(self, tickers, period, interval):
+        # Recorded under a digest of the ticker list so long chunks keep short file names
+        return self._call("download_chunk", "batch", ",".join(tickers), period, interval)
+
+# --- PROCESS-WIDE PROVIDER ---
+_provider = None
+_provider_lock = threading.Lock()
+
+def build_provider(kind=None, root=None):
+    kind = (kind or os.environ.get(PROVIDER_ENV, "live")).lower()
+    root = root or os.environ.get(REPLAY_DIR_ENV, DEFAULT_REPLAY_DIR)
+    if kind == "live": return LiveProvider()
+    if kind in ("record", "replay"): return ReplayProvider(root, mode=kind)
+    raise ValueError(f"Unknown {PROVIDER_ENV}: {kind}")
+
+def get_provider():
+    global _provider
+    if _provider is None:
+        with _provider_lock:
+            if _provider is None: _provider = build_provider()
+    return _provider
+
+def set_provider(provider):
+    global _provider
+    with _provider_lock:
+        _provider = provider
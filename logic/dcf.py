@@ -0,0 +1,111 @@
+import numpy as np
+
+# --- DISCOUNTED CASH FLOW ---
+# FCF grows at g for `years`, each year discounted at r, plus a terminal value of
+# terminal_multiple x final-year FCF. With q = (1+g)/(1+r) the sum is geometric:
+#   value = fcf * (q * (1 - q^n) / (1 - q) + terminal_multiple * q^n)
+# so any mix of scalars / arrays broadcasts into one NumPy expression, no year loop.
+DCF_YEARS = 10
+DEFAULT_DISCOUNT = 0.10 # Same defaults as the DCF tab
+DEFAULT_TERMINAL = 15
+IMPLIED_RANGE = (-0.5, 1.0)  # Growth search interval for implied_growth
+IMPLIED_ITERATIONS = 50      # Halvings: 1.5 / 2^50, far below display precision
+
+# Monte Carlo: {input: (distribution, spread)} around the point inputs. growth / discount
+# spreads are absolute (0.05 = 5pp), terminal spreads are relative (0.35 = +/-35%).
+MC_DISTRIBUTIONS = {
+    "growth": ("normal", 0.05),
+    "discount": ("normal", 0.015),
+    "terminal": ("triangular", 0.35)
+}
+MC_BOUNDS = {"growth": (-0.5, 0.6), "discount": (0.02, 0.3), "terminal": (1.0, 60.0)}
+MC_PATHS = 1_000_000
+MC_CHUNK = 100_000 # Paths per batch, bounds memory at a few MB
+MC_BINS = 4096
+MC_PERCENTILES = (5, 25, 50, 75, 95)
+
+class TitanDCF:
+    @staticmethod
+    def value(fcf_per_share, growth, discount, terminal_multiple, years=DCF_YEARS):
+        # Intrinsic value per share; 0 where FCF is not positive (same rule as before)
+        fcf = np.asarray(fcf_per_share, dtype=np.float64)
+        q = (1 + np.asarray(growth, dtype=np.float64)) / (1 + np.asarray(discount, dtype=np.float64))
+        qn = q ** years
+        with np.errstate(divide='ignore', invalid='ignore'):
+            annuity = np.where(np.abs(1 - q) < 1e-12, years, q * (1 - qn) / (1 - q))
+        out = np.where(fcf > 0, fcf * (annuity + np.asarray(terminal_multiple, dtype=np.float64) * qn), 0.0)
+        return out if out.ndim else float(out)
+
+    @staticmethod
+    def grid(fcf_per_share, growths, discounts, terminals, years=DCF_YEARS):
+        # Full sensitivity cube in one call -> array [growth, discount, terminal]
+        g = np.asarray(growths, dtype=np.float64)[:, None, None]
+        r = np.asarray(discounts, dtype=np.float64)[None, :, None]
+        t = np.asarray(terminals, dtype=np.float64)[None, None, :]
+        return TitanDCF.value(fcf_per_share, g, r, t, years)
+
+    # --- REVERSE DCF ---
+    @staticmethod
+    def implied_growth(price, fcf_per_share, discount=DEFAULT_DISCOUNT, terminal_multiple=DEFAULT_TERMINAL,
+                       years=DCF_YEARS, low=IMPLIED_RANGE[0], high=IMPLIED_RANGE[1], iterations=IMPLIED_ITERATIONS):
+        # Growth rate the market is pricing in: solves value(g) = price for every element
+        # at once. value() rises with g, so a fixed number of array-wide bisection steps
+        # converges everywhere together. NaN where FCF or price is not positive, or the
+        # price needs growth outside [low, high].
+        price, fcf, r, t = np.broadcast_arrays(*(np.asarray(x, dtype=np.float64) for x in (price, fcf_per_share, discount, terminal_multiple)))
+        lo, hi = np.full(price.shape, float(low)), np.full(price.shape, float(high))
+        ok = (fcf > 0) & (price > 0)
+        ok &= (TitanDCF.value(fcf, lo, r, t, years) <= price) & (TitanDCF.value(fcf, hi, r, t, years) >= price)
+        for _ in range(iterations):
+            mid = (lo + hi) / 2
+            below = TitanDCF.value(fcf, mid, r, t, years) < price
+            lo = np.where(below, mid, lo)
+            hi = np.where(below, hi, mid)
+        out = np.where(ok, (lo + hi) / 2, np.nan)
+        return out if out.ndim else float(out)
+
+    # --- MONTE CARLO ---
+    @staticmethod
+    def sample(kind, center, spread, size, rng):
+        # One input drawn around its point estimate
+        if kind == "normal": return rng.normal(center, spread, size)
+        if kind == "uniform": return rng.uniform(center - spread, center + spread, size)
+        if kind == "triangular": return rng.triangular(center * (1 - spread), center, center * (1 + spread), size) # spread relative
+        if kind == "lognormal": return center * rng.lognormal(-spread ** 2 / 2, spread, size) # mean-preserving
+        raise ValueError(f"Unknown distribution: {kind}")
+
+    @staticmethod
+    def monte_carlo(fcf_per_share, price, growth, discount, terminal_multiple, paths=MC_PATHS,
+                    distributions=None, seed=None, chunk=MC_CHUNK, percentiles=MC_PERCENTILES, years=DCF_YEARS):
+        # Value distribution when growth / discount / terminal are uncertain.
+        # Paths are drawn MC_CHUNK at a time and folded into a fixed histogram, so memory
+        # does not grow with `paths`; percentiles are read off the cumulative histogram.
+        if fcf_per_share <= 0 or paths <= 0: return None
+        dists = {**MC_DISTRIBUTIONS, **(distributions or {})}
+        rng = np.random.default_rng(seed)
+        centers = {"growth": growth, "discount": discount, "terminal": terminal_multiple}
+
+        counts, edges = None, None
+        total, above, done = 0.0, 0, 0
+        while done < paths:
+            n = min(chunk, paths - done)
+            draw = {k: TitanDCF.sample(dists[k][0], centers[k], dists[k][1], n, rng) for k in centers}
+            g = np.clip(draw["growth"], *MC_BOUNDS["growth"])
+            r = np.clip(draw["discount"], *MC_BOUNDS["discount"])
+            t = np.clip(draw["terminal"], *MC_BOUNDS["terminal"])
+            values = TitanDCF.value(np.full(n, float(fcf_per_share)), g, r, t, years)
+
+            if edges is None:
+                # Range fixed from the first chunk with headroom; the rare tail beyond it lands in the last bin
+                edges = np.linspace(0.0, np.quantile(values, 0.999) * 2, MC_BINS + 1)
+                counts = np.zeros(MC_BINS, dtype=np.int64)
+            idx = np.minimum(np.searchsorted(edges, values, side='right') - 1, MC_BINS - 1)
+            counts += np.bincount(idx, minlength=MC_BINS)
+            total += values.sum()
+            above += int((values > price).sum())
+            done += n
+
+        cdf = np.concatenate(([0.0], np.cumsum(counts) / done)) # At each bin edge
+        pct = {p: float(np.interp(p / 100, cdf, edges)) for p in percentiles}
+        return {"paths": done, "mean": total / done, "percentiles": pct,
+                "p_above": above / done, "hist": (edges, counts)}
@@ -0,0 +1,90 @@
+import json
+import time
+import threading
+import requests
+import feedparser
+from requests.adapters import HTTPAdapter
+from logic.cache_store import CACHE_DB, open_db, lazy_singleton
+from logic.scheduler import call_limited, TitanRateLimiter, TitanScheduler, MAX_WORKERS
+
+# --- RSS FEEDS WITH CONDITIONAL GET ---
+# One pooled HTTP session for every feed. The ETag / Last-Modified validators and the
+# parsed entries of each feed are kept in titan_cache.db; the next request sends them
+# back, and a 304 reuses the stored entries without downloading or parsing anything.
+FEED_TIMEOUT = 10 # Seconds per request
+# The RSS host is not the info / history API: it gets its own token bucket instead of
+# the shared 4/s budget, so a watchlist refresh takes about as long as the slowest feed
+# (concurrency is capped by max_workers / the session pool). A real 429 still backs off.
+FEED_RATE = 50.0 # Sustained feed requests per second
+FEED_BURST = 100 # Back-to-back requests after an idle period (a whole watchlist)
+feed_limiter = TitanRateLimiter(FEED_RATE, FEED_BURST)
+HEADERS = {'User-Agent': 'Mozilla/5.0'}
+
+def normalize_entry(entry):
+    # feedparser entry -> plain dict: title, link, source, author, published (9-tuple or None)
+    published = entry.get('published_parsed')
+    return {
+        "title": entry.get('title', ''),
+        "link": entry.get('link', ''),
+        "source": (entry.get('source') or {}).get('title', ''),
+        "author": entry.get('author', 'N/A'),
+        "published": tuple(published) if published else None
+    }
+
+class TitanFeedFetcher:
+    def __init__(self, path=CACHE_DB, max_workers=MAX_WORKERS):
+        self.max_workers = max_workers
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._lock = threading.Lock()
+        self._conn = open_db(path, (
+            """CREATE TABLE IF NOT EXISTS feeds (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            modified TEXT,
+            entries TEXT NOT NULL,
+            fetched REAL NOT NULL)""",))
+        self.stats = {"200": 0, "304": 0}
+
+    def fetch(self, url):
+        # -> list of normalized entries
+        with self._lock:
+            row = self._conn.execute("SELECT etag, modified, entries FROM feeds WHERE url=?", (url,)).fetchone()
+        headers = {}
+        if row:
+            if row[0]: headers['If-None-Match'] = row[0]
+            if row[1]: headers['If-Modified-Since'] = row[1]
+
+        resp = call_limited(self._get, url, headers, limiter=feed_limiter)
+        if resp.status_code == 304 and row:
+            with self._lock:
+                self.stats["304"] += 1
+                self._conn.execute("UPDATE feeds SET fetched=? WHERE url=?", (time.time(), url))
+            entries = json.loads(row[2])
+            for e in entries:
+                if e['published']: e['published'] = tuple(e['published'])
+            return entries
+        resp.raise_for_status()
+
+        entries = [normalize_entry(e) for e in feedparser.parse(resp.content).entries]
+        with self._lock:
+            self.stats["200"] += 1
+            self._conn.execute("INSERT OR REPLACE INTO feeds VALUES (?, ?, ?, ?, ?)",
+                               (url, resp.headers.get('ETag'), resp.headers.get('Last-Modified'),
+                                json.dumps(entries), time.time()))
+        return entries
+
+    def _get(self, url, headers):
+        resp = self.session.get(url, headers=headers, timeout=FEED_TIMEOUT)
+        if resp.status_code == 429: resp.raise_for_status() # Throttled: call_limited backs off
+        return resp
+
+    def fetch_many(self, urls):
+        # All feeds concurrently on the pooled session -> ({url: entries}, {url: exception})
+        return TitanScheduler(self.max_workers).run(list(dict.fromkeys(urls)), self.fetch)
+
+get_feed_fetcher = lazy_singleton(TitanFeedFetcher)
@@ -1,3 +1,6 @@
+from logic.scoring import TitanScoring
+from logic.dcf import TitanDCF
+
 class TitanFundamentals:
     # This dictionary is required by main.py for tooltips
     metric_descriptions = {
@@ -13,77 +16,10 @@ class TitanFundamentals:
 
     @staticmethod
     def calculate_score(info):
-        score = 0
-        max_score = 0
-        flags = []
-        breakdown = [] 
-
-        def get(key, default=0):
-            val = info.get(key)
-            if isinstance(val, (int, float)): return val
-            return default
-
-        def add_points(points, reason, description=""):
-            nonlocal score, max_score
-            max_score += 20 
-            if points > 0:
-                score += points
-                breakdown.append(f"✅ {reason}")
-            else:
-                breakdown.append(f"⚪ {reason}")
-
-        # 1. ROE
-        roe = get('returnOnEquity', 0) * 100
-        if roe > 15: add_points(20, f"High ROE ({roe:.1f}%)")
-        else: add_points(0, f"Low ROE ({roe:.1f}%)")
-
-        # 2. Margins
-        op_margin = get('operatingMargins', 0) * 100
-        if op_margin > 15: add_points(20, f"High Margins ({op_margin:.1f}%)")
-        else: add_points(0, f"Low Margins ({op_margin:.1f}%)")
-
-        # 3. Debt
-        de = get('debtToEquity', 1000)
-        if de < 100: add_points(20, f"Safe Debt Level (D/E {de:.0f}%)")
-        else: 
-            add_points(0, f"High Debt (D/E {de:.0f}%)")
-            flags.append("High Debt Risk")
-
-        # 4. Liquidity
-        cr = get('currentRatio', 0)
-        if cr > 1.2: add_points(20, f"Liquid Balance Sheet (CR {cr:.2f}x)")
-        else: 
-            add_points(0, f"Low Liquidity (CR {cr:.2f}x)")
-            flags.append("Liquidity Risk")
-
-        # 5. Growth (PEG Check)
-        pe = get('trailingPE', 0)
-        g = get('earningsGrowth', 0)
-        peg = get('pegRatio', 0)
-        
-        if (peg == 0 or peg is None) and g > 0 and pe > 0:
-            peg = pe / (g * 100) if g * 100 != 0 else 0
-        
-        if peg and 0 < peg < 1.5: add_points(20, f"Growth at Fair Price (PEG {peg:.2f})")
-        else: add_points(0, f"PEG: Potential Overvaluation ({peg:.2f})")
-
-        final_score = int((score / max_score) * 100) if max_score > 0 else 0
-        
-        tier = "⚠️ AVOID"
-        if final_score >= 80: tier = "💎 ELITE"
-        elif final_score >= 60: tier = "🥇 QUALITY"
-        elif final_score >= 40: tier = "🥈 OKAY"
-
-        return final_score, tier, flags, breakdown
+        # Rules live in logic/scoring.py ("titan" ruleset); screens use TitanScoring.score_frame
+        return TitanScoring.score_one(info, "titan")
 
     @staticmethod
     def calculate_reverse_dcf(price, fcf_per_share, growth_rate, discount_rate, terminal_multiple):
-        if fcf_per_share <= 0: return 0
-        future_values = []
-        current_fcf = fcf_per_share
-        for i in range(1, 11):
-            current_fcf *= (1 + growth_rate)
-            discounted = current_fcf / ((1 + discount_rate) ** i)
-            future_values.append(discounted)
-        terminal_val = (current_fcf * terminal_multiple) / ((1 + discount_rate) ** 10)
-        return sum(future_values) + terminal_val
\ No newline at end of file
+        # Closed form over scalars or arrays, see logic/dcf.py
+        return TitanDCF.value(fcf_per_share, growth_rate, discount_rate, terminal_multiple)
\ No newline at end of file
@@ -0,0 +1,97 @@
+import re
+import time
+import hashlib
+import threading
+from logic.cache_store import CACHE_DB, open_db, lazy_singleton
+
+# --- PERSISTENT HEADLINE SCORES ---
+# Polarity per (scorer, normalized title), in the same SQLite file as the ticker cache.
+# The same headline shows up in many tickers' feeds and in every refresh, so only
+# titles never seen before reach the NLP scorer, and they go in one batch.
+MAX_HEADLINES = 50000 # Least recently used rows beyond this are evicted
+EVICT_SLACK = 0.1     # Evict down to 90% so eviction runs rarely
+SQL_CHUNK = 500       # Keys per IN (...) query (SQLite variable limit)
+
+def normalize_title(title):
+    # Case and spacing don't change polarity; punctuation ("!") does, so it stays
+    return re.sub(r"\s+", " ", str(title)).strip().lower()
+
+def title_key(title):
+    return hashlib.sha1(normalize_title(title).encode('utf-8')).hexdigest()
+
+class TitanHeadlineCache:
+    def __init__(self, path=CACHE_DB, max_entries=MAX_HEADLINES):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = open_db(path, (
+            """CREATE TABLE IF NOT EXISTS headline_scores (
+            scorer TEXT NOT NULL,
+            key TEXT NOT NULL,
+            score REAL NOT NULL,
+            used REAL NOT NULL,
+            PRIMARY KEY (scorer, key))""",
+            "CREATE INDEX IF NOT EXISTS headline_used ON headline_scores (used)"))
+        self._count = self._conn.execute("SELECT COUNT(*) FROM headline_scores").fetchone()[0]
+
+    def scores(self, titles, scorer):
+        # titles -> list of polarities (same order). scorer: object with .name and
+        # .score_batch(list of titles) -> list of floats, called once with the misses only.
+        titles = list(titles)
+        if not titles: return []
+        keys = [title_key(t) for t in titles]
+        known = self._lookup(scorer.name, set(keys))
+
+        missing = {}
+        for k, t in zip(keys, titles):
+            if k not in known and k not in missing: missing[k] = t
+        if missing:
+            fresh = scorer.score_batch(list(missing.values()))
+            known.update(zip(missing, (float(s) for s in fresh)))
+            self._store(scorer.name, [(k, known[k]) for k in missing])
+        return [known[k] for k in keys]
+
+    def _lookup(self, scorer_name, keys):
+        keys = list(keys)
+        found = {}
+        now = time.time()
+        with self._lock:
+            for i in range(0, len(keys), SQL_CHUNK):
+                chunk = keys[i:i + SQL_CHUNK]
+                marks = ",".join("?" * len(chunk))
+                rows = self._conn.execute(f"SELECT key, score FROM headline_scores WHERE scorer=? AND key IN ({marks})",
+                                          [scorer_name] + chunk).fetchall()
+                found.update(rows)
+            if found:
+                # Touch for LRU eviction (one transaction, not one per row)
+                self._conn.execute("BEGIN")
+                self._conn.executemany("UPDATE headline_scores SET used=? WHERE scorer=? AND key=?",
+                                       [(now, scorer_name, k) for k in found])
+                self._conn.execute("COMMIT")
+        return found
+
+    def _store(self, scorer_name, items):
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                cur = self._conn.executemany("INSERT OR IGNORE INTO headline_scores VALUES (?, ?, ?, ?)",
+                                             [(scorer_name, k, s, now) for k, s in items])
+                self._count += max(cur.rowcount, 0)
+                if self._count > self.max_entries: self._evict()
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _evict(self):
+        # Caller holds the lock and an open transaction
+        target = int(self.max_entries * (1 - EVICT_SLACK))
+        excess = self._count - target
+        self._conn.execute("""DELETE FROM headline_scores WHERE rowid IN (
+            SELECT rowid FROM headline_scores ORDER BY used LIMIT ?)""", (excess,))
+        self._count = target
+
+    def __len__(self):
+        return self._count
+
+get_headline_cache = lazy_singleton(TitanHeadlineCache)
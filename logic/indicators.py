@@ -0,0 +1,216 @@
+from collections import deque
+import pandas as pd
+from logic.technicals import TitanTechnicals
+from logic.memory_cache import get_history
+
+CLOSE_RTOL = 1e-6 # Stored vs fetched close of the same bar: anything beyond float noise is a rewrite
+
+# Stateful versions of the indicators in TitanTechnicals.analyze.
+# Each object advances by one closed bar in O(1) and can preview a still-forming
+# bar without mutating itself, so a live tick never touches the full history.
+
+class RollingWindow:
+    # Fixed-size window with running sum and sum of squares (SMA + Bollinger variance)
+    def __init__(self, size, values=None):
+        self.size = size
+        self.values = deque(values or [], maxlen=size)
+        self._resync()
+
+    def _resync(self):
+        # Exact re-summation once per full window keeps float drift bounded (amortised O(1))
+        self.total = sum(self.values)
+        self.total_sq = sum(v * v for v in self.values)
+        self.pushes = 0
+
+    def push(self, x):
+        if len(self.values) == self.size:
+            old = self.values[0]
+            self.total -= old
+            self.total_sq -= old * old
+        self.values.append(x)
+        self.total += x
+        self.total_sq += x * x
+        self.pushes += 1
+        if self.pushes >= self.size: self._resync()
+
+    def _sums_with(self, x):
+        total, total_sq, n = self.total, self.total_sq, len(self.values)
+        if x is not None:
+            if n == self.size:
+                old = self.values[0]
+                total -= old
+                total_sq -= old * old
+            else:
+                n += 1
+            total += x
+            total_sq += x * x
+        return total, total_sq, n
+
+    def mean(self, x=None):
+        total, _, n = self._sums_with(x)
+        return total / n if n == self.size else float('nan')
+
+    def std(self, x=None):
+        # Sample standard deviation (ddof=1), same as pandas rolling().std()
+        total, total_sq, n = self._sums_with(x)
+        if n != self.size or n < 2: return float('nan')
+        var = (total_sq - total * total / n) / (n - 1)
+        return max(var, 0.0) ** 0.5
+
+    def to_dict(self):
+        return {"size": self.size, "values": list(self.values)}
+
+    @staticmethod
+    def from_dict(d):
+        return RollingWindow(d['size'], d['values'])
+
+class EMA:
+    # Same recursion as pandas ewm(span=N, adjust=False): seeded with the first value
+    def __init__(self, span, value=None):
+        self.span = span
+        self.alpha = 2 / (span + 1)
+        self.value = value
+
+    def peek(self, x):
+        if self.value is None: return x
+        return (1 - self.alpha) * self.value + self.alpha * x
+
+    def push(self, x):
+        self.value = self.peek(x)
+
+    def to_dict(self):
+        return {"span": self.span, "value": self.value}
+
+    @staticmethod
+    def from_dict(d):
+        return EMA(d['span'], d['value'])
+
+class TitanIndicatorState:
+    # Everything TitanTechnicals.analyze needs, kept up to date bar by bar.
+    # JSON-serialisable via to_dict() so it can live next to the ticker cache.
+    MIN_BARS = 200
+
+    def __init__(self):
+        self.ema12 = EMA(12)
+        self.ema26 = EMA(26)
+        self.signal = EMA(9)
+        self.gains = RollingWindow(14)
+        self.losses = RollingWindow(14)
+        self.sma20 = RollingWindow(20)
+        self.sma50 = RollingWindow(50)
+        self.sma200 = RollingWindow(200)
+        self.last_close = None
+        self.last_time = None
+        self.bars = 0
+
+    # --- Updates ---
+    def push(self, close, when=None):
+        close = float(close)
+        if self.last_close is not None:
+            delta = close - self.last_close
+            self.gains.push(delta if delta > 0 else 0.0)
+            self.losses.push(-delta if delta < 0 else 0.0)
+        self.ema12.push(close)
+        self.ema26.push(close)
+        self.signal.push(self.ema12.value - self.ema26.value)
+        self.sma20.push(close)
+        self.sma50.push(close)
+        self.sma200.push(close)
+        self.last_close = close
+        if when is not None: self.last_time = pd.Timestamp(when).isoformat()
+        self.bars += 1
+
+    def snapshot(self, live_close=None):
+        # Same dict as TitanTechnicals.analyze. live_close is an optional still-forming
+        # bar applied on top of the committed state without changing it.
+        bars = self.bars + (live_close is not None)
+        if bars < self.MIN_BARS: return None
+        x = float(live_close) if live_close is not None else None
+
+        price = x if x is not None else self.last_close
+        if x is not None:
+            delta = x - self.last_close
+            gain = self.gains.mean(delta if delta > 0 else 0.0)
+            loss = self.losses.mean(-delta if delta < 0 else 0.0)
+            ema12, ema26 = self.ema12.peek(x), self.ema26.peek(x)
+            macd = ema12 - ema26
+            sig = self.signal.peek(macd)
+        else:
+            gain, loss = self.gains.mean(), self.losses.mean()
+            macd = self.ema12.value - self.ema26.value
+            sig = self.signal.value
+
+        if loss == 0: rsi = 100.0 if gain > 0 else float('nan')
+        else: rsi = 100 - (100 / (1 + gain / loss))
+
+        sma20, std20 = self.sma20.mean(x), self.sma20.std(x)
+        sma50, sma200 = self.sma50.mean(x), self.sma200.mean(x)
+        upper_bb = sma20 + std20 * 2
+        lower_bb = sma20 - std20 * 2
+
+        signals, status = TitanTechnicals.build_signals(price, rsi, sma50, sma200, upper_bb, lower_bb, macd, sig)
+        return {
+            "price": price,
+            "rsi": rsi,
+            "sma50": sma50,
+            "sma200": sma200,
+            "upper_bb": upper_bb,
+            "lower_bb": lower_bb,
+            "macd": macd,
+            "macd_signal": sig,
+            "signals": signals,
+            "status": status
+        }
+
+    def continues(self, close):
+        # A cached state can only be extended by `close` if the history reaches back to the
+        # last committed bar and that bar is unchanged. A split / dividend adjustment
+        # rewrites every past close, and new bars must not land on the stale averages.
+        if not self.last_time: return False
+        last = pd.Timestamp(self.last_time)
+        if close.index[0] > last or last not in close.index: return False
+        return abs(float(close.loc[last]) - self.last_close) <= CLOSE_RTOL * abs(self.last_close)
+
+    # --- Persistence ---
+    def to_dict(self):
+        return {
+            "ema12": self.ema12.to_dict(), "ema26": self.ema26.to_dict(), "signal": self.signal.to_dict(),
+            "gains": self.gains.to_dict(), "losses": self.losses.to_dict(),
+            "sma20": self.sma20.to_dict(), "sma50": self.sma50.to_dict(), "sma200": self.sma200.to_dict(),
+            "last_close": self.last_close, "last_time": self.last_time, "bars": self.bars
+        }
+
+    @staticmethod
+    def from_dict(d):
+        state = TitanIndicatorState()
+        for key in ("ema12", "ema26", "signal"): setattr(state, key, EMA.from_dict(d[key]))
+        for key in ("gains", "losses", "sma20", "sma50", "sma200"): setattr(state, key, RollingWindow.from_dict(d[key]))
+        state.last_close, state.last_time, state.bars = d['last_close'], d['last_time'], d['bars']
+        return state
+
+    @staticmethod
+    def from_series(close):
+        state = TitanIndicatorState()
+        for when, value in close.items(): state.push(value, when)
+        return state
+
+    # --- Fetch helpers ---
+    @staticmethod
+    def refresh(ticker, state_dict=None):
+        # Returns (tech, state_dict). The last bar of a fetch is always treated as
+        # still forming: it is previewed, never committed. With a cached state just the
+        # newly closed bars are pushed. Both paths share the chart's (ticker, 1y, 1d) history.
+        # (None, None) means too little history; fetch errors propagate.
+        close = get_history(ticker, period="1y")['Close'].dropna()
+        if close.empty: raise Exception(f"No price history for {ticker}")
+        if state_dict:
+            state = TitanIndicatorState.from_dict(state_dict)
+            if state.continues(close):
+                closed = close.iloc[:-1]
+                last = pd.Timestamp(state.last_time)
+                for when, value in closed[closed.index > last].items(): state.push(value, when)
+                return state.snapshot(close.iloc[-1]), state.to_dict()
+
+        if len(close) < TitanIndicatorState.MIN_BARS: return None, None
+        state = TitanIndicatorState.from_series(close.iloc[:-1])
+        return state.snapshot(close.iloc[-1]), state.to_dict()
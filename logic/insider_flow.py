@@ -0,0 +1,101 @@
+import hashlib
+import threading
+from datetime import date, timedelta
+import pandas as pd
+from logic.cache_store import CACHE_DB, open_db, lazy_singleton
+
+# --- INSIDER FLOW SERIES ---
+# Every insider transaction ever seen, deduplicated, plus a per-ticker daily net $ flow
+# that is updated in place as new transactions arrive (nothing is recomputed). The
+# rolling windows and the watchlist aggregate are single SUM queries over the daily rows.
+WINDOWS = (30, 90, 365)  # Days
+SIGNAL_WINDOW = 90       # Window behind the Accumulation / Distribution signal
+SQL_CHUNK = 500
+
+def transaction_keys(tx):
+    # Stable id per transaction: its fields plus an occurrence number, so two identical
+    # filings on the same day stay two transactions
+    fields = tx['date'].astype(str) + "|" + tx['insider'].astype(str) + "|" + tx['shares'].astype(str) + "|" + \
+             tx['value'].astype(str) + "|" + tx['type'].astype(str)
+    occurrence = fields.groupby(fields).cumcount().astype(str)
+    return [hashlib.sha1(f.encode('utf-8')).hexdigest() for f in fields + "#" + occurrence]
+
+class TitanInsiderFlow:
+    def __init__(self, path=CACHE_DB):
+        self._lock = threading.Lock()
+        self._conn = open_db(path, (
+            """CREATE TABLE IF NOT EXISTS insider_tx (
+            ticker TEXT NOT NULL,
+            key TEXT NOT NULL,
+            day TEXT NOT NULL,
+            signed_value REAL NOT NULL,
+            PRIMARY KEY (ticker, key))""",
+            """CREATE TABLE IF NOT EXISTS insider_daily (
+            ticker TEXT NOT NULL,
+            day TEXT NOT NULL,
+            net REAL NOT NULL,
+            PRIMARY KEY (ticker, day))"""))
+
+    # --- Writes ---
+    def merge(self, ticker, tx):
+        # tx: TitanInstitutional.classify() frame. Only transactions not seen before are
+        # added to the daily series. Returns the number of new transactions.
+        tx = tx[tx['date'] != ""] if len(tx) else tx
+        if not len(tx): return 0
+        keys = transaction_keys(tx)
+        with self._lock:
+            # IMMEDIATE: the key check and the insert see the same data, even across processes
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                known = set()
+                for i in range(0, len(keys), SQL_CHUNK):
+                    chunk = keys[i:i + SQL_CHUNK]
+                    marks = ",".join("?" * len(chunk))
+                    known.update(r[0] for r in self._conn.execute(
+                        f"SELECT key FROM insider_tx WHERE ticker=? AND key IN ({marks})", [ticker] + chunk))
+                new = [k not in known for k in keys]
+                fresh = tx[new]
+                self._conn.executemany("INSERT INTO insider_tx VALUES (?, ?, ?, ?)",
+                                       [(ticker, k, d, float(v)) for k, d, v in
+                                        zip([k for k, n in zip(keys, new) if n], fresh['date'], fresh['signed_value'])])
+                daily = fresh.groupby('date')['signed_value'].sum()
+                self._conn.executemany("""INSERT INTO insider_daily VALUES (?, ?, ?)
+                    ON CONFLICT (ticker, day) DO UPDATE SET net = net + excluded.net""",
+                                       [(ticker, d, float(v)) for d, v in daily.items()])
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return len(fresh)
+
+    # --- Reads ---
+    def series(self, ticker):
+        # Daily net $ flow (only days with transactions)
+        with self._lock:
+            rows = self._conn.execute("SELECT day, net FROM insider_daily WHERE ticker=? ORDER BY day", (ticker,)).fetchall()
+        if not rows: return pd.Series(dtype=float)
+        return pd.Series([r[1] for r in rows], index=pd.to_datetime([r[0] for r in rows]), name=ticker)
+
+    def windows(self, ticker, asof=None):
+        # {days: net $ flow over the trailing window}
+        return self.aggregate([ticker], asof).get(ticker, {w: 0.0 for w in WINDOWS})
+
+    def aggregate(self, tickers, asof=None):
+        # {ticker: {days: net}} for many tickers in one query; "*" holds the sum across them
+        asof = asof or date.today()
+        tickers = list(tickers)
+        cutoffs = [(asof - timedelta(days=w)).isoformat() for w in WINDOWS]
+        sums = ", ".join("SUM(CASE WHEN day > ? THEN net ELSE 0 END)" for _ in WINDOWS)
+        out = {}
+        with self._lock:
+            for i in range(0, len(tickers), SQL_CHUNK):
+                chunk = tickers[i:i + SQL_CHUNK]
+                marks = ",".join("?" * len(chunk))
+                rows = self._conn.execute(f"""SELECT ticker, {sums} FROM insider_daily
+                    WHERE ticker IN ({marks}) AND day <= ? GROUP BY ticker""",
+                                          cutoffs + chunk + [asof.isoformat()]).fetchall()
+                for r in rows: out[r[0]] = dict(zip(WINDOWS, (float(v or 0) for v in r[1:])))
+        out["*"] = {w: sum(v[w] for v in out.values()) for w in WINDOWS}
+        return out
+
+get_insider_flow = lazy_singleton(TitanInsiderFlow)
@@ -1,68 +1,119 @@
-import yfinance as yf
+import numpy as np
 import pandas as pd
 import traceback
+from logic.data_provider import get_provider
+from logic.insider_flow import get_insider_flow, SIGNAL_WINDOW
+
+# --- INSIDER TRANSACTION CLASSIFICATION ---
+# Column operations over the whole history; nothing is formatted here. The cached
+# payload keeps the transactions as columns of raw values and the UI formats only
+# the rows it shows (format_rows).
+BUY_PATTERN = r"buy|purchase|grant|award"
+ROLE_HINTS = [("officer", "Officer"), ("director", "Director"), ("10% owner", "Major Shareholder")]
+NO_ROLE = ["unknown", "n/a", "na", "nan", "none", "null", "-", ""] # Placeholders, compared lower-case
+SIGNAL_THRESHOLD = 500000  # Net $ flow over SIGNAL_WINDOW days for Accumulation / Distribution
+TX_COLUMNS = ["date", "insider", "role", "shares", "value", "price", "type"]
 
 class TitanInstitutional:
     @staticmethod
-    def analyze(ticker):
-        trans_list = []
-        net_buy = 0
-        
-        try:
-            stock = yf.Ticker(ticker)
-            insiders = stock.insider_transactions
-            
-            if insiders is None or insiders.empty:
-                return {"signal": "No Data", "net_flow": 0, "transactions": [], "has_roles": False}
+    def classify(insiders):
+        # yfinance insider_transactions frame -> one row per transaction (newest first):
+        # date, insider, role, shares, value, price (NaN if unknown), type, signed_value
+        if insiders is None or insiders.empty: return pd.DataFrame(columns=TX_COLUMNS + ["signed_value"])
+
+        def col(name, default):
+            return insiders[name] if name in insiders.columns else pd.Series(default, index=insiders.index)
+
+        text = col('Text', '').fillna('').astype(str).str.lower()
+        shares = pd.to_numeric(col('Shares', 0), errors='coerce').fillna(0).to_numpy(dtype=np.float64)
+        value = pd.to_numeric(col('Value', 0), errors='coerce').fillna(0).to_numpy(dtype=np.float64)
 
-            has_roles_data = False
-            for idx, row in insiders.head(25).iterrows():
-                date_val = row.get('Start Date')
-                date_str = date_val.strftime('%Y-%m-%d') if hasattr(date_val, 'strftime') else str(date_val)[:10]
-                
-                shares = row.get('Shares', 0)
-                val = row.get('Value', 0)
-                text = str(row.get('Text', '')).lower()
-                
-                # Attempt to get a more specific role
-                role = str(row.get('Relation', row.get('Position', 'Unknown'))).replace('_', ' ').title()
-                if role == "Unknown" and "officer" in text:
-                    role = "Officer"
-                elif role == "Unknown" and "director" in text:
-                    role = "Director"
-                elif role == "Unknown" and "10% owner" in text:
-                    role = "Major Shareholder"
-                
-                if role not in ["Unknown", "N/A", "-"]:
-                    has_roles_data = True
-                else:
-                    role = "-" # Ensure consistency if no specific role is found
+        role = col('Relation', None)
+        if role.isna().all(): role = col('Position', None)
+        role = role.fillna('Unknown').astype(str).str.replace('_', ' ').str.strip().str.title()
+        # Placeholders ("N/A", "--", ...) are no role: the text hints may fill them in
+        unknown = role.str.lower().isin(NO_ROLE) | ~role.str.contains('[a-z]', case=False)
+        for hint, name in ROLE_HINTS:
+            hit = unknown & text.str.contains(hint, regex=False)
+            role = role.mask(hit, name)
+            unknown &= ~hit
+        role = role.mask(unknown, "-")
 
-                if pd.isna(val): val = 0
-                if pd.isna(shares): shares = 0
+        buy = text.str.contains(BUY_PATTERN).to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            price = np.where((shares > 0) & (value > 0), value / shares, np.nan)
 
-                t_type = "Sell"
-                if "buy" in text or "purchase" in text or "grant" in text or "award" in text:
-                    t_type = "Buy"
-                    net_buy += val
-                else:
-                    net_buy -= val
+        dates = pd.to_datetime(col('Start Date', None), errors='coerce')
+        return pd.DataFrame({
+            "date": dates.dt.strftime('%Y-%m-%d').fillna('').to_numpy(),
+            "insider": col('Insider', 'Unknown').fillna('Unknown').astype(str).to_numpy(),
+            "role": role.to_numpy(),
+            "shares": shares,
+            "value": value,
+            "price": price,
+            "type": np.where(buy, "Buy", "Sell"),
+            "signed_value": np.where(buy, value, -value)
+        })
 
-                trans_list.append({
-                    "date": date_str,
-                    "insider": str(row.get('Insider', 'Unknown')),
-                    "role": role,
-                    "shares": f"{int(shares):,}",
-                    "value": f"${int(val):,}" if val > 0 else "-",
-                    "price": f"${(val/shares):.2f}" if shares > 0 and val > 0 else "-",
-                    "type": t_type
-                })
+    @staticmethod
+    def classify_many(frames):
+        # {ticker: insider frame} -> one classified frame with a ticker column
+        parts = [TitanInstitutional.classify(df).assign(ticker=t) for t, df in frames.items() if df is not None and not df.empty]
+        if not parts: return pd.DataFrame(columns=["ticker"] + TX_COLUMNS + ["signed_value"])
+        return pd.concat(parts, ignore_index=True)
 
-            signal = "Neutral"
-            if net_buy > 500000: signal = "🐳 Accumulation"
-            elif net_buy < -500000: signal = "📉 Distribution"
+    @staticmethod
+    def signal(net_flow):
+        if net_flow > SIGNAL_THRESHOLD: return "🐳 Accumulation"
+        if net_flow < -SIGNAL_THRESHOLD: return "📉 Distribution"
+        return "Neutral"
 
-            return {"signal": signal, "net_flow": net_buy, "transactions": trans_list, "has_roles": has_roles_data}
-        except Exception as e:
-            # print(f"Error fetching institutional data for {ticker}: {e}") # For debugging
-            return {"signal": "Error", "net_flow": 0, "transactions": [], "has_roles": False}
\ No newline at end of file
+    @staticmethod
+    def analyze(ticker):
+        # Fetch errors propagate (the pipeline keeps the cached section instead)
+        insiders = get_provider().insider_transactions(ticker)
+
+        if insiders is None or insiders.empty:
+            return {"signal": "No Data", "net_flow": 0, "transactions": []}
+
+        tx = TitanInstitutional.classify(insiders)
+        # New transactions are merged into the persisted daily series; the signal is
+        # the trailing-window net flow, so it means the same thing for every ticker
+        flow = get_insider_flow()
+        flow.merge(ticker, tx)
+        windows = flow.windows(ticker)
+        net_buy = windows[SIGNAL_WINDOW]
+
+        # Columnar and unformatted: {column: [values]}; NaN prices become None for JSON
+        columns = {c: tx[c].tolist() for c in TX_COLUMNS}
+        columns['price'] = [None if np.isnan(p) else p for p in columns['price']]
+        return {"signal": TitanInstitutional.signal(net_buy), "net_flow": net_buy, "flows": {str(w): v for w, v in windows.items()},
+                "transactions": columns}
+
+    @staticmethod
+    def has_roles(rows):
+        # Role column only when a row that is actually shown has a real role
+        roles = (str(r.get('role', '-')).strip().lower() for r in rows)
+        return any(role not in NO_ROLE and any(ch.isalpha() for ch in role) for role in roles)
+
+    @staticmethod
+    def format_rows(transactions, limit=None):
+        # Render-time formatting of the first `limit` transactions -> list of display dicts.
+        # Accepts the columnar payload or the pre-formatted list cached by older versions.
+        if isinstance(transactions, list): return transactions[:limit]
+        rows = []
+        count = len(transactions.get('date', []))
+        for i in range(count if limit is None else min(limit, count)):
+            shares = transactions['shares'][i] or 0
+            val = transactions['value'][i] or 0
+            price = transactions['price'][i]
+            rows.append({
+                "date": transactions['date'][i],
+                "insider": transactions['insider'][i],
+                "role": transactions['role'][i],
+                "shares": f"{int(shares):,}",
+                "value": f"${int(val):,}" if val > 0 else "-",
+                "price": f"${price:.2f}" if price is not None and price > 0 else "-",
+                "type": transactions['type'][i]
+            })
+        return rows
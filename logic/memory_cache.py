@@ -0,0 +1,99 @@
+import sys
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from logic.price_store import get_price_store, REFRESH_AFTER
+from logic.data_provider import get_provider
+from logic.cache_store import SECTION_TTLS
+
+# --- PROCESS-WIDE IN-MEMORY CACHE ---
+# LRU bounded by approximate bytes (and optionally an entry count), with a per-entry
+# max age. Concurrent requests for the same key are coalesced: the first caller loads,
+# everyone else waits on the same result.
+MB = 1024 * 1024
+
+def approx_size(value):
+    # Bytes held by a cached value: frame buffers (object columns counted shallow), or
+    # a dict with its keys and top-level values. An estimate for the budget, not exact.
+    if hasattr(value, 'memory_usage'): return int(value.memory_usage(index=True).sum())
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items())
+    return sys.getsizeof(value)
+
+class TitanMemoryCache:
+    def __init__(self, max_bytes=64 * MB, max_entries=None, max_age=300):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.nbytes = 0
+        self._entries = OrderedDict() # key -> (stored_at, value, size)
+        self._inflight = {}           # key -> Future
+        self._lock = threading.Lock()
+
+    def get(self, key, loader, max_age=None):
+        max_age = self.max_age if max_age is None else max_age
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit and time.time() - hit[0] < max_age:
+                self._entries.move_to_end(key)
+                return hit[1]
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not owner: return future.result()
+
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._lock: self._inflight.pop(key, None)
+            future.set_exception(e)
+            raise
+        size = approx_size(value)
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = (time.time(), value, size)
+            self.nbytes += size
+            # Oldest first; the entry just loaded always stays, even if it alone is over budget
+            while len(self._entries) > 1 and (self.nbytes > self.max_bytes or
+                                              (self.max_entries and len(self._entries) > self.max_entries)):
+                self._drop(next(iter(self._entries)))
+            self._inflight.pop(key, None)
+        future.set_result(value)
+        return value
+
+    def invalidate(self, key=None):
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self.nbytes = 0
+            else: self._drop(key)
+
+    def _drop(self, key):
+        hit = self._entries.pop(key, None)
+        if hit: self.nbytes -= hit[2]
+
+# History frames keyed by (ticker, period, interval), shared by technicals and the chart
+history_cache = TitanMemoryCache(max_bytes=64 * MB)
+
+def get_history(ticker, period="1y", interval="1d"):
+    ticker = ticker.upper()
+    return history_cache.get((ticker, period, interval),
+                             lambda: get_price_store().history(ticker, period=period, interval=interval),
+                             max_age=REFRESH_AFTER.get(interval, 300))
+
+# Info payloads keyed by ticker, shared by the analysis view and the comparison tab.
+# Same freshness as the "info" cache section; the dicts are shared, callers must not mutate them.
+info_cache = TitanMemoryCache(max_bytes=16 * MB, max_age=SECTION_TTLS["info"])
+
+def _load_info(ticker):
+    info = get_provider().info(ticker)
+    if not info: raise Exception(f"No data found for {ticker}") # Failures are not cached
+    return info
+
+def get_info(ticker):
+    ticker = ticker.upper()
+    return info_cache.get(ticker, lambda: _load_info(ticker))
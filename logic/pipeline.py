@@ -0,0 +1,127 @@
+import concurrent.futures
+from logic.scoring import TitanScoring
+from logic.indicators import TitanIndicatorState
+from logic.sentiment import TitanSentiment
+from logic.institutional import TitanInstitutional
+from logic.data_provider import get_provider
+from logic.cache_store import SECTIONS
+from logic.snapshots import get_snapshot_store
+
+# --- PER-TICKER ANALYSIS PIPELINE ---
+# One fetcher per cache section, so a stale section can be refreshed on its own.
+# Every fetcher returns the top-level keys of a cache entry for its section.
+
+class TitanPipeline:
+    @staticmethod
+    def fetch_info(ticker):
+        info = get_provider().info(ticker)
+        # Robust check for data existence
+        if not info or ('regularMarketPrice' not in info and 'currentPrice' not in info):
+            raise Exception(f"No data found for {ticker}")
+        TitanPipeline.record_snapshot(ticker, info)
+        return TitanPipeline.build_info(ticker, info)
+
+    @staticmethod
+    def record_snapshot(ticker, info):
+        # Point-in-time history (changed fields only); never fails the fetch
+        try: get_snapshot_store().record(ticker, info)
+        except Exception as e: print(f"Snapshot Error ({ticker}): {e}")
+
+    @staticmethod
+    def build_info(ticker, info):
+        # Score now, explain later: only the band indices are stored, the breakdown
+        # text is rendered from them when the tooltip is actually shown
+        row = TitanScoring.score_frame([info], "titan").iloc[0]
+
+        # Price & Change Calculation
+        current = info.get('currentPrice', info.get('regularMarketPrice', 0))
+        prev_close = info.get('previousClose', current)
+
+        # Safety defaults
+        if current is None: current = 0
+        if prev_close is None: prev_close = current
+
+        change = current - prev_close
+        pct_change = (change / prev_close) * 100 if prev_close != 0 else 0
+
+        # Day Range
+        day_low = info.get('dayLow', current)
+        day_high = info.get('dayHigh', current)
+
+        # PEG Fix
+        peg = info.get('pegRatio')
+        if (not peg or peg == 0):
+            pe = info.get('trailingPE', 0)
+            g = info.get('earningsGrowth', 0)
+            peg = pe / (g*100) if (g and g!=0) else 0
+
+        return {
+            "ticker": ticker,
+            "name": info.get('shortName', 'Unknown'),
+            "price": current,
+            "change": change,
+            "pct_change": pct_change,
+            "day_low": day_low,
+            "day_high": day_high,
+            "score": int(row["score"]),
+            "tier": row["tier"],
+            "score_detail": TitanScoring.detail(row, "titan"),
+            "metrics": {
+                "P/E Ratio": info.get('trailingPE', 0),
+                "Forward P/E": info.get('forwardPE', 0),
+                "PEG Ratio": peg,
+                "Price/Book": info.get('priceToBook', 0),
+                "Beta": info.get('beta', 0),
+                "ROE %": info.get('returnOnEquity', 0),
+                "Profit Margin": info.get('profitMargins', 0),
+                "Debt/Equity": info.get('debtToEquity', 0),
+                "Current Ratio": info.get('currentRatio', 0),
+                "Free Cash Flow": info.get('freeCashflow', 0),
+                "Dividend Yield": info.get('dividendYield', 0)
+            },
+            "website": info.get('website', ''),
+            "fcf_per_share": TitanPipeline.fcf_per_share(info)
+        }
+
+    @staticmethod
+    def fcf_per_share(info):
+        # Input of the reverse DCF (implied growth); 0 when unknown
+        fcf, shares = info.get('freeCashflow'), info.get('sharesOutstanding')
+        return fcf / shares if fcf and shares else 0
+
+    @staticmethod
+    def fetch_technicals(ticker, tech_state=None):
+        # A cached indicator state lets technicals advance by the new bars only
+        tech, tech_state = TitanIndicatorState.refresh(ticker, tech_state)
+        return {"tech": tech, "tech_state": tech_state}
+
+    @staticmethod
+    def fetch_sentiment(ticker):
+        return {"sentiment": TitanSentiment.analyze(ticker)}
+
+    @staticmethod
+    def fetch_institutional(ticker):
+        return {"institutional": TitanInstitutional.analyze(ticker)}
+
+    @staticmethod
+    def fetch(ticker, sections=SECTIONS, tech_state=None):
+        # Parallel fetch of the requested sections -> partial cache entry.
+        # Errors in "info" propagate (no data for the ticker). A failed other section is
+        # left out of the entry, so cache.put() keeps its stale copy instead of the failure.
+        jobs = {
+            "info": (TitanPipeline.fetch_info, ticker),
+            "technicals": (TitanPipeline.fetch_technicals, ticker, tech_state),
+            "sentiment": (TitanPipeline.fetch_sentiment, ticker),
+            "institutional": (TitanPipeline.fetch_institutional, ticker)
+        }
+        data = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = {s: executor.submit(*jobs[s]) for s in sections if s in jobs}
+            for section in sections:
+                if section not in futures: continue
+                if section == "info":
+                    data.update(futures[section].result())
+                    continue
+                try: data.update(futures[section].result())
+                except Exception as e: print(f"Fetch Error ({ticker}, {section}): {e}")
+        return data
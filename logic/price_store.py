@@ -0,0 +1,185 @@
+import os
+import json
+import glob
+import time
+import threading
+import numpy as np
+import pandas as pd
+from logic.data_provider import get_provider
+
+# --- ON-DISK OHLCV STORE ---
+# titan_prices/<interval>/<TICKER>/meta.json + bars_<stamp>.npy
+# bars file: float64 matrix, one row per bar: [epoch seconds, Open, High, Low, Close, Volume]
+# Readers memory-map the current bars file; writers always create a new file and then
+# swap meta.json, so an open map is never rewritten underneath a reader (Windows-safe).
+STORE_DIR = "titan_prices"
+COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+PERIOD_DAYS = {"1d": 1, "5d": 5, "1mo": 31, "3mo": 92, "6mo": 183, "1y": 366, "2y": 731, "5y": 1827, "10y": 3653, "max": None}
+SESSION_PERIODS = {"1d": 1, "5d": 5} # Counted in trading sessions, like Yahoo does
+
+# Don't ask the network again if the store was synced this recently (seconds)
+REFRESH_AFTER = {"15m": 60, "1h": 300, "1d": 300, "1wk": 3600, "1mo": 3600}
+
+# Relative tolerance when re-checking an already stored bar for split/dividend rewrites
+ADJUST_TOLERANCE = 1e-4
+
+def period_rank(period):
+    days = PERIOD_DAYS.get(period)
+    return float('inf') if days is None else days
+
+class TitanPriceStore:
+    def __init__(self, root=STORE_DIR, provider=None):
+        self.root = root
+        self.provider = provider
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+
+    # --- Public API ---
+    def history(self, ticker, period="1y", interval="1d"):
+        # Same shape as provider.history(), but the frame is a zero-copy view over the
+        # memory-mapped bars file. Only bars missing on disk are downloaded.
+        self.sync(ticker, period, interval)
+        return self.read(ticker, period, interval)
+
+    def read(self, ticker, period="max", interval="1d"):
+        meta, bars = self._load(ticker, interval)
+        if bars is None: return pd.DataFrame(columns=COLUMNS)
+        start = self._start_row(bars[:, 0], period, meta['tz'])
+        view = bars[start:]
+        index = pd.to_datetime(view[:, 0], unit='s', utc=True).tz_convert(meta['tz'])
+        return pd.DataFrame(view[:, 1:], index=index, columns=COLUMNS, copy=False)
+
+    def last_bar(self, ticker, interval="1d"):
+        meta, bars = self._load(ticker, interval)
+        if bars is None or not len(bars): return None
+        return pd.Timestamp(bars[-1, 0], unit='s', tz='UTC').tz_convert(meta['tz'])
+
+    def sync(self, ticker, period="1y", interval="1d"):
+        ticker = ticker.upper()
+        with self._lock(ticker, interval):
+            meta, bars = self._load(ticker, interval)
+            provider = self.provider or get_provider()
+
+            # Nothing stored yet, or a longer period than we ever downloaded: full fetch
+            if bars is None or period_rank(period) > period_rank(meta['period']):
+                df = provider.history(ticker, period=period, interval=interval)
+                if df is not None and not df.empty:
+                    self._write(ticker, interval, df, period, merge_with=bars)
+                return
+
+            if time.time() - meta.get('fetched_at', 0) < REFRESH_AFTER.get(interval, 300): return
+
+            # Delta: re-request from the second-to-last stored bar. That bar is closed, so it
+            # must come back unchanged unless Yahoo re-adjusted history (split/dividend).
+            anchor = bars[-2, 0] if len(bars) > 1 else bars[-1, 0]
+            start = pd.Timestamp(anchor, unit='s', tz='UTC').tz_convert(meta['tz']).date()
+            try:
+                df = provider.history(ticker, interval=interval, start=start)
+            except Exception as e:
+                print(f"Price Store Error ({ticker}): {e}")
+                return
+            if df is None or df.empty:
+                self._touch(ticker, interval, meta)
+                return
+
+            if self._needs_rewrite(df, bars):
+                print(f"Price Store: history of {ticker} was re-adjusted, rewriting {interval} bars")
+                df = provider.history(ticker, period=meta['period'], interval=interval)
+                if df is not None and not df.empty: self._write(ticker, interval, df, meta['period'])
+                return
+
+            self._write(ticker, interval, df, meta['period'], merge_with=bars)
+
+    # --- Internals ---
+    def _dir(self, ticker, interval):
+        return os.path.join(self.root, interval, ticker.upper())
+
+    def _lock(self, ticker, interval):
+        with self._locks_guard:
+            return self._locks.setdefault((ticker, interval), threading.Lock())
+
+    def _load(self, ticker, interval):
+        meta_path = os.path.join(self._dir(ticker, interval), "meta.json")
+        if not os.path.exists(meta_path): return None, None
+        try:
+            with open(meta_path, 'r') as f: meta = json.load(f)
+            bars = np.load(os.path.join(self._dir(ticker, interval), meta['file']), mmap_mode='r')
+            return meta, bars
+        except Exception as e:
+            print(f"Price Store Error ({ticker}): {e}")
+            return None, None
+
+    def _start_row(self, stamps, period, tz):
+        if period in SESSION_PERIODS:
+            # Last N trading sessions in the exchange's own calendar
+            days = pd.to_datetime(stamps, unit='s', utc=True).tz_convert(tz).normalize()
+            sessions = days.unique()
+            if len(sessions) <= SESSION_PERIODS[period]: return 0
+            return int(days.searchsorted(sessions[-SESSION_PERIODS[period]]))
+        days = PERIOD_DAYS.get(period)
+        if days is None: return 0
+        cutoff = time.time() - days * 86400
+        return int(np.searchsorted(stamps, cutoff))
+
+    @staticmethod
+    def _to_rows(df):
+        index = df.index if df.index.tz is not None else df.index.tz_localize('UTC')
+        stamps = (index.tz_convert('UTC') - pd.Timestamp(0, tz='UTC')).total_seconds()
+        rows = np.empty((len(df), len(COLUMNS) + 1), dtype=np.float64)
+        rows[:, 0] = stamps
+        rows[:, 1:] = df.reindex(columns=COLUMNS).to_numpy(dtype=np.float64)
+        return rows
+
+    def _needs_rewrite(self, df, bars):
+        # Split or dividend reported inside the new window
+        for col in ("Dividends", "Stock Splits"):
+            if col in df.columns and (df[col].fillna(0) != 0).any(): return True
+        # Or an already stored closed bar came back with a different close
+        new = self._to_rows(df)
+        stored = bars[:-1] if len(bars) > 1 else bars[:0]
+        common, i_new, i_old = np.intersect1d(new[:, 0], stored[:, 0], return_indices=True)
+        if not len(common): return False
+        return not np.allclose(new[i_new, 4], stored[i_old, 4], rtol=ADJUST_TOLERANCE, equal_nan=True)
+
+    def _write(self, ticker, interval, df, period, merge_with=None):
+        rows = self._to_rows(df.sort_index())
+        if merge_with is not None and len(merge_with) and len(rows):
+            # Keep older stored bars, newly fetched bars win from their first timestamp on
+            older = np.asarray(merge_with[merge_with[:, 0] < rows[0, 0]])
+            rows = np.vstack([older, rows])
+        tz = str(df.index.tz) if df.index.tz is not None else 'UTC'
+
+        folder = self._dir(ticker, interval)
+        os.makedirs(folder, exist_ok=True)
+        name = f"bars_{time.time_ns()}.npy"
+        np.save(os.path.join(folder, name), rows)
+        meta = {"file": name, "tz": tz, "period": period, "fetched_at": time.time(), "rows": len(rows)}
+        self._write_meta(folder, meta)
+
+        # Old bars files may still be mapped by a reader; remove what we can
+        for old in glob.glob(os.path.join(folder, "bars_*.npy")):
+            if os.path.basename(old) == name: continue
+            try: os.remove(old)
+            except OSError: pass
+
+    def _touch(self, ticker, interval, meta):
+        meta = dict(meta, fetched_at=time.time())
+        self._write_meta(self._dir(ticker, interval), meta)
+
+    @staticmethod
+    def _write_meta(folder, meta):
+        tmp = os.path.join(folder, f"meta.{threading.get_ident()}.tmp")
+        with open(tmp, 'w') as f: json.dump(meta, f)
+        os.replace(tmp, os.path.join(folder, "meta.json"))
+
+# --- PROCESS-WIDE STORE ---
+_store = None
+_store_lock = threading.Lock()
+
+def get_price_store():
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None: _store = TitanPriceStore()
+    return _store
@@ -0,0 +1,79 @@
+import time
+import random
+import threading
+import concurrent.futures
+
+# --- OUTBOUND CALL BUDGET ---
+# Every live network call takes a token from one shared bucket, so the refresh,
+# the search bar and background revalidation together stay under Yahoo's limits.
+RATE_PER_SEC = 4.0   # Sustained calls per second
+BURST = 8            # Calls allowed back-to-back after an idle period
+MAX_WORKERS = 8      # Concurrency cap for watchlist-sized jobs
+MAX_RETRIES = 4      # Retries on throttling before giving up
+BACKOFF_BASE = 1.0   # Seconds; doubles per retry, with jitter
+
+class TitanRateLimiter:
+    # Token bucket, thread-safe
+    def __init__(self, rate=RATE_PER_SEC, burst=BURST):
+        self._lock = threading.Lock()
+        self.configure(rate, burst)
+
+    def configure(self, rate, burst=None):
+        with self._lock:
+            self.rate = float(rate)
+            self.burst = float(burst if burst is not None else max(1, rate))
+            self.tokens = self.burst
+            self.stamp = time.monotonic()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.stamp) * self.rate)
+                self.stamp = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+rate_limiter = TitanRateLimiter()
+
+def is_throttled(exc):
+    # yfinance raises YFRateLimitError; HTTP layers surface 429 / "Too Many Requests"
+    text = f"{type(exc).__name__} {exc}".lower()
+    return "ratelimit" in text or "rate limit" in text or "too many requests" in text or "429" in text
+
+def call_limited(fn, *args, retries=MAX_RETRIES, limiter=None, **kwargs):
+    # Rate-limited call with exponential backoff when the server throttles us.
+    # limiter: the host's own token bucket (default: the shared Yahoo API budget)
+    for attempt in range(retries + 1):
+        (limiter or rate_limiter).acquire()
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            if not is_throttled(e) or attempt == retries: raise
+            delay = BACKOFF_BASE * (2 ** attempt) * (1 + random.random() * 0.25)
+            print(f"Throttled ({e}), retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+class TitanScheduler:
+    # Bounded worker pool that streams each finished item to callbacks as it completes
+    def __init__(self, max_workers=MAX_WORKERS):
+        self.max_workers = max_workers
+
+    def run(self, items, fn, on_result=None, on_error=None):
+        # fn(item) -> result. Returns ({item: result}, {item: exception}).
+        results, errors = {}, {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(fn, item): item for item in items}
+            for future in concurrent.futures.as_completed(futures):
+                item = futures[future]
+                try:
+                    results[item] = future.result()
+                except Exception as e:
+                    errors[item] = e
+                    if on_error: on_error(item, e)
+                    continue
+                if on_result: on_result(item, results[item])
+        return results, errors
@@ -0,0 +1,124 @@
+import os
+import re
+import threading
+import numpy as np
+
+# --- HEADLINE SCORERS ---
+# A scorer has a .name (part of the headline cache key) and
+# .score_batch(list of titles) -> list of polarities in [-1, 1].
+# TITAN_SENTIMENT=textblob (default) | lexicon picks the one the app uses.
+SCORER_ENV = "TITAN_SENTIMENT"
+DEFAULT_SCORER = "textblob"
+
+class TextBlobScorer:
+    # Pattern-based polarity; needs the NLTK corpora from logic/setup_nlp.py.
+    # textblob is only imported when a batch actually has to be scored.
+    name = "textblob"
+
+    @staticmethod
+    def score_batch(titles):
+        from textblob import TextBlob
+        return [TextBlob(t).sentiment.polarity for t in titles]
+
+# --- FINANCE LEXICON ---
+# Word -> polarity, tuned for market headlines (Loughran-McDonald style: "liability",
+# "volatile" or "cut" are negative here, "beat" and "upgrade" positive).
+FINANCE_LEXICON = {
+    # Positive
+    "beat": 0.6, "beats": 0.6, "topped": 0.5, "tops": 0.5, "exceeds": 0.6, "exceeded": 0.6,
+    "surge": 0.7, "surges": 0.7, "surged": 0.7, "soar": 0.8, "soars": 0.8, "soared": 0.8,
+    "jump": 0.5, "jumps": 0.5, "jumped": 0.5, "rally": 0.6, "rallies": 0.6, "rallied": 0.6,
+    "gain": 0.4, "gains": 0.4, "gained": 0.4, "rise": 0.3, "rises": 0.3, "rose": 0.3,
+    "climb": 0.4, "climbs": 0.4, "climbed": 0.4, "rebound": 0.4, "rebounds": 0.4, "recovery": 0.4,
+    "record": 0.4, "high": 0.2, "highs": 0.3, "upgrade": 0.7, "upgrades": 0.7, "upgraded": 0.7,
+    "outperform": 0.6, "outperforms": 0.6, "overweight": 0.4, "buy": 0.3, "bullish": 0.7,
+    "strong": 0.5, "stronger": 0.5, "strength": 0.4, "robust": 0.5, "solid": 0.4, "upbeat": 0.6,
+    "growth": 0.4, "growing": 0.3, "grows": 0.3, "expands": 0.3, "expansion": 0.3,
+    "profit": 0.4, "profits": 0.4, "profitable": 0.5, "profitability": 0.4, "dividend": 0.2,
+    "raises": 0.4, "raised": 0.3, "boost": 0.5, "boosts": 0.5, "boosted": 0.5, "optimism": 0.5,
+    "optimistic": 0.5, "positive": 0.4, "win": 0.5, "wins": 0.5, "won": 0.4, "breakthrough": 0.7,
+    "approval": 0.5, "approved": 0.5, "innovative": 0.4, "innovation": 0.3, "best": 0.6,
+    "great": 0.6, "good": 0.5, "better": 0.4, "success": 0.6, "successful": 0.6, "opportunity": 0.3,
+    "buyback": 0.4, "undervalued": 0.4, "momentum": 0.3, "accelerates": 0.4, "tailwind": 0.4,
+    # Negative
+    "miss": -0.6, "misses": -0.6, "missed": -0.6, "fall": -0.4, "falls": -0.4, "fell": -0.4,
+    "drop": -0.4, "drops": -0.4, "dropped": -0.4, "slump": -0.6, "slumps": -0.6, "slumped": -0.6,
+    "plunge": -0.8, "plunges": -0.8, "plunged": -0.8, "tumble": -0.6, "tumbles": -0.6,
+    "tumbled": -0.6, "sink": -0.5, "sinks": -0.5, "sank": -0.5, "slide": -0.4, "slides": -0.4,
+    "crash": -0.9, "crashes": -0.9, "sell-off": -0.6, "selloff": -0.6, "decline": -0.4,
+    "declines": -0.4, "declined": -0.4, "loss": -0.5, "losses": -0.5, "lose": -0.4, "loses": -0.4,
+    "lost": -0.4, "low": -0.2, "lows": -0.3, "downgrade": -0.7, "downgrades": -0.7,
+    "downgraded": -0.7, "underperform": -0.6, "underweight": -0.4, "sell": -0.3, "bearish": -0.7,
+    "weak": -0.5, "weaker": -0.5, "weakness": -0.5, "cut": -0.4, "cuts": -0.4, "slashes": -0.6,
+    "layoffs": -0.5, "layoff": -0.5, "lawsuit": -0.5, "sued": -0.5, "probe": -0.4,
+    "investigation": -0.4, "fraud": -0.9, "scandal": -0.8, "recall": -0.5, "fine": -0.3,
+    "fined": -0.5, "penalty": -0.5, "risk": -0.3, "risks": -0.3, "risky": -0.4, "warning": -0.5,
+    "warns": -0.5, "volatile": -0.3, "volatility": -0.3, "uncertainty": -0.4, "fears": -0.5,
+    "fear": -0.5, "concern": -0.3, "concerns": -0.3, "worries": -0.4, "worry": -0.4,
+    "bankruptcy": -0.9, "default": -0.7, "debt": -0.2, "liability": -0.3, "headwind": -0.4,
+    "headwinds": -0.4, "slowdown": -0.5, "recession": -0.6, "inflation": -0.2, "bad": -0.6,
+    "worst": -0.8, "worse": -0.5, "negative": -0.4, "overvalued": -0.4, "bubble": -0.5,
+    "delay": -0.3, "delays": -0.3, "halt": -0.5, "halts": -0.5, "disappoints": -0.6,
+    "disappointing": -0.6, "struggle": -0.4, "struggles": -0.4, "pressure": -0.3, "dilution": -0.5
+}
+NEGATORS = ("not", "no", "never", "without", "fails", "failed", "isn't", "doesn't", "didn't", "won't")
+NEGATION_SPAN = 2 # Words after a negator whose polarity flips
+TOKEN_RE = re.compile(r"[a-z][a-z'\-]*|\n")
+
+class LexiconScorer:
+    # Whole batch in one pass: one regex scan over the joined titles, one dictionary
+    # lookup per token into precompiled id / weight tables, then NumPy sums per title.
+    # Polarity = mean weight of the lexicon words in the title (0 if none), like TextBlob.
+    name = "lexicon"
+
+    def __init__(self, lexicon=FINANCE_LEXICON, negators=NEGATORS):
+        words = list(lexicon)
+        self.vocab = {w: i for i, w in enumerate(words)}
+        self.weights = np.array([lexicon[w] for w in words] + [0.0]) # Last slot: unknown word
+        self.unknown = len(words)
+        for n in negators: self.vocab.setdefault(n, -2)
+        self.vocab["\n"] = -1
+
+    def score_batch(self, titles):
+        if not titles: return []
+        text = "\n".join(str(t).replace("\n", " ") for t in titles).lower() + "\n"
+        tokens = TOKEN_RE.findall(text)
+        ids = np.fromiter((self.vocab.get(t, self.unknown) for t in tokens), dtype=np.int64, count=len(tokens))
+        breaks = ids == -1
+        title_of = np.cumsum(breaks) - breaks # Title index of every token
+
+        # Negation: flip words up to NEGATION_SPAN after a negator in the same title
+        negator = ids == -2
+        flip = np.zeros(len(ids), dtype=bool)
+        for k in range(1, NEGATION_SPAN + 1):
+            flip[k:] |= negator[:-k] & (title_of[k:] == title_of[:-k])
+
+        word = ids >= 0
+        w = np.where(word, self.weights[np.where(word, ids, self.unknown)], 0.0)
+        w = np.where(flip, -0.5 * w, w) # "not good" is mildly negative, not the opposite of "good"
+        hit = w != 0
+        sums = np.bincount(title_of, weights=w, minlength=len(titles))[:len(titles)]
+        counts = np.bincount(title_of, weights=hit, minlength=len(titles))[:len(titles)]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            polarity = np.where(counts > 0, sums / counts, 0.0)
+        return np.clip(polarity, -1.0, 1.0).tolist()
+
+SCORERS = {
+    "textblob": TextBlobScorer,
+    "lexicon": LexiconScorer
+}
+
+_scorer = None
+_scorer_lock = threading.Lock()
+
+def build_scorer(name=None):
+    name = (name or os.environ.get(SCORER_ENV, DEFAULT_SCORER)).lower()
+    if name not in SCORERS: raise ValueError(f"Unknown sentiment scorer: {name}")
+    return SCORERS[name]()
+
+def get_scorer():
+    global _scorer
+    if _scorer is None:
+        with _scorer_lock:
+            if _scorer is None: _scorer = build_scorer()
+    return _scorer
@@ -0,0 +1,198 @@
+import numpy as np
+import pandas as pd
+
+# --- DECLARATIVE SCORING RULES ---
+# A rule scores one metric. Its bands are checked in order and the first match wins;
+# "gt"/"lt" are exclusive bounds, a band without bounds is the fallback. A band may
+# raise a flag (optionally only when "flag_if" also holds). "{v}" in any text is the
+# metric value. A rule whose metric is NaN for a ticker is skipped (no points, no max).
+#
+# Rulesets:
+#   "titan"   - main.py (TitanFundamentals.calculate_score)
+#   "desktop" - titan_desktop.py (TitanLogic.calculate_score)
+
+RULESETS = {
+    "titan": {
+        "numeric_only": True, # Non-numeric info values count as missing
+        "style": "simple",
+        "tiers": [(80, "💎 ELITE"), (60, "🥇 QUALITY"), (40, "🥈 OKAY")],
+        "default_tier": "⚠️ AVOID",
+        "rules": [
+            {"metric": "roe_pct", "max": 20, "bands": [
+                {"gt": 15, "points": 20, "reason": "High ROE ({v:.1f}%)"},
+                {"points": 0, "reason": "Low ROE ({v:.1f}%)"}]},
+            {"metric": "op_margin_pct", "max": 20, "bands": [
+                {"gt": 15, "points": 20, "reason": "High Margins ({v:.1f}%)"},
+                {"points": 0, "reason": "Low Margins ({v:.1f}%)"}]},
+            {"metric": "debt_to_equity", "max": 20, "bands": [
+                {"lt": 100, "points": 20, "reason": "Safe Debt Level (D/E {v:.0f}%)"},
+                {"points": 0, "reason": "High Debt (D/E {v:.0f}%)", "flag": "High Debt Risk"}]},
+            {"metric": "current_ratio", "max": 20, "bands": [
+                {"gt": 1.2, "points": 20, "reason": "Liquid Balance Sheet (CR {v:.2f}x)"},
+                {"points": 0, "reason": "Low Liquidity (CR {v:.2f}x)", "flag": "Liquidity Risk"}]},
+            {"metric": "peg", "max": 20, "bands": [
+                {"gt": 0, "lt": 1.5, "points": 20, "reason": "Growth at Fair Price (PEG {v:.2f})"},
+                {"points": 0, "reason": "PEG: Potential Overvaluation ({v:.2f})"}]}
+        ]
+    },
+    "desktop": {
+        "numeric_only": False,
+        "style": "detailed",
+        "tiers": [(85, "💎 ELITE GEM"), (70, "🥇 High Quality"), (55, "🥈 Investable"), (40, "🥉 Average")],
+        "default_tier": "⚠️ AVOID",
+        "rules": [
+            {"metric": "roe_pct", "max": 20, "section": "--- 🛡️ MOAT & QUALITY ---", "bands": [
+                {"gt": 20, "points": 20, "reason": "Elite ROE", "desc": "Return on Equity is {v:.1f}%, showing elite capital efficiency."},
+                {"gt": 12, "points": 12, "reason": "Solid ROE", "desc": "ROE is {v:.1f}%, which is respectable."},
+                {"points": 0, "reason": "Weak ROE", "desc": "ROE of {v:.1f}% suggests inefficient use of capital."}]},
+            {"metric": "op_margin_pct", "max": 10, "section": "--- 🛡️ MOAT & QUALITY ---", "bands": [
+                {"gt": 20, "points": 10, "reason": "High Margins", "desc": "Operating Margin of {v:.1f}% indicates pricing power."},
+                {"gt": 10, "points": 5, "reason": "Decent Margins", "desc": "Operating Margin is {v:.1f}%."},
+                {"points": 0, "reason": "Low Margins", "desc": "Razor thin margins of {v:.1f}%."}]},
+            {"metric": "debt_to_equity", "max": 15, "section": "\n--- 🏰 FINANCIAL FORTRESS ---", "bands": [
+                {"lt": 50, "points": 15, "reason": "Fortress Balance Sheet", "desc": "Debt/Equity is only {v:.0f}%. Minimal leverage."},
+                {"lt": 100, "points": 10, "reason": "Manageable Debt", "desc": "Debt/Equity is {v:.0f}%. Standard leverage."},
+                {"points": 0, "reason": "High Leverage", "desc": "Debt/Equity is {v:.0f}%. Risk in high rate environments.",
+                 "flag": "High Debt/Eq ({v:.0f}%)", "flag_if": {"gt": 200}}]},
+            {"metric": "current_ratio", "max": 15, "section": "\n--- 🏰 FINANCIAL FORTRESS ---", "bands": [
+                {"gt": 1.5, "points": 15, "reason": "High Liquidity", "desc": "Current Ratio {v:.2f}x. Can pay short term debts easily."},
+                {"gt": 1.0, "points": 10, "reason": "Safe Liquidity", "desc": "Current Ratio {v:.2f}x."},
+                {"points": 0, "reason": "Liquidity Crunch", "desc": "Current Ratio {v:.2f}x. Liabilities exceed assets.",
+                 "flag": "Liquidity Risk ({v:.2f}x)", "flag_if": {"lt": 0.8}}]},
+            {"metric": "peg", "max": 20, "section": "\n--- ⚡ VALUATION ---", "bands": [
+                {"gt": 0, "lt": 1.0, "points": 20, "reason": "Undervalued Growth", "desc": "PEG {v:.2f} implies growth is cheap."},
+                {"gt": 0, "lt": 1.5, "points": 15, "reason": "Fair Value", "desc": "PEG {v:.2f} is reasonable."},
+                {"lt": 2.5, "points": 5, "reason": "Premium Pricing", "desc": "PEG {v:.2f} is expensive."},
+                {"points": 0, "reason": "Overvalued", "desc": "PEG {v:.2f} is very high.",
+                 "flag": "Extreme Valuation (PEG {v:.2f})", "flag_if": {"gt": 4.0}}]},
+            {"metric": "high52_distance", "max": 20, "section": "\n--- 📈 MOMENTUM ---", "bands": [
+                {"gt": 0.85, "points": 20, "reason": "Strong Trend", "desc": "Trading near 52-week highs."},
+                {"gt": 0.70, "points": 10, "reason": "Consolidating", "desc": "Trading within 30% of highs."},
+                {"points": 0, "reason": "Downtrend", "desc": "Trading >30% below highs (Falling Knife?).", "flag": "Weak Momentum"}]}
+        ]
+    }
+}
+
+def _number(value, parse_strings):
+    # Info value -> float or NaN. Numeric strings count only when parse_strings is set,
+    # and never as inf / NaN.
+    if isinstance(value, (int, float, np.integer, np.floating)): return value
+    if parse_strings and isinstance(value, str):
+        try: value = float(value)
+        except ValueError: return np.nan
+        return value if np.isfinite(value) else np.nan
+    return np.nan
+
+def _matches(values, cond):
+    mask = np.ones(len(values), dtype=bool)
+    if "gt" in cond: mask &= values > cond["gt"]
+    if "lt" in cond: mask &= values < cond["lt"]
+    return mask
+
+class TitanScoring:
+    # --- Metrics: info columns -> derived metric arrays (one entry per ticker) ---
+    @staticmethod
+    def metric_frame(infos, numeric_only=True):
+        # infos: DataFrame of info snapshots (one row per ticker) or a list of info dicts
+        frame = infos if isinstance(infos, pd.DataFrame) else pd.DataFrame(list(infos))
+
+        def num(key, default):
+            if key not in frame.columns: return np.zeros(len(frame)) + default
+            col = frame[key]
+            if not pd.api.types.is_numeric_dtype(col):
+                # object or string dtype: every non-number ('N/A', 'Infinity', ...) is missing
+                col = pd.to_numeric(col.map(lambda v: _number(v, not numeric_only)), errors='coerce')
+            col = col.astype(np.float64).to_numpy()
+            return np.where(np.isnan(col), default, col)
+
+        pe = num('trailingPE', 0)
+        growth = num('earningsGrowth', 0)
+        peg = num('pegRatio', 0)
+        # Manual PEG fallback when Yahoo has none
+        with np.errstate(divide='ignore', invalid='ignore'):
+            peg = np.where((peg == 0) & (growth > 0) & (pe > 0), pe / (growth * 100), peg)
+
+        price = num('currentPrice', 0)
+        high52 = num('fiftyTwoWeekHigh', price)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            distance = np.where(high52 != 0, price / np.where(high52 != 0, high52, 1), np.nan)
+
+        return pd.DataFrame({
+            "roe_pct": num('returnOnEquity', 0) * 100,
+            "op_margin_pct": num('operatingMargins', 0) * 100,
+            "debt_to_equity": num('debtToEquity', 1000),
+            "current_ratio": num('currentRatio', 0),
+            "peg": peg,
+            "high52_distance": distance
+        }, index=frame.index)
+
+    # --- Engine ---
+    @staticmethod
+    def score_frame(infos, ruleset="titan"):
+        # Whole universe in one pass: a few NumPy masks per rule, no per-ticker Python.
+        # Returns score, tier, max_score plus per-rule band index (b<i>, -1 = skipped) and
+        # metric value (v<i>) so explain() can build text later, only when needed.
+        rs = RULESETS[ruleset]
+        metrics = TitanScoring.metric_frame(infos, rs["numeric_only"])
+        n = len(metrics)
+        score = np.zeros(n)
+        max_score = np.zeros(n)
+        out = {}
+        for i, rule in enumerate(rs["rules"]):
+            values = metrics[rule["metric"]].to_numpy()
+            applies = ~np.isnan(values)
+            bands = rule["bands"]
+            band = np.select([_matches(values, b) for b in bands[:-1]], list(range(len(bands) - 1)), default=len(bands) - 1)
+            band = np.where(applies, band, -1)
+            points = np.array([b["points"] for b in bands] + [0])[band]
+            score += points
+            max_score += np.where(applies, rule["max"], 0)
+            out[f"b{i}"] = band
+            out[f"v{i}"] = values
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            final = np.where(max_score > 0, (score / max_score) * 100, 0).astype(int)
+        thresholds = [t for t, _ in rs["tiers"]]
+        names = [name for _, name in rs["tiers"]]
+        tier = np.select([final >= t for t in thresholds], names, default=rs["default_tier"])
+
+        result = pd.DataFrame({"score": final, "tier": tier, "max_score": max_score}, index=metrics.index)
+        return pd.concat([result, pd.DataFrame(out, index=metrics.index)], axis=1)
+
+    @staticmethod
+    def detail(row, ruleset="titan"):
+        # Compact, JSON-friendly record of one scored row, enough for explain()
+        n = len(RULESETS[ruleset]["rules"])
+        return {"bands": [int(row[f"b{i}"]) for i in range(n)],
+                "values": [None if pd.isna(row[f"v{i}"]) else float(row[f"v{i}"]) for i in range(n)]}
+
+    @staticmethod
+    def explain(detail, ruleset="titan"):
+        # detail (from detail()) -> (flags, breakdown lines). Only run for tickers the user opens.
+        rs = RULESETS[ruleset]
+        flags, breakdown = [], []
+        section = None
+        for rule, band_idx, v in zip(rs["rules"], detail["bands"], detail["values"]):
+            if rule.get("section") and rule["section"] != section:
+                section = rule["section"]
+                breakdown.append(section)
+            if band_idx < 0: continue
+            band = rule["bands"][band_idx]
+            reason = band["reason"].format(v=v)
+            pts = band["points"]
+            if rs["style"] == "detailed":
+                desc = band.get("desc", "").format(v=v)
+                if pts > 0: breakdown.append(f"✅ {reason} (+{pts})\n    └ {desc}")
+                else: breakdown.append(f"⚪ {reason} (0)\n    └ {desc}")
+            else:
+                breakdown.append(f"✅ {reason}" if pts > 0 else f"⚪ {reason}")
+            if band.get("flag") and _matches(np.array([v]), band.get("flag_if", {}))[0]:
+                flags.append(band["flag"].format(v=v))
+        return flags, breakdown
+
+    @staticmethod
+    def score_one(info, ruleset="titan"):
+        # Single ticker: same engine, same output as the old calculate_score functions
+        row = TitanScoring.score_frame([info], ruleset).iloc[0]
+        flags, breakdown = TitanScoring.explain(TitanScoring.detail(row, ruleset), ruleset)
+        return int(row["score"]), row["tier"], flags, breakdown
@@ -1,44 +1,59 @@
-import yfinance as yf
-from textblob import TextBlob
-import feedparser
 import traceback
 import time
+from logic.data_provider import get_provider
+from logic.headline_cache import get_headline_cache
+from logic.scorers import get_scorer
 
 class TitanSentiment:
     @staticmethod
     def analyze(ticker):
+        # Yahoo Finance RSS (via the data provider). Fetch errors propagate: an unreachable
+        # feed is not "no news", the pipeline keeps the cached section instead.
+        entries = get_provider().news(ticker)[:15] # Get a few more headlines
+        # Cached polarity per headline; only unseen titles are scored, in one batch
+        polarities = get_headline_cache().scores([entry['title'] for entry in entries], get_scorer())
+        return TitanSentiment.summarize(entries, polarities)
+
+    @staticmethod
+    def analyze_many(tickers):
+        # Whole watchlist: feeds fetched concurrently, every new headline scored in one batch.
+        # Tickers whose feed could not be fetched are left out (keep what is cached).
+        try:
+            feeds = get_provider().news_many(tickers)
+            entries = {t: feeds[t][:15] for t in tickers if t in feeds}
+            titles = [entry['title'] for t in entries for entry in entries[t]]
+            polarities = iter(get_headline_cache().scores(titles, get_scorer()))
+        except Exception as e:
+            print(f"Sentiment Error: {e}")
+            return {}
+        return {t: TitanSentiment.summarize(entries[t], [next(polarities) for _ in entries[t]]) for t in entries}
+
+    @staticmethod
+    def summarize(entries, polarities):
         headlines = []
         score = 0
         count = 0
         
         try:
-            # Yahoo Finance RSS
-            rss_url = f"https://finance.yahoo.com/rss/headline?s={ticker}"
-            feed = feedparser.parse(rss_url)
-            
-            for entry in feed.entries[:15]: # Get a few more headlines
-                title = entry.title
-                link = entry.link
+            for entry, pol in zip(entries, polarities):
+                title = entry['title']
+                link = entry['link']
                 
                 # Extract source and author from common fields
-                source = entry.get('source', {}).get('title', 'Yahoo Finance')
-                if not source: source = "Yahoo Finance" # Fallback if empty
+                source = entry.get('source') or "Yahoo Finance" # Fallback if empty
                 
                 author = entry.get('author', 'N/A')
                 # Clean up author field if it's an email or generic
                 if "@" in author or "yahoo" in author.lower() or "finance" in author.lower():
                     author = "N/A"
                 
-                published_time = entry.get('published_parsed')
+                published_time = entry.get('published')
                 if published_time:
                     # Format time nicely
-                    published = time.strftime('%Y-%m-%d %H:%M', published_time)
+                    published = time.strftime('%Y-%m-%d %H:%M', tuple(published_time))
                 else:
                     published = 'N/A'
 
-                blob = TextBlob(title)
-                pol = blob.sentiment.polarity
-                
                 score += pol
                 count += 1
                 
@@ -57,7 +72,7 @@ class TitanSentiment:
                 })
                 
         except Exception as e:
-            # print(f"Error fetching sentiment for {ticker}: {e}") # For debugging
+            # print(f"Error building sentiment: {e}") # For debugging
             pass
 
         avg = score / count if count > 0 else 0
@@ -0,0 +1,156 @@
+import json
+import time
+import hashlib
+import threading
+import pandas as pd
+from logic.cache_store import CACHE_DB, _json_default, open_db, lazy_singleton
+from logic.scoring import TitanScoring, RULESETS
+
+# --- POINT-IN-TIME INFO SNAPSHOTS ---
+# Every fetched info payload is appended as the fields that changed since the previous
+# snapshot of that ticker (nothing at all when nothing changed). The full state is kept
+# once per ticker for diffing; older states are rebuilt by replaying the changes.
+# Scores over time are derived data: computed in one score_frame call over all rebuilt
+# snapshots and cached per ruleset fingerprint, so editing RULESETS rescores everything.
+SQL_CHUNK = 500
+DAY = 86400
+
+def scalar_fields(info):
+    # Only plain values are tracked (officer lists and other nested payloads are not);
+    # NaN counts as missing, otherwise it would never compare equal to itself
+    return {k: (None if v != v else v) for k, v in info.items() if v is None or isinstance(v, (int, float, str, bool))}
+
+def rules_fingerprint(ruleset):
+    return hashlib.sha1(json.dumps(RULESETS[ruleset], sort_keys=True, default=str).encode('utf-8')).hexdigest()[:16]
+
+class TitanSnapshotStore:
+    def __init__(self, path=CACHE_DB):
+        self._lock = threading.Lock()
+        self._conn = open_db(path, (
+            """CREATE TABLE IF NOT EXISTS info_snapshots (
+            ticker TEXT NOT NULL,
+            ts REAL NOT NULL,
+            changes TEXT NOT NULL,
+            PRIMARY KEY (ticker, ts))""",
+            """CREATE TABLE IF NOT EXISTS info_latest (
+            ticker TEXT PRIMARY KEY,
+            ts REAL NOT NULL,
+            state TEXT NOT NULL)""",
+            """CREATE TABLE IF NOT EXISTS score_history (
+            ruleset TEXT NOT NULL,
+            rules TEXT NOT NULL,
+            ticker TEXT NOT NULL,
+            ts REAL NOT NULL,
+            score INTEGER NOT NULL,
+            tier TEXT NOT NULL,
+            PRIMARY KEY (ruleset, ticker, ts))"""))
+
+    # --- Writes ---
+    def record(self, ticker, info, ts=None):
+        # Append the changed fields; removed fields are stored as null. Returns how many
+        # fields changed (0 = identical to the last snapshot, nothing written).
+        ts = ts if ts is not None else time.time()
+        state = json.loads(json.dumps(scalar_fields(info), default=_json_default)) # Same types as a reload
+        with self._lock:
+            # IMMEDIATE: read-diff-write is atomic across the screener's processes too
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute("SELECT ts, state FROM info_latest WHERE ticker=?", (ticker,)).fetchone()
+                last = json.loads(row[1]) if row else {}
+                changes = {k: v for k, v in state.items() if k not in last or last[k] != v}
+                changes.update({k: None for k in last if k not in state and last[k] is not None})
+                if changes and (row is None or ts > row[0]):
+                    self._conn.execute("INSERT OR REPLACE INTO info_snapshots VALUES (?, ?, ?)",
+                                       (ticker, ts, json.dumps(changes, default=_json_default)))
+                    self._conn.execute("INSERT OR REPLACE INTO info_latest VALUES (?, ?, ?)",
+                                       (ticker, ts, json.dumps(state, default=_json_default)))
+                else: changes = {}
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return len(changes)
+
+    # --- Reads ---
+    def tickers(self):
+        with self._lock:
+            return [r[0] for r in self._conn.execute("SELECT ticker FROM info_latest ORDER BY ticker")]
+
+    def latest(self, tickers=None):
+        # {ticker: (ts, full info state)} without any replay
+        rows = self._select("SELECT ticker, ts, state FROM info_latest", tickers)
+        return {t: (ts, json.loads(state)) for t, ts, state in rows}
+
+    def states(self, tickers=None):
+        # Every snapshot rebuilt in full -> [(ticker, ts, info)], oldest first per ticker
+        rows = self._select("SELECT ticker, ts, changes FROM info_snapshots", tickers, "ORDER BY ticker, ts")
+        out, current, state = [], None, {}
+        for ticker, ts, changes in rows:
+            if ticker != current: current, state = ticker, {}
+            state = dict(state, **json.loads(changes))
+            out.append((ticker, ts, {k: v for k, v in state.items() if v is not None}))
+        return out
+
+    def score_history(self, tickers=None, ruleset="titan"):
+        # ticker, ts, score, tier for every snapshot. Snapshots not scored under the current
+        # rules are scored together in one score_frame call and cached.
+        rules = rules_fingerprint(ruleset)
+        self._rescore(tickers, ruleset, rules)
+        rows = self._select("SELECT ticker, ts, score, tier FROM score_history", tickers,
+                            "AND ruleset=? AND rules=? ORDER BY ticker, ts", [ruleset, rules])
+        return pd.DataFrame(rows, columns=["ticker", "ts", "score", "tier"])
+
+    def score_change(self, tickers=None, days=90, ruleset="titan", now=None):
+        # Latest score vs the score in force `days` ago -> one row per ticker. Tickers
+        # with a shorter history are compared with their first snapshot (see "since").
+        hist = self.score_history(tickers, ruleset)
+        cols = ["score", "score_then", "score_change", "since", "snapshots"]
+        if hist.empty: return pd.DataFrame(columns=cols, index=pd.Index([], name="ticker"))
+        cutoff = (now if now is not None else time.time()) - days * DAY
+        g = hist.groupby("ticker", sort=False)
+        last = g.tail(1).set_index("ticker")
+        # Last snapshot at or before the cutoff, else the first one
+        before = hist[hist["ts"] <= cutoff].groupby("ticker").tail(1).set_index("ticker")
+        then = g.head(1).set_index("ticker")
+        then.loc[before.index] = before
+        out = pd.DataFrame({
+            "score": last["score"],
+            "score_then": then["score"].reindex(last.index),
+            "since": pd.to_datetime(then["ts"].reindex(last.index), unit='s'),
+            "snapshots": g.size()
+        })
+        out.insert(2, "score_change", out["score"] - out["score_then"])
+        out.index.name = "ticker"
+        return out[cols]
+
+    # --- Internals ---
+    def _rescore(self, tickers, ruleset, rules):
+        with self._lock:
+            self._conn.execute("DELETE FROM score_history WHERE ruleset=? AND rules<>?", (ruleset, rules))
+        scored = set((t, ts) for t, ts in self._select("SELECT ticker, ts FROM score_history", tickers,
+                                                       "AND ruleset=? AND rules=?", [ruleset, rules]))
+        todo = [s for s in self.states(tickers) if (s[0], s[1]) not in scored]
+        if not todo: return 0
+        frame = TitanScoring.score_frame([info for _, _, info in todo], ruleset)
+        rows = [(ruleset, rules, t, ts, int(score), tier)
+                for (t, ts, _), score, tier in zip(todo, frame["score"], frame["tier"])]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.executemany("INSERT OR REPLACE INTO score_history VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self._conn.execute("COMMIT")
+        return len(rows)
+
+    def _select(self, sql, tickers, tail="", params=None):
+        # WHERE ticker IN (...) in chunks, or every ticker when tickers is None
+        params = params or []
+        with self._lock:
+            if tickers is None:
+                return self._conn.execute(f"{sql} WHERE 1=1 {tail}", params).fetchall()
+            tickers, rows = list(tickers), []
+            for i in range(0, len(tickers), SQL_CHUNK):
+                chunk = tickers[i:i + SQL_CHUNK]
+                marks = ",".join("?" * len(chunk))
+                rows += self._conn.execute(f"{sql} WHERE ticker IN ({marks}) {tail}", chunk + params).fetchall()
+            return rows
+
+get_snapshot_store = lazy_singleton(TitanSnapshotStore)
@@ -0,0 +1,57 @@
+import os
+import sys
+import time
+import importlib
+
+# --- COLD START TIMING ---
+# Import this module first: the clock starts at its import. main.py marks the phases
+# up to the first painted window; modules loaded later (on first use or by the
+# background warm-up) are timed individually. TITAN_STARTUP_REPORT=1 prints the
+# report after the first paint, TITAN_STARTUP_EXIT=1 also closes the app
+# (tools/check_startup.py uses both).
+
+STARTUP_BUDGET = 2.0 # Seconds from process start to the first painted window
+REPORT_ENV = "TITAN_STARTUP_REPORT"
+EXIT_ENV = "TITAN_STARTUP_EXIT"
+
+class TitanStartupTimer:
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.marks = []   # (label, seconds since start)
+        self.loads = []   # (module, seconds spent importing it)
+
+    def mark(self, label):
+        self.marks.append((label, time.perf_counter() - self.start))
+
+    def elapsed(self, label):
+        for name, at in self.marks:
+            if name == label: return at
+        return None
+
+    def load(self, name):
+        # Timed import for modules kept off the startup path
+        if name in sys.modules: return sys.modules[name]
+        t0 = time.perf_counter()
+        module = importlib.import_module(name)
+        self.loads.append((name, time.perf_counter() - t0))
+        return module
+
+    def report(self):
+        lines = ["--- STARTUP ---"]
+        prev = 0.0
+        for label, at in self.marks:
+            lines.append(f"{label:<24}{at * 1000:8.0f} ms  (+{(at - prev) * 1000:.0f})")
+            prev = at
+        for name, took in self.loads:
+            lines.append(f"load {name:<19}{took * 1000:8.0f} ms")
+        return "\n".join(lines)
+
+    @staticmethod
+    def enabled():
+        return os.environ.get(REPORT_ENV) == "1" or os.environ.get(EXIT_ENV) == "1"
+
+    @staticmethod
+    def exit_after_paint():
+        return os.environ.get(EXIT_ENV) == "1"
+
+startup = TitanStartupTimer()
@@ -1,6 +1,6 @@
-import yfinance as yf
 import pandas as pd
 import numpy as np
+from logic.memory_cache import get_history
 
 class TitanTechnicals:
     # This dictionary is required by main.py for signal descriptions
@@ -17,6 +17,45 @@ class TitanTechnicals:
         "🔴 MACD Sell Signal": "MACD line crossing below the Signal line. A bearish crossover often used as a sell signal, indicating increasing downward momentum."
     }
 
+    # Signal order matches the per-ticker checks; +1 counts towards Bullish, -1 towards Bearish
+    signal_bias = {
+        "🔥 RSI Overbought (>70)": -1, "🧊 RSI Oversold (<30)": 1,
+        "📈 Bullish Trend (>200 SMA)": 1, "📉 Bearish Trend (<200 SMA)": -1,
+        "✨ Golden Cross Active": 1, "☠️ Death Cross Active": -1,
+        "⚠️ Price above Upper Band (Stretch)": -1, "✅ Price below Lower Band (Dip)": 1,
+        "🟢 MACD Buy Signal": 1, "🔴 MACD Sell Signal": -1
+    }
+
+    @staticmethod
+    def signal_masks(price, rsi, sma50, sma200, upper_bb, lower_bb, macd, signal):
+        # Works on scalars and on arrays alike (one entry per ticker)
+        return {
+            "🔥 RSI Overbought (>70)": rsi > 70,
+            "🧊 RSI Oversold (<30)": ~(rsi > 70) & (rsi < 30),
+            "📈 Bullish Trend (>200 SMA)": price > sma200,
+            "📉 Bearish Trend (<200 SMA)": ~(price > sma200),
+            "✨ Golden Cross Active": sma50 > sma200,
+            "☠️ Death Cross Active": sma50 < sma200,
+            "⚠️ Price above Upper Band (Stretch)": price > upper_bb,
+            "✅ Price below Lower Band (Dip)": ~(price > upper_bb) & (price < lower_bb),
+            "🟢 MACD Buy Signal": macd > signal,
+            "🔴 MACD Sell Signal": ~(macd > signal)
+        }
+
+    @staticmethod
+    def build_signals(price, rsi, sma50, sma200, upper_bb, lower_bb, macd, signal):
+        masks = TitanTechnicals.signal_masks(*np.float64([price, rsi, sma50, sma200, upper_bb, lower_bb, macd, signal]))
+        signals = [name for name, hit in masks.items() if hit]
+
+        # Overall Status
+        bull_score = sum(1 for s in signals if TitanTechnicals.signal_bias[s] > 0)
+        bear_score = sum(1 for s in signals if TitanTechnicals.signal_bias[s] < 0)
+        
+        status = "Neutral"
+        if bull_score > bear_score: status = "Bullish"
+        elif bear_score > bull_score: status = "Bearish"
+        return signals, status
+
     @staticmethod
     def calculate_rsi(series, period=14):
         delta = series.diff(1)
@@ -28,11 +67,88 @@ class TitanTechnicals:
     @staticmethod
     def analyze(ticker_symbol):
         try:
-            stock = yf.Ticker(ticker_symbol)
-            df = stock.history(period="1y")
-            if df.empty or len(df) < 200: return None
-            
-            close = df['Close']
+            df = get_history(ticker_symbol, period="1y")
+            if df.empty: return None
+            return TitanTechnicals.analyze_close(df['Close'])
+        except Exception as e:
+            print(f"Tech Error: {e}")
+            return None
+
+    @staticmethod
+    def analyze_batch(prices):
+        # prices: wide frame from TitanDataProvider.download -> {ticker: result or None}
+        if prices is None or prices.empty: return {}
+        closes = prices['Close']
+        table = TitanTechnicals.analyze_matrix(closes)
+        results = {t: None for t in closes.columns}
+        for t, row in zip(table.index, table.to_dict('records')):
+            results[t] = row
+        return results
+
+    @staticmethod
+    def analyze_matrix(closes, min_bars=200):
+        # closes: dates x tickers. Every indicator for every column in one array pass.
+        # Returns one row per ticker with the same fields as analyze(); tickers with
+        # fewer than min_bars prices are left out.
+        cols = ["price", "rsi", "sma50", "sma200", "upper_bb", "lower_bb", "macd", "macd_signal", "signals", "status"]
+        x = np.asarray(closes, dtype=np.float64)
+        if x.ndim != 2 or x.shape[0] == 0: return pd.DataFrame(columns=cols)
+
+        # Per-column dropna: push NaNs to the top so every column's valid bars end on the last row
+        missing = np.isnan(x)
+        order = np.argsort(~missing, axis=0, kind='stable')
+        x = np.take_along_axis(x, order, axis=0)
+        keep = (~missing).sum(axis=0) >= min_bars
+        x = x[:, keep]
+        tickers = np.asarray(closes.columns)[keep]
+        if x.shape[1] == 0: return pd.DataFrame(columns=cols)
+
+        # --- 1. Indicators (only the windows that feed the last value) ---
+        price = x[-1]
+        sma50 = x[-50:].mean(axis=0)
+        sma200 = x[-200:].mean(axis=0)
+        sma20 = x[-20:].mean(axis=0)
+        std20 = x[-20:].std(axis=0, ddof=1)
+        upper_bb = sma20 + std20 * 2
+        lower_bb = sma20 - std20 * 2
+
+        delta = np.diff(x[-15:], axis=0)
+        gain = np.where(delta > 0, delta, 0).mean(axis=0)
+        loss = np.where(delta < 0, -delta, 0).mean(axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = 100 - (100 / (1 + gain / loss))
+
+        # EMAs are recursive, so walk the rows once with all tickers side by side
+        a12, a26, a9 = 2 / 13, 2 / 27, 2 / 10
+        ema12 = np.full(x.shape[1], np.nan)
+        ema26 = ema12.copy()
+        sig = ema12.copy()
+        for row in x:
+            ema12 = np.where(np.isnan(ema12), row, (1 - a12) * ema12 + a12 * row)
+            ema26 = np.where(np.isnan(ema26), row, (1 - a26) * ema26 + a26 * row)
+            macd = ema12 - ema26
+            sig = np.where(np.isnan(sig), macd, (1 - a9) * sig + a9 * macd)
+
+        # --- 2. Signals as boolean masks ---
+        masks = TitanTechnicals.signal_masks(price, rsi, sma50, sma200, upper_bb, lower_bb, macd, sig)
+        names = list(masks)
+        hits = np.column_stack([masks[n] for n in names])
+        bias = np.array([TitanTechnicals.signal_bias[n] for n in names])
+        bull = (hits & (bias > 0)).sum(axis=1)
+        bear = (hits & (bias < 0)).sum(axis=1)
+        status = np.select([bull > bear, bear > bull], ["Bullish", "Bearish"], default="Neutral").tolist()
+        signals = [[n for n, hit in zip(names, row) if hit] for row in hits]
+
+        return pd.DataFrame({
+            "price": price, "rsi": rsi, "sma50": sma50, "sma200": sma200,
+            "upper_bb": upper_bb, "lower_bb": lower_bb, "macd": macd, "macd_signal": sig,
+            "signals": signals, "status": status
+        }, index=pd.Index(tickers, name="ticker"))
+
+    @staticmethod
+    def analyze_close(close):
+        try:
+            if len(close) < 200: return None
 
             # --- 1. Indicators ---
             rsi = TitanTechnicals.calculate_rsi(close, 14).iloc[-1]
@@ -56,35 +172,7 @@ class TitanTechnicals:
             current_price = close.iloc[-1]
 
             # --- 2. Logic & Signals ---
-            signals = []
-            
-            # RSI
-            if rsi > 70: signals.append("🔥 RSI Overbought (>70)")
-            elif rsi < 30: signals.append("🧊 RSI Oversold (<30)")
-
-            # Trend (SMA)
-            if current_price > sma200: signals.append("📈 Bullish Trend (>200 SMA)")
-            else: signals.append("📉 Bearish Trend (<200 SMA)")
-            
-            # Crosses
-            if sma50 > sma200: signals.append("✨ Golden Cross Active")
-            elif sma50 < sma200: signals.append("☠️ Death Cross Active")
-
-            # Bollinger
-            if current_price > upper_bb: signals.append("⚠️ Price above Upper Band (Stretch)")
-            elif current_price < lower_bb: signals.append("✅ Price below Lower Band (Dip)")
-
-            # MACD
-            if macd_val > signal_val: signals.append("🟢 MACD Buy Signal")
-            else: signals.append("🔴 MACD Sell Signal")
-
-            # Overall Status
-            bull_score = sum([1 for s in signals if "Bullish" in s or "Buy" in s or "Golden" in s or "Oversold" in s or "Dip" in s])
-            bear_score = sum([1 for s in signals if "Bearish" in s or "Sell" in s or "Death" in s or "Overbought" in s or "Stretch" in s])
-            
-            status = "Neutral"
-            if bull_score > bear_score: status = "Bullish"
-            elif bear_score > bull_score: status = "Bearish"
+            signals, status = TitanTechnicals.build_signals(current_price, rsi, sma50, sma200, upper_bb, lower_bb, macd_val, signal_val)
 
             return {
                 "price": current_price,
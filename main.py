@@ -1,32 +1,29 @@
+from logic.startup import startup
 import customtkinter as ctk
-import yfinance as yf
 import threading
 import json
 import os
-import time
-import requests
-import pandas as pd
-import concurrent.futures
 import webbrowser
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from PIL import Image
-from io import BytesIO
-import re
 
 # --- IMPORTS FROM LOGIC MODULES ---
-from logic.fundamentals import TitanFundamentals
-from logic.technicals import TitanTechnicals
-from logic.sentiment import TitanSentiment
-from logic.institutional import TitanInstitutional
+# Only what the first window needs. yfinance, pandas, matplotlib, requests and textblob
+# are imported on first use, or by warm_up() once the window is painted.
+from logic.cache_store import TitanCacheStore, CACHE_DB, SECTIONS
+from logic.scheduler import TitanScheduler
 from ui.cards import MetricCard, CreateToolTip
+from ui.watchlist import WatchlistView
+startup.mark("imports")
 
 # --- CONFIGURATION ---
 ctk.set_appearance_mode("Dark")
 ctk.set_default_color_theme("dark-blue")
 
-CACHE_FILE = "titan_cache.json"
+CACHE_FILE = "titan_cache.json" # Legacy, imported once into CACHE_DB
 WATCHLIST_FILE = "titan_watchlist.json"
+INSIDER_ROWS = 25 # Transactions drawn in the Smart Money table (the cache keeps the full history)
+WATCH_COLUMNS = [("ticker", "TICKER", 60), ("implied_growth", "IMPL. G", 52), ("score", "SCORE", 34)] # Sidebar sort headers, right ones packed from the edge
+DRIFT_DAYS = 90 # Score drift window shown under the fundamentals
+WARM_MODULES = ("logic.pipeline", "logic.technicals", "logic.data_provider") # Loaded in the background after first paint
 
 # --- COLOR PALETTE ---
 C_BG = "#020617"        # Main Background
@@ -46,11 +43,14 @@ class TitanApp(ctk.CTk):
         self.geometry("1400x850")
         
         self.watchlist = self.load_json(WATCHLIST_FILE, is_list=True)
-        self.cache = self.load_json(CACHE_FILE, is_list=False)
+        self.cache = TitanCacheStore(CACHE_DB, legacy_file=CACHE_FILE)
         self.history = ["NVDA", "MSFT", "AAPL", "TSLA", "GOOG"] 
         self.current_data = None
         self.current_logo_tk = None
-        self.chart_figure = None
+        self.chart_request = None
+        self.chart_period = "1y"
+        self.built_tabs = set()
+        self.watch_sort = None # (column, descending); None keeps the order tickers were added
 
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(1, weight=1)
@@ -64,8 +64,18 @@ class TitanApp(ctk.CTk):
         self.btn_refresh_all = ctk.CTkButton(self.sidebar, text="↻ REFRESH ALL", fg_color="#475569", hover_color="#334155", command=self.refresh_all_watchlist)
         self.btn_refresh_all.pack(padx=10, pady=(0, 15), fill="x")
 
-        self.scroll_watch = ctk.CTkScrollableFrame(self.sidebar, fg_color="transparent")
-        self.scroll_watch.pack(fill="both", expand=True, padx=5)
+        # Sortable column headers: ticker / implied growth / score
+        self.watch_header = ctk.CTkFrame(self.sidebar, fg_color="transparent")
+        self.watch_header.pack(fill="x", padx=10)
+        self.watch_sort_btns = {}
+        for key, text, width in WATCH_COLUMNS:
+            b = ctk.CTkButton(self.watch_header, text=text, width=width, height=22, fg_color="transparent", hover_color=C_CARD,
+                              text_color=C_TEXT_SUB, font=("Arial", 10, "bold"), command=lambda k=key: self.sort_watchlist(k))
+            b.pack(side="left" if key == "ticker" else "right", fill="x", expand=key == "ticker", padx=(5, 0) if key != "ticker" else 0)
+            self.watch_sort_btns[key] = b
+
+        self.watch_view = WatchlistView(self.sidebar, self.load_ticker_from_watch, self.watch_row_cells, card_color=C_CARD)
+        self.watch_view.pack(fill="both", expand=True, padx=5)
         self.update_watchlist_ui()
 
         # --- TOP BAR ---
@@ -92,7 +102,27 @@ class TitanApp(ctk.CTk):
         self.main_panel.grid(row=1, column=1, sticky="nsew")
         
         self.setup_dashboard()
-        
+        startup.mark("window built")
+        self.after_idle(self.on_first_paint)
+
+    def on_first_paint(self):
+        self.update_idletasks()
+        startup.mark("first paint")
+        if startup.enabled(): print(startup.report(), flush=True)
+        if startup.exit_after_paint():
+            self.after(0, self.destroy)
+            return
+        # The selected tab (and with it matplotlib) is built only now that the window is up
+        self.on_tab_change()
+        threading.Thread(target=self.warm_up, daemon=True).start()
+
+    def warm_up(self):
+        # Pull in the data stack in the background so the first search doesn't pay for it
+        for name in WARM_MODULES:
+            try: startup.load(name)
+            except Exception as e: print(f"Warm-up Error ({name}): {e}")
+        if startup.enabled(): print(startup.report(), flush=True)
+
     def setup_dashboard(self):
         # 1. Header Area
         self.header_frame = ctk.CTkFrame(self.main_panel, fg_color="transparent")
@@ -148,7 +178,7 @@ class TitanApp(ctk.CTk):
         self.lbl_score.pack(pady=(10,0))
         self.lbl_tier = ctk.CTkLabel(self.score_box, text="NO DATA", font=("Arial", 18, "bold"))
         self.lbl_tier.pack(pady=(0,5))
-        CreateToolTip(self.score_box, lambda: self.current_data.get('breakdown', "No Analysis Loaded") if self.current_data else "No Analysis Loaded")
+        CreateToolTip(self.score_box, self.score_breakdown)
 
         # 2. Action Buttons
         self.action_frame = ctk.CTkFrame(self.main_panel, fg_color="transparent")
@@ -161,7 +191,7 @@ class TitanApp(ctk.CTk):
         self.btn_del_watch.pack(side="left", padx=5)
 
         # 3. Tabs
-        self.tabs = ctk.CTkTabview(self.main_panel, text_color=C_TEXT_SUB, segmented_button_selected_color=C_ACCENT, segmented_button_unselected_color=C_CARD)
+        self.tabs = ctk.CTkTabview(self.main_panel, text_color=C_TEXT_SUB, segmented_button_selected_color=C_ACCENT, segmented_button_unselected_color=C_CARD, command=self.on_tab_change)
         self.tabs.pack(fill="both", expand=True, padx=20, pady=10)
         
         self.tab_chart = self.tabs.add("Chart")
@@ -169,15 +199,29 @@ class TitanApp(ctk.CTk):
         self.tab_tech = self.tabs.add("Technicals")
         self.tab_sent = self.tabs.add("Sentiment")
         self.tab_inst = self.tabs.add("Smart Money")
-        
-        self.create_chart_tab()
-        self.create_fund_tab()
-        self.create_tech_tab()
-        self.create_sent_tab()
-        self.create_inst_tab()
+
+        # Tab contents are built the first time a tab is selected: name -> (builder, renderer)
+        self.tab_views = {
+            "Chart": (self.create_chart_tab, None),
+            "Fundamentals": (self.create_fund_tab, self.render_fund),
+            "Technicals": (self.create_tech_tab, self.render_tech),
+            "Sentiment": (self.create_sent_tab, self.render_sent),
+            "Smart Money": (self.create_inst_tab, self.render_inst)
+        }
+
+    def on_tab_change(self):
+        name = self.tabs.get()
+        if name in self.built_tabs: return
+        self.built_tabs.add(name)
+        builder, _ = self.tab_views[name]
+        builder()
+        if name == "Chart":
+            if self.current_data: self.update_chart(self.chart_period)
+        else: self.render_tab(name, self.current_data)
 
     # --- UI CREATORS ---
     def create_chart_tab(self):
+        from ui.chart import PriceChart # matplotlib + TkAgg
         ctrl = ctk.CTkFrame(self.tab_chart, fg_color="transparent")
         ctrl.pack(fill="x", pady=10, padx=10)
         ctk.CTkLabel(ctrl, text="Timescale:", text_color="gray").pack(side="left", padx=5)
@@ -187,8 +231,8 @@ class TitanApp(ctk.CTk):
             ctk.CTkButton(ctrl, text=label, width=50, fg_color=C_CARD, hover_color=C_ACCENT, 
                           command=lambda t=period: self.update_chart(t)).pack(side="left", padx=5)
 
-        self.chart_frame = ctk.CTkFrame(self.tab_chart, fg_color=C_BG)
-        self.chart_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        self.price_chart = PriceChart(self.tab_chart, bg=C_BG, color=C_ACCENT)
+        self.price_chart.pack(fill="both", expand=True, padx=10, pady=10)
 
     def create_fund_tab(self):
         self.fund_cards = {}
@@ -217,6 +261,16 @@ class TitanApp(ctk.CTk):
             grid.grid_columnconfigure(i%4, weight=1)
             grid.grid_rowconfigure(i//4, weight=1)
 
+        # Score drift: every stored snapshot, rescored with the current rules
+        drift = ctk.CTkFrame(self.tab_fund, fg_color=C_CARD, corner_radius=8)
+        drift.pack(fill="x", padx=20, pady=(0, 10))
+        self.drift_lbl = ctk.CTkLabel(drift, text="SCORE HISTORY", font=("Arial", 12, "bold"), text_color=C_TEXT_SUB)
+        self.drift_lbl.pack(anchor="w", padx=15, pady=(8, 0))
+        self.drift_canvas = ctk.CTkCanvas(drift, height=70, bg=C_CARD, highlightthickness=0)
+        self.drift_canvas.pack(fill="x", padx=15, pady=(0, 10))
+        self.drift_canvas.bind("<Configure>", lambda e: self.draw_score_drift())
+        self.drift_points = []
+
     def create_tech_tab(self):
         split = ctk.CTkFrame(self.tab_tech, fg_color="transparent")
         split.pack(fill="both", expand=True, padx=10, pady=10)
@@ -257,7 +311,9 @@ class TitanApp(ctk.CTk):
 
     def create_inst_tab(self):
         self.inst_lbl = ctk.CTkLabel(self.tab_inst, text="NO DATA", font=("Arial", 18, "bold"))
-        self.inst_lbl.pack(pady=10)
+        self.inst_lbl.pack(pady=(10, 0))
+        self.inst_flow_lbl = ctk.CTkLabel(self.tab_inst, text="", font=("Consolas", 12), text_color=C_TEXT_SUB)
+        self.inst_flow_lbl.pack(pady=(0, 10))
         self.inst_table_frame = ctk.CTkFrame(self.tab_inst, fg_color="transparent")
         self.inst_table_frame.pack(fill="both", expand=True, padx=10)
 
@@ -276,14 +332,17 @@ class TitanApp(ctk.CTk):
         self.start_loading()
         
         # Cache Validation
-        if not force_refresh and ticker in self.cache:
-            data = self.cache[ticker]
+        data = None if force_refresh else self.cache.get(ticker)
+        if data:
             # Critical check: Does this cached data have the new fields?
             if 'change' in data and 'day_low' in data:
                 print(f"Loading {ticker} from Cache...")
                 self.render_data(data)
                 self.update_chart("1y")
                 self.stop_loading()
+                # Stale-while-revalidate: the cached view stays up while expired sections refresh
+                stale = self.cache.stale_sections(ticker)
+                if stale: threading.Thread(target=self.fetch_data, args=(ticker, tuple(stale)), daemon=True).start()
                 return
             else:
                 print(f"Cache invalid for {ticker} (missing new fields). Refreshing...")
@@ -302,91 +361,27 @@ class TitanApp(ctk.CTk):
         self.progress.stop()
         self.progress.pack_forget()
 
-    def fetch_data(self, ticker):
+    def fetch_data(self, ticker, sections=SECTIONS):
+        # sections: only these parts of the entry are fetched. A partial refresh patches
+        # the view that is already showing the cached entry.
+        full = tuple(sections) == SECTIONS
         try:
-            print(f"Fetching {ticker}...")
-            stock = yf.Ticker(ticker)
-            
-            # Parallel Fetching
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future_info = executor.submit(lambda: stock.info)
-                future_tech = executor.submit(TitanTechnicals.analyze, ticker)
-                future_sent = executor.submit(TitanSentiment.analyze, ticker)
-                future_inst = executor.submit(TitanInstitutional.analyze, ticker)
-                
-                info = future_info.result()
-                # Robust check for data existence
-                if not info or ('regularMarketPrice' not in info and 'currentPrice' not in info): 
-                    raise Exception(f"No data found for {ticker}")
-                
-                fund_score, fund_tier, flags, breakdown = TitanFundamentals.calculate_score(info)
-                tech = future_tech.result()
-                sent = future_sent.result()
-                inst = future_inst.result()
+            print(f"Fetching {ticker} ({', '.join(sections)})...")
+            from logic.pipeline import TitanPipeline
+            tech_state = (self.cache.get_section(ticker, "technicals") or {}).get('tech_state')
+            fresh = TitanPipeline.fetch(ticker, sections, tech_state)
+            self.cache.put(ticker, fresh, sections=sections)
+            data = self.cache.get(ticker)
             
-            # Price & Change Calculation
-            current = info.get('currentPrice', info.get('regularMarketPrice', 0))
-            prev_close = info.get('previousClose', current)
-            
-            # Safety defaults
-            if current is None: current = 0
-            if prev_close is None: prev_close = current
-            
-            change = current - prev_close
-            pct_change = (change / prev_close) * 100 if prev_close != 0 else 0
-            
-            # Day Range
-            day_low = info.get('dayLow', current)
-            day_high = info.get('dayHigh', current)
-
-            # PEG Fix
-            peg = info.get('pegRatio')
-            if (not peg or peg == 0):
-                pe = info.get('trailingPE', 0)
-                g = info.get('earningsGrowth', 0)
-                peg = pe / (g*100) if (g and g!=0) else 0
-
-            data = {
-                "ticker": ticker,
-                "name": info.get('shortName', 'Unknown'),
-                "price": current,
-                "change": change,
-                "pct_change": pct_change,
-                "day_low": day_low,
-                "day_high": day_high,
-                "score": fund_score,
-                "tier": fund_tier,
-                "breakdown": "\n".join(breakdown),
-                "metrics": {
-                    "P/E Ratio": info.get('trailingPE', 0),
-                    "Forward P/E": info.get('forwardPE', 0),
-                    "PEG Ratio": peg,
-                    "Price/Book": info.get('priceToBook', 0),
-                    "Beta": info.get('beta', 0),
-                    "ROE %": info.get('returnOnEquity', 0),
-                    "Profit Margin": info.get('profitMargins', 0),
-                    "Debt/Equity": info.get('debtToEquity', 0),
-                    "Current Ratio": info.get('currentRatio', 0),
-                    "Free Cash Flow": info.get('freeCashflow', 0),
-                    "Dividend Yield": info.get('dividendYield', 0)
-                },
-                "tech": tech,
-                "sentiment": sent,
-                "institutional": inst,
-                "website": info.get('website', '')
-            }
-            
-            self.cache[ticker] = data
-            self.save_json(CACHE_FILE, self.cache)
-            
-            self.after(0, lambda: self.render_data(data))
-            self.after(0, lambda: self.update_chart("1y"))
+            if full or (self.current_data and self.current_data.get('ticker') == ticker):
+                self.after(0, lambda: self.render_data(data))
+            if full: self.after(0, lambda: self.update_chart("1y"))
             
         except Exception as e:
             print(f"Fetch Error: {e}")
-            self.after(0, lambda: ctk.CTkMessagebox(title="Error", message=f"Could not fetch data for {ticker}.\nDetails: {e}", icon="cancel") if 'CTkMessagebox' in globals() else None)
+            if full: self.after(0, lambda: ctk.CTkMessagebox(title="Error", message=f"Could not fetch data for {ticker}.\nDetails: {e}", icon="cancel") if 'CTkMessagebox' in globals() else None)
         finally:
-            self.after(0, self.stop_loading)
+            if full: self.after(0, self.stop_loading)
 
     def render_data(self, data):
         try:
@@ -429,106 +424,174 @@ class TitanApp(ctk.CTk):
             self.lbl_score.configure(text=str(data['score']), text_color=c_score)
             self.lbl_tier.configure(text=data['tier'], text_color=c_score)
             
-            # Fundamentals
-            m = data['metrics']
-            self.fund_cards["P/E Ratio"].set_value(f"{m.get('P/E Ratio',0):.2f}")
-            self.fund_cards["Forward P/E"].set_value(f"{m.get('Forward P/E',0):.2f}")
-            self.fund_cards["PEG Ratio"].set_value(f"{m.get('PEG Ratio',0):.2f}", status="good" if 0 < m.get('PEG Ratio',0) < 1.5 else "neutral")
-            self.fund_cards["Price/Book"].set_value(f"{m.get('Price/Book',0):.2f}")
-            self.fund_cards["Beta"].set_value(f"{m.get('Beta',0):.2f}")
-            self.fund_cards["ROE %"].set_value(f"{m.get('ROE %',0)*100:.1f}%")
-            self.fund_cards["Profit Margin"].set_value(f"{m.get('Profit Margin',0)*100:.1f}%")
-            self.fund_cards["Debt/Equity"].set_value(f"{m.get('Debt/Equity',0):.0f}%")
-            self.fund_cards["Current Ratio"].set_value(f"{m.get('Current Ratio',0):.2f}")
-            self.fund_cards["Free Cash Flow"].set_value(self.fmt_num(m.get('Free Cash Flow',0)))
-            
-            d = m.get('Dividend Yield', 0)
-            d_val = d if d and d > 0.5 else d * 100 if d else 0
-            self.fund_cards["Dividend Yield"].set_value(f"{d_val:.2f}%")
-
-            # Technicals
-            if data['tech']:
-                t = data['tech']
-                self.tech_metrics["RSI"].configure(text=f"{t['rsi']:.1f}", text_color=C_RED if t['rsi']>70 else C_GREEN if t['rsi']<30 else "white")
-                self.tech_metrics["MACD"].configure(text=f"{t['macd']:.2f}")
-                self.tech_metrics["50 SMA"].configure(text=f"{t['sma50']:.2f}")
-                self.tech_metrics["200 SMA"].configure(text=f"{t['sma200']:.2f}")
-                self.tech_metrics["Upper BB"].configure(text=f"{t['upper_bb']:.2f}")
-                self.tech_metrics["Lower BB"].configure(text=f"{t['lower_bb']:.2f}")
-                
-                for w in self.tech_signal_frame.winfo_children(): w.destroy()
-                from logic.technicals import TitanTechnicals
-                for s in t['signals']:
-                    frame = ctk.CTkFrame(self.tech_signal_frame, fg_color="transparent")
-                    frame.pack(fill="x", pady=5)
-                    col = C_RED if "Bear" in s or "Sell" in s or "Death" in s else C_GREEN
-                    ctk.CTkLabel(frame, text=s, text_color=col, font=("Arial", 14, "bold")).pack(anchor="w")
-                    desc = TitanTechnicals.signal_descriptions.get(s, "Technical signal detected.")
-                    ctk.CTkLabel(frame, text=f"└ {desc}", text_color="gray", font=("Arial", 11), wraplength=400, justify="left").pack(anchor="w", padx=15)
-
-            # Sentiment
-            if data['sentiment']:
-                s = data['sentiment']
-                col = C_GREEN if "Bull" in s['rating'] else C_RED if "Bear" in s['rating'] else "white"
-                self.sent_lbl.configure(text=f"{s['rating']} (Score: {s['score']:.2f})", text_color=col)
-                
-                for w in self.sent_scroll.winfo_children(): w.destroy()
-                for n in s['headlines']:
-                    row = ctk.CTkFrame(self.sent_scroll, fg_color=C_CARD, border_width=1, border_color=n['color'])
-                    row.pack(fill="x", pady=4, padx=5)
-                    meta = f"{n.get('source', 'News')} • {n.get('date', '')}"
-                    if n.get('author') and n.get('author') != "N/A": meta += f" • {n.get('author')}"
-                    ctk.CTkLabel(row, text=meta, font=("Arial", 10), text_color="gray").pack(anchor="w", padx=10, pady=(5,0))
-                    lbl_t = ctk.CTkLabel(row, text=n['text'], anchor="w", font=("Arial", 12, "bold"), wraplength=650, cursor="hand2")
-                    lbl_t.pack(fill="x", padx=10, pady=(0,5))
-                    if n.get('link'):
-                        lbl_t.bind("<Button-1>", lambda e, url=n['link']: webbrowser.open(url))
-                        CreateToolTip(lbl_t, lambda: f"Open: {n['link']}")
-
-            # Institutional
-            if data['institutional']:
-                i = data['institutional']
-                self.inst_lbl.configure(text=f"{i['signal']} (${i['net_flow']/1e6:.1f}M Net)")
-                
-                for w in self.inst_table_frame.winfo_children(): w.destroy()
-                
-                show_role = i.get('has_roles', False)
-                cols = ["Date", "Type", "Insider", "Shares", "Price", "Value"]
-                if show_role: cols.insert(3, "Role")
-                
-                h_frame = ctk.CTkFrame(self.inst_table_frame, height=30, fg_color="#334155", corner_radius=4)
-                h_frame.pack(fill="x", pady=(0,5))
-                
-                for idx, c in enumerate(cols):
-                    ctk.CTkLabel(h_frame, text=c, font=("Arial", 12, "bold"), text_color="white").grid(row=0, column=idx, sticky="ew", padx=2, pady=5)
-                    h_frame.grid_columnconfigure(idx, weight=1)
-                
-                scroll = ctk.CTkScrollableFrame(self.inst_table_frame, fg_color="transparent")
-                scroll.pack(fill="both", expand=True)
-                
-                for r_idx, tx in enumerate(i['transactions']):
-                    bg = C_CARD if r_idx % 2 == 0 else "#252f45"
-                    row = ctk.CTkFrame(scroll, fg_color=bg, corner_radius=0)
-                    row.pack(fill="x")
-                    c_val = C_GREEN if tx['type'] == "Buy" else C_RED
-                    
-                    vals = [tx['date'], tx['type'], tx['insider'][:18]]
-                    if show_role: vals.append(tx.get('role', '-')[:15])
-                    vals.extend([tx['shares'], tx['price'], tx['value']])
-                    
-                    for c_idx, val in enumerate(vals):
-                        txt_col = c_val if cols[c_idx] == "Type" else "#e2e8f0"
-                        ctk.CTkLabel(row, text=str(val), font=("Consolas", 11), text_color=txt_col).grid(row=0, column=c_idx, sticky="ew", padx=2, pady=5)
-                        row.grid_columnconfigure(c_idx, weight=1)
-        
+            # Tabs: only the ones that have been built; the rest render when first opened
+            for name in self.built_tabs: self.render_tab(name, data)
+
         except Exception as e:
             print(f"Render Error: {e}")
             import traceback
             traceback.print_exc()
 
+    def render_tab(self, name, data):
+        _, renderer = self.tab_views[name]
+        if not renderer or not data: return
+        try:
+            renderer(data)
+        except Exception as e:
+            print(f"Render Error ({name}): {e}")
+            import traceback
+            traceback.print_exc()
+
+    # --- TAB RENDERERS ---
+    def render_fund(self, data):
+        m = data['metrics']
+        self.fund_cards["P/E Ratio"].set_value(f"{m.get('P/E Ratio',0):.2f}")
+        self.fund_cards["Forward P/E"].set_value(f"{m.get('Forward P/E',0):.2f}")
+        self.fund_cards["PEG Ratio"].set_value(f"{m.get('PEG Ratio',0):.2f}", status="good" if 0 < m.get('PEG Ratio',0) < 1.5 else "neutral")
+        self.fund_cards["Price/Book"].set_value(f"{m.get('Price/Book',0):.2f}")
+        self.fund_cards["Beta"].set_value(f"{m.get('Beta',0):.2f}")
+        self.fund_cards["ROE %"].set_value(f"{m.get('ROE %',0)*100:.1f}%")
+        self.fund_cards["Profit Margin"].set_value(f"{m.get('Profit Margin',0)*100:.1f}%")
+        self.fund_cards["Debt/Equity"].set_value(f"{m.get('Debt/Equity',0):.0f}%")
+        self.fund_cards["Current Ratio"].set_value(f"{m.get('Current Ratio',0):.2f}")
+        self.fund_cards["Free Cash Flow"].set_value(self.fmt_num(m.get('Free Cash Flow',0)))
+        
+        d = m.get('Dividend Yield', 0)
+        d_val = d if d and d > 0.5 else d * 100 if d else 0
+        self.fund_cards["Dividend Yield"].set_value(f"{d_val:.2f}%")
+        self.render_score_drift(data['ticker'])
+
+    def render_score_drift(self, ticker):
+        from logic.snapshots import get_snapshot_store
+        try:
+            store = get_snapshot_store()
+            hist = store.score_history([ticker])
+            change = store.score_change([ticker], days=DRIFT_DAYS)
+        except Exception as e:
+            print(f"Score History Error: {e}")
+            return
+        self.drift_points = list(zip(hist['ts'], hist['score']))
+        if ticker in change.index and len(hist) > 1:
+            c = change.loc[ticker]
+            sign = "+" if c['score_change'] >= 0 else ""
+            text = f"SCORE HISTORY  {sign}{c['score_change']:.0f} since {c['since']:%Y-%m-%d} ({len(hist)} snapshots)"
+            col = C_GREEN if c['score_change'] > 0 else C_RED if c['score_change'] < 0 else C_TEXT_SUB
+        else: text, col = "SCORE HISTORY  (first snapshot)", C_TEXT_SUB
+        self.drift_lbl.configure(text=text, text_color=col)
+        self.draw_score_drift()
+
+    def draw_score_drift(self):
+        # Step line of score (0-100) over time
+        c = self.drift_canvas
+        c.delete("all")
+        w, h = c.winfo_width(), int(c.cget("height"))
+        if len(self.drift_points) < 2 or w < 20: return
+        t0, t1 = self.drift_points[0][0], self.drift_points[-1][0]
+        span = max(t1 - t0, 1)
+        def xy(ts, score): return 4 + (ts - t0) / span * (w - 8), h - 4 - score / 100 * (h - 8)
+        for level in (40, 60, 80): # Tier boundaries
+            y = xy(t0, level)[1]
+            c.create_line(0, y, w, y, fill="#334155", dash=(2, 4))
+        coords = []
+        for ts, score in self.drift_points:
+            x, y = xy(ts, score)
+            if coords: coords += [x, coords[-1]]
+            coords += [x, y]
+        c.create_line(*coords, fill=C_ACCENT, width=2)
+
+    def render_tech(self, data):
+        if data.get('tech'):
+            t = data['tech']
+            self.tech_metrics["RSI"].configure(text=f"{t['rsi']:.1f}", text_color=C_RED if t['rsi']>70 else C_GREEN if t['rsi']<30 else "white")
+            self.tech_metrics["MACD"].configure(text=f"{t['macd']:.2f}")
+            self.tech_metrics["50 SMA"].configure(text=f"{t['sma50']:.2f}")
+            self.tech_metrics["200 SMA"].configure(text=f"{t['sma200']:.2f}")
+            self.tech_metrics["Upper BB"].configure(text=f"{t['upper_bb']:.2f}")
+            self.tech_metrics["Lower BB"].configure(text=f"{t['lower_bb']:.2f}")
+            
+            for w in self.tech_signal_frame.winfo_children(): w.destroy()
+            from logic.technicals import TitanTechnicals
+            for s in t['signals']:
+                frame = ctk.CTkFrame(self.tech_signal_frame, fg_color="transparent")
+                frame.pack(fill="x", pady=5)
+                col = C_RED if "Bear" in s or "Sell" in s or "Death" in s else C_GREEN
+                ctk.CTkLabel(frame, text=s, text_color=col, font=("Arial", 14, "bold")).pack(anchor="w")
+                desc = TitanTechnicals.signal_descriptions.get(s, "Technical signal detected.")
+                ctk.CTkLabel(frame, text=f"└ {desc}", text_color="gray", font=("Arial", 11), wraplength=400, justify="left").pack(anchor="w", padx=15)
+
+    def render_sent(self, data):
+        if data.get('sentiment'):
+            s = data['sentiment']
+            col = C_GREEN if "Bull" in s['rating'] else C_RED if "Bear" in s['rating'] else "white"
+            self.sent_lbl.configure(text=f"{s['rating']} (Score: {s['score']:.2f})", text_color=col)
+            
+            for w in self.sent_scroll.winfo_children(): w.destroy()
+            for n in s['headlines']:
+                row = ctk.CTkFrame(self.sent_scroll, fg_color=C_CARD, border_width=1, border_color=n['color'])
+                row.pack(fill="x", pady=4, padx=5)
+                meta = f"{n.get('source', 'News')} • {n.get('date', '')}"
+                if n.get('author') and n.get('author') != "N/A": meta += f" • {n.get('author')}"
+                ctk.CTkLabel(row, text=meta, font=("Arial", 10), text_color="gray").pack(anchor="w", padx=10, pady=(5,0))
+                lbl_t = ctk.CTkLabel(row, text=n['text'], anchor="w", font=("Arial", 12, "bold"), wraplength=650, cursor="hand2")
+                lbl_t.pack(fill="x", padx=10, pady=(0,5))
+                if n.get('link'):
+                    lbl_t.bind("<Button-1>", lambda e, url=n['link']: webbrowser.open(url))
+                    CreateToolTip(lbl_t, lambda: f"Open: {n['link']}")
+
+    def render_inst(self, data):
+        if data.get('institutional'):
+            i = data['institutional']
+            flows = i.get('flows')
+            if flows:
+                # Trailing-window flows for this ticker, and the watchlist-wide 90-day net
+                from logic.insider_flow import get_insider_flow
+                self.inst_lbl.configure(text=f"{i['signal']} (${i['net_flow']/1e6:.1f}M Net, 90D)")
+                total = get_insider_flow().aggregate([w['ticker'] for w in self.watchlist])["*"]
+                windows = "   ".join(f"{d}D ${v/1e6:+.1f}M" for d, v in flows.items())
+                self.inst_flow_lbl.configure(text=f"{windows}   |   Watchlist 90D ${total[90]/1e6:+.1f}M")
+            else:
+                self.inst_lbl.configure(text=f"{i['signal']} (${i['net_flow']/1e6:.1f}M Net)")
+                self.inst_flow_lbl.configure(text="")
+            
+            for w in self.inst_table_frame.winfo_children(): w.destroy()
+            
+            from logic.institutional import TitanInstitutional
+            rows = TitanInstitutional.format_rows(i['transactions'], INSIDER_ROWS)
+            show_role = TitanInstitutional.has_roles(rows)
+            cols = ["Date", "Type", "Insider", "Shares", "Price", "Value"]
+            if show_role: cols.insert(3, "Role")
+            
+            h_frame = ctk.CTkFrame(self.inst_table_frame, height=30, fg_color="#334155", corner_radius=4)
+            h_frame.pack(fill="x", pady=(0,5))
+            
+            for idx, c in enumerate(cols):
+                ctk.CTkLabel(h_frame, text=c, font=("Arial", 12, "bold"), text_color="white").grid(row=0, column=idx, sticky="ew", padx=2, pady=5)
+                h_frame.grid_columnconfigure(idx, weight=1)
+            
+            scroll = ctk.CTkScrollableFrame(self.inst_table_frame, fg_color="transparent")
+            scroll.pack(fill="both", expand=True)
+            
+            for r_idx, tx in enumerate(rows):
+                bg = C_CARD if r_idx % 2 == 0 else "#252f45"
+                row = ctk.CTkFrame(scroll, fg_color=bg, corner_radius=0)
+                row.pack(fill="x")
+                c_val = C_GREEN if tx['type'] == "Buy" else C_RED
+                
+                vals = [tx['date'], tx['type'], tx['insider'][:18]]
+                if show_role: vals.append(tx.get('role', '-')[:15])
+                vals.extend([tx['shares'], tx['price'], tx['value']])
+                
+                for c_idx, val in enumerate(vals):
+                    txt_col = c_val if cols[c_idx] == "Type" else "#e2e8f0"
+                    ctk.CTkLabel(row, text=str(val), font=("Consolas", 11), text_color=txt_col).grid(row=0, column=c_idx, sticky="ew", padx=2, pady=5)
+                    row.grid_columnconfigure(c_idx, weight=1)
+
     def load_logo(self, website):
         try:
             if not website: return
+            import requests
+            from io import BytesIO
+            from PIL import Image
             domain = website.replace('https://', '').replace('http://', '').replace('www.', '').split('/')[0]
             url = f"https://logo.clearbit.com/{domain}"
             headers = {'User-Agent': 'Mozilla/5.0'}
@@ -542,43 +605,38 @@ class TitanApp(ctk.CTk):
     def update_chart(self, period):
         ticker = self.combo_search.get().upper().strip().replace("'", "").replace('"', "")
         if not ticker: return
+        self.chart_period = period
+        if "Chart" not in self.built_tabs: return # Drawn when the tab is first opened
+
+        # Only the newest request may draw; slower earlier ones are dropped
+        request = (ticker, period)
+        self.chart_request = request
+        max_points = self.price_chart.target_points()
         
-        def _plot():
+        def _load():
             try:
-                for widget in self.chart_frame.winfo_children(): widget.destroy()
-                if self.chart_figure: plt.close(self.chart_figure)
-
+                from logic.memory_cache import get_history
                 interval = "1d"
                 if period in ["1d", "5d"]: interval = "15m"
                 elif period in ["1mo", "3mo"]: interval = "1d"
                 elif period in ["6mo", "1y", "2y"]: interval = "1d"
                 else: interval = "1wk"
 
-                data = yf.Ticker(ticker).history(period=period, interval=interval)
-                if data.empty: 
-                    ctk.CTkLabel(self.chart_frame, text=f"No Data for {period}").pack(expand=True)
+                data = get_history(ticker, period=period, interval=interval)
+                if data.empty:
+                    self.after(0, lambda: self._show_chart(request, None, None))
                     return
-
-                fig = plt.Figure(figsize=(5, 4), dpi=100, facecolor=C_BG)
-                ax = fig.add_subplot(111)
-                ax.set_facecolor(C_BG)
-                
-                ax.plot(data.index, data['Close'], color=C_ACCENT, linewidth=1.5)
-                ax.fill_between(data.index, data['Close'], alpha=0.1, color=C_ACCENT)
-                
-                ax.grid(True, color="#334155", linestyle='--', alpha=0.3)
-                ax.tick_params(axis='x', colors='gray', rotation=0, labelsize=8)
-                ax.tick_params(axis='y', colors='gray', labelsize=8)
-                for spine in ax.spines.values(): spine.set_visible(False)
-
-                canvas = FigureCanvasTkAgg(fig, master=self.chart_frame)
-                canvas.draw()
-                canvas.get_tk_widget().pack(fill="both", expand=True)
-                self.chart_figure = fig
+                x, y = self.price_chart.prepare(data['Close'], max_points)
+                self.after(0, lambda: self._show_chart(request, x, y))
 
             except Exception as e: print(f"Chart Error: {e}")
 
-        threading.Thread(target=_plot, daemon=True).start()
+        threading.Thread(target=_load, daemon=True).start()
+
+    def _show_chart(self, request, x, y):
+        if request != self.chart_request: return
+        if x is None: self.price_chart.show_message(f"No Data for {request[1]}")
+        else: self.price_chart.show(x, y)
 
     # --- UTILS ---
     def load_json(self, filename, is_list=True):
@@ -601,7 +659,10 @@ class TitanApp(ctk.CTk):
         if not self.current_data: return
         ticker = self.current_data['ticker']
         if any(x['ticker'] == ticker for x in self.watchlist): return
-        self.watchlist.append({"ticker": ticker, "score": self.current_data['score']})
+        item = {"ticker": ticker, "score": self.current_data['score'],
+                "price": self.current_data.get('price', 0), "fcf_per_share": self.current_data.get('fcf_per_share', 0)}
+        self.update_implied_growth([item])
+        self.watchlist.append(item)
         self.save_json(WATCHLIST_FILE, self.watchlist)
         self.update_watchlist_ui()
 
@@ -612,16 +673,59 @@ class TitanApp(ctk.CTk):
         self.save_json(WATCHLIST_FILE, self.watchlist)
         self.update_watchlist_ui()
 
+    def sort_watchlist(self, key):
+        # Same header again flips the direction; numbers start high, tickers start at A
+        if self.watch_sort and self.watch_sort[0] == key: self.watch_sort = (key, not self.watch_sort[1])
+        else: self.watch_sort = (key, key != "ticker")
+        titles = {k: text for k, text, _ in WATCH_COLUMNS}
+        for k, b in self.watch_sort_btns.items():
+            text = titles[k]
+            if k == key: text += " ▼" if self.watch_sort[1] else " ▲"
+            b.configure(text=text, text_color=C_ACCENT if k == key else C_TEXT_SUB)
+        self.update_watchlist_ui()
+
+    def sorted_watchlist(self):
+        if not self.watch_sort: return self.watchlist
+        key, desc = self.watch_sort
+        if key == "ticker": return sorted(self.watchlist, key=lambda x: x['ticker'], reverse=desc)
+        # Rows without a value stay at the bottom either way
+        known = [x for x in self.watchlist if x.get(key) is not None]
+        return sorted(known, key=lambda x: x[key], reverse=desc) + [x for x in self.watchlist if x.get(key) is None]
+
+    def update_implied_growth(self, items):
+        # Reverse DCF for all rows in one array call (default discount rate / terminal multiple)
+        if not items: return
+        from logic.dcf import TitanDCF
+        growth = TitanDCF.implied_growth([x.get('price') or 0 for x in items], [x.get('fcf_per_share') or 0 for x in items])
+        for item, g in zip(items, growth):
+            item['implied_growth'] = None if g != g else round(float(g), 4) # NaN: no positive FCF / out of range
+
     def update_watchlist_ui(self):
-        for w in self.scroll_watch.winfo_children(): w.destroy()
-        for item in self.watchlist:
-            sc = item.get('score', 0)
-            col = C_GREEN if sc >= 60 else C_RED if sc < 40 else C_YELLOW
-            f = ctk.CTkFrame(self.scroll_watch, fg_color="transparent")
-            f.pack(fill="x", pady=1)
-            btn = ctk.CTkButton(f, text=f"{item['ticker']}", command=lambda t=item['ticker']: self.load_ticker_from_watch(t), fg_color=C_CARD, anchor="w", height=35, font=("Arial", 12, "bold"))
-            btn.pack(side="left", fill="x", expand=True)
-            ctk.CTkLabel(f, text=str(sc), width=30, fg_color=col, text_color="black", corner_radius=4).pack(side="right", padx=(5,0))
+        # Membership or order changed; the view recycles its rows (ui/watchlist.py)
+        self.watch_view.set_items(self.sorted_watchlist())
+
+    def patch_watch_row(self, item):
+        # One item's values changed (used while a refresh streams in)
+        self.watch_view.patch(item)
+
+    def watch_row_cells(self, item):
+        # What a sidebar row shows for an item: text, score + colour, implied growth + colour
+        sc = item.get('score', 0)
+        col = C_GREEN if sc >= 60 else C_RED if sc < 40 else C_YELLOW
+        trend = {"Bullish": " ▲", "Bearish": " ▼"}.get(item.get('status'), "")
+        g = item.get('implied_growth')
+        g_col = C_TEXT_SUB if g is None else C_RED if g > 0.25 else C_GREEN if g < 0.05 else C_TEXT_MAIN
+        return (f"{item['ticker']}{trend}", str(sc), col, "-" if g is None else f"{g * 100:+.1f}%", g_col)
+
+    def score_breakdown(self):
+        # Tooltip text, built on hover from the stored band indices
+        data = self.current_data
+        if not data: return "No Analysis Loaded"
+        if 'score_detail' in data:
+            from logic.scoring import TitanScoring
+            _, breakdown = TitanScoring.explain(data['score_detail'], "titan")
+            return "\n".join(breakdown)
+        return data.get('breakdown', "No Analysis Loaded") # Entries cached before score_detail
 
     def load_ticker_from_watch(self, ticker):
         self.combo_search.set(ticker)
@@ -632,24 +736,65 @@ class TitanApp(ctk.CTk):
         threading.Thread(target=self._refresh_thread, daemon=True).start()
 
     def _refresh_thread(self):
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            futures = {executor.submit(self._fetch_score_only, item['ticker']): item for item in self.watchlist}
-            for future in concurrent.futures.as_completed(futures):
-                try:
-                    res = future.result()
-                    if res: futures[future]['score'] = res
-                except: pass
+        from logic.data_provider import get_provider
+        from logic.technicals import TitanTechnicals
+        from logic.sentiment import TitanSentiment
+        items = {item['ticker']: item for item in self.watchlist}
+        tickers = list(items)
+
+        # One batched history download for the whole watchlist, then technicals from that frame
+        try:
+            prices = get_provider().download(tickers, period="1y")
+            techs = TitanTechnicals.analyze_batch(prices)
+        except Exception as e:
+            print(f"Batch Download Error: {e}")
+            techs = {}
+        for t, tech in techs.items():
+            if not tech or t not in items: continue
+            items[t]['status'] = tech['status']
+            if t in self.cache: self.cache.put_section(t, "technicals", {"tech": tech})
+            self.after(0, lambda item=items[t]: self.patch_watch_row(item))
+
+        # News for cached tickers whose sentiment expired: all feeds at once (conditional GET),
+        # new headlines scored in one batch
+        news_due = [t for t in tickers if t in self.cache and "sentiment" in self.cache.stale_sections(t)]
+        if news_due:
+            for t, sentiment in TitanSentiment.analyze_many(news_due).items():
+                self.cache.put_section(t, "sentiment", {"sentiment": sentiment}, merge=False)
+
+        # Scores: bounded, rate-limited workers; each row updates as soon as its ticker lands
+        done = [0]
+        def on_result(t, result):
+            items[t].update(result)
+            on_done()
+            self.after(0, lambda item=items[t]: self.patch_watch_row(item))
+        def on_error(t, e):
+            print(f"Refresh Error ({t}): {e}")
+            on_done()
+        def on_done():
+            done[0] += 1
+            text = f"Refreshing {done[0]}/{len(tickers)}..."
+            self.after(0, lambda: self.btn_refresh_all.configure(text=text))
+
+        _, errors = TitanScheduler().run(tickers, self._fetch_score_only, on_result, on_error)
+        if errors: print(f"Refresh finished with {len(errors)} failed tickers: {', '.join(sorted(errors))}")
+        # Implied growth for the whole watchlist at once, then one redraw (the sort may have changed)
+        self.update_implied_growth(self.watchlist)
         self.save_json(WATCHLIST_FILE, self.watchlist)
         self.after(0, self.update_watchlist_ui)
         self.after(0, lambda: self.btn_refresh_all.configure(state="normal", text="↻ REFRESH ALL"))
 
     def _fetch_score_only(self, ticker):
-        try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
-            score, _, _, _ = TitanFundamentals.calculate_score(info)
-            return score
-        except: return None
+        from logic.data_provider import get_provider
+        from logic.scoring import TitanScoring
+        from logic.pipeline import TitanPipeline
+        info = get_provider().info(ticker)
+        if not info: raise Exception(f"No data found for {ticker}")
+        TitanPipeline.record_snapshot(ticker, info)
+        # Score only (the breakdown text is never shown for sidebar rows), plus the reverse DCF inputs
+        return {"score": int(TitanScoring.score_frame([info], "titan")["score"].iloc[0]),
+                "price": info.get('currentPrice', info.get('regularMarketPrice', 0)) or 0,
+                "fcf_per_share": TitanPipeline.fcf_per_share(info)}
 
 if __name__ == "__main__":
     app = TitanApp()
@@ -0,0 +1,181 @@
+import argparse
+import json
+import os
+import sys
+import time
+import concurrent.futures
+import pandas as pd
+
+# --- HEADLESS BATCH SCREENER ---
+# Same fundamentals / technicals / sentiment / insider pipeline as the GUI's fetch_data,
+# without customtkinter, matplotlib or PIL. Usage:
+#   python screener.py universe.txt -o ranked.csv --workers 8
+# The universe is a text file (tickers separated by lines, commas or spaces; '#' starts a
+# comment), a CSV with a Ticker/Symbol column, or a watchlist JSON.
+# Every fetch is also recorded in the snapshot history, so score drift can be queried
+# later without downloading anything:
+#   python screener.py universe.txt --from-history --min-score-change 20 --change-days 90
+
+from logic.data_provider import get_provider
+from logic.technicals import TitanTechnicals
+from logic.pipeline import TitanPipeline
+from logic.scheduler import rate_limiter, RATE_PER_SEC, BURST
+from logic.feeds import feed_limiter, FEED_RATE, FEED_BURST
+from logic.scoring import TitanScoring
+from logic.snapshots import get_snapshot_store
+
+WORKER_SECTIONS = ("info", "sentiment", "institutional")
+CHANGE_DAYS = 90 # Default score-change window (a quarter)
+
+def load_universe(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".json":
+        with open(path, 'r') as f: items = json.load(f)
+        tickers = [i['ticker'] if isinstance(i, dict) else i for i in items]
+    elif ext == ".csv":
+        df = pd.read_csv(path)
+        col = next((c for c in df.columns if c.strip().lower() in ("ticker", "symbol")), df.columns[0])
+        tickers = df[col].dropna().astype(str).tolist()
+    else:
+        tickers = []
+        with open(path, 'r') as f:
+            for line in f:
+                tickers += line.split('#', 1)[0].replace(',', ' ').split()
+    return list(dict.fromkeys(t.strip().upper() for t in tickers if t.strip()))
+
+# --- Worker process side ---
+def init_worker(workers):
+    # The rate budget is per process, so each worker gets its share of it
+    rate_limiter.configure(RATE_PER_SEC / workers, max(1, BURST // workers))
+    feed_limiter.configure(FEED_RATE / workers, max(1, FEED_BURST // workers))
+
+def screen_ticker(ticker, sections):
+    data = TitanPipeline.fetch(ticker, sections=sections)
+    row = {"ticker": ticker}
+    if "score" in data:
+        row.update({
+            "name": data.get("name"),
+            "price": data.get("price"),
+            "pct_change": data.get("pct_change"),
+            "score": data.get("score"),
+            "tier": data.get("tier")
+        })
+        for label, value in data.get("metrics", {}).items(): row[label] = value
+    if "sentiment" in data:
+        row["sentiment"] = data["sentiment"]["rating"]
+        row["sentiment_score"] = data["sentiment"]["score"]
+        row["headlines"] = len(data["sentiment"]["headlines"])
+    if "institutional" in data:
+        row["insider_signal"] = data["institutional"]["signal"]
+        row["insider_net_flow"] = data["institutional"]["net_flow"]
+    return row
+
+# --- Parent process side ---
+def screen_technicals(tickers):
+    # One batched download for the whole universe, every indicator in one array pass
+    try:
+        prices = get_provider().download(tickers, period="1y")
+        if prices is None or prices.empty: return pd.DataFrame()
+        table = TitanTechnicals.analyze_matrix(prices['Close'])
+    except Exception as e:
+        print(f"Technicals Error: {e}", file=sys.stderr)
+        return pd.DataFrame()
+    table = table.drop(columns=["signals"]).rename(columns={"status": "trend", "price": "last_close"})
+    table.index.name = "ticker"
+    return table
+
+def screen(tickers, workers, sections=WORKER_SECTIONS, technicals=True, progress=True, change_days=CHANGE_DAYS):
+    tech = screen_technicals(tickers) if technicals else pd.DataFrame()
+
+    rows, errors = [], {}
+    started = time.time()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                                                initargs=(workers,)) as executor:
+        futures = {executor.submit(screen_ticker, t, sections): t for t in tickers}
+        for i, future in enumerate(concurrent.futures.as_completed(futures), 1):
+            t = futures[future]
+            try:
+                rows.append(future.result())
+            except Exception as e:
+                errors[t] = e
+            if progress and (i % 25 == 0 or i == len(futures)):
+                print(f"Screened {i}/{len(futures)} ({time.time() - started:.0f}s)", file=sys.stderr)
+
+    results = (pd.DataFrame(rows) if rows else pd.DataFrame(columns=["ticker"])).set_index("ticker")
+    if not tech.empty: results = results.join(tech) # Failed tickers are reported, not ranked
+    return rank(with_score_change(results, change_days)), errors
+
+def screen_history(tickers, change_days=CHANGE_DAYS):
+    # Latest stored snapshot of every ticker, scored in one pass with the current rules; no network
+    latest = get_snapshot_store().latest(tickers)
+    if not latest: return rank(pd.DataFrame(columns=["score"], index=pd.Index([], name="ticker")))
+    names = list(latest)
+    infos = [latest[t][1] for t in names]
+    scored = TitanScoring.score_frame(infos, "titan")
+    results = pd.DataFrame({
+        "name": [i.get('shortName') for i in infos],
+        "price": [i.get('currentPrice', i.get('regularMarketPrice')) for i in infos],
+        "score": scored["score"].astype(int).to_numpy(),
+        "tier": scored["tier"].to_numpy(),
+        "snapshot": pd.to_datetime([latest[t][0] for t in names], unit='s')
+    }, index=pd.Index(names, name="ticker"))
+    return rank(with_score_change(results, change_days))
+
+def with_score_change(results, days):
+    # Score now vs `days` ago, from the snapshot history (rescored with the current rules)
+    if results.empty: return results
+    try:
+        change = get_snapshot_store().score_change(results.index, days=days)
+    except Exception as e:
+        print(f"Score History Error: {e}", file=sys.stderr)
+        return results
+    return results.join(change[["score_then", "score_change", "since"]])
+
+def rank(results):
+    # Fundamentals score first, then news tone as the tie-breaker
+    keys = [c for c in ("score", "sentiment_score") if c in results.columns]
+    if keys: results = results.sort_values(keys, ascending=False, na_position='last')
+    results.insert(0, "rank", range(1, len(results) + 1))
+    return results
+
+def write_results(results, path):
+    if path.lower().endswith(".parquet"): results.to_parquet(path)
+    else: results.to_csv(path)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Titan headless screener")
+    parser.add_argument("universe", help="Ticker list (.txt, .csv or watchlist .json)")
+    parser.add_argument("-o", "--out", default="titan_screen.csv", help="Output file (.csv or .parquet)")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 4, help="Worker processes")
+    parser.add_argument("--skip", nargs="*", default=[], choices=["technicals", "sentiment", "institutional"],
+                        help="Sections to leave out")
+    parser.add_argument("--from-history", action="store_true", help="Rank the stored snapshots instead of fetching")
+    parser.add_argument("--change-days", type=int, default=CHANGE_DAYS, help="Window for the score_change column")
+    parser.add_argument("--min-score-change", type=float, help="Keep only tickers whose score rose at least this much")
+    parser.add_argument("--quiet", action="store_true", help="No progress output")
+    args = parser.parse_args(argv)
+
+    tickers = load_universe(args.universe)
+    if not tickers:
+        print(f"No tickers in {args.universe}", file=sys.stderr)
+        return 1
+    workers = max(1, min(args.workers, len(tickers)))
+    sections = tuple(s for s in WORKER_SECTIONS if s not in args.skip)
+
+    if args.from_history: results, errors = screen_history(tickers, args.change_days), {}
+    else: results, errors = screen(tickers, workers, sections, "technicals" not in args.skip, not args.quiet, args.change_days)
+    for t, e in sorted(errors.items()): print(f"Screen Error ({t}): {e}", file=sys.stderr)
+    if args.min_score_change is not None:
+        changed = results["score_change"] if "score_change" in results.columns else pd.Series(index=results.index, dtype=float)
+        results = results[changed >= args.min_score_change]
+        results = results.assign(rank=range(1, len(results) + 1))
+    try:
+        write_results(results, args.out)
+    except Exception as e:
+        print(f"Write Error: {e}", file=sys.stderr)
+        return 1
+    print(f"Wrote {len(results)} tickers to {args.out} ({len(errors)} failed)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+import pytest
+from logic.backtest import TitanBacktest
+from logic.technicals import TitanTechnicals
+
+FIELDS = {"price": "price", "rsi": "rsi", "sma50": "sma50", "sma200": "sma200", "upper_bb": "upper_bb",
+          "lower_bb": "lower_bb", "macd": "macd", "signal": "macd_signal"}
+
+def closes(seed=0, bars=320, tickers=("A", "B", "C")):
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("2022-01-03", periods=bars)
+    walk = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, (bars, len(tickers))), axis=0))
+    return pd.DataFrame(walk, index=index, columns=list(tickers))
+
+def assert_row_matches(ind, masks, row, col, ref):
+    for key, field in FIELDS.items():
+        assert ind[key][row, col] == pytest.approx(ref[field], rel=1e-8, abs=1e-8), key
+    hit = [n for n in TitanTechnicals.signal_bias if masks[n][row, col]]
+    assert hit == ref["signals"]
+    status = "Bullish" if masks["Status: Bullish"][row, col] else "Bearish" if masks["Status: Bearish"][row, col] else "Neutral"
+    assert status == ref["status"]
+
+@pytest.mark.parametrize("seed", range(3))
+def test_last_row_matches_analyze_close(seed):
+    frame = closes(seed)
+    frame.iloc[:40, 2] = np.nan # Listed later
+    x = frame.to_numpy()
+    ind = TitanBacktest.indicators(x)
+    masks, _, _ = TitanBacktest.signals(x)
+    for col, t in enumerate(frame.columns):
+        assert_row_matches(ind, masks, -1, col, TitanTechnicals.analyze_close(frame[t].dropna()))
+
+def test_every_bar_matches_analyze_close_on_its_prefix():
+    frame = closes(7, bars=260, tickers=("A",))
+    x = frame.to_numpy()
+    ind = TitanBacktest.indicators(x)
+    masks, _, ready = TitanBacktest.signals(x)
+    assert not ready[:199].any() and ready[199:].all()
+    for row in range(199, len(frame), 15):
+        assert_row_matches(ind, masks, row, 0, TitanTechnicals.analyze_close(frame["A"].iloc[:row + 1]))
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from logic.dcf import TitanDCF, DCF_YEARS
+
+def loop_value(fcf_per_share, growth_rate, discount_rate, terminal_multiple, years=DCF_YEARS):
+    # The year-by-year DCF the closed form replaced
+    if fcf_per_share <= 0: return 0
+    future_values = []
+    current_fcf = fcf_per_share
+    for i in range(1, years + 1):
+        current_fcf *= (1 + growth_rate)
+        future_values.append(current_fcf / ((1 + discount_rate) ** i))
+    terminal_val = (current_fcf * terminal_multiple) / ((1 + discount_rate) ** years)
+    return sum(future_values) + terminal_val
+
+CASES = [(2.5, 0.08, 0.10, 15), (1.0, -0.2, 0.09, 8), (4.0, 0.35, 0.12, 25), (3.0, 0.0, 0.05, 10),
+         (0.0, 0.1, 0.1, 15), (-1.0, 0.1, 0.1, 15)]
+
+@pytest.mark.parametrize("fcf,g,r,t", CASES)
+@pytest.mark.parametrize("years", [1, 5, DCF_YEARS])
+def test_value_matches_loop(fcf, g, r, t, years):
+    assert TitanDCF.value(fcf, g, r, t, years) == pytest.approx(loop_value(fcf, g, r, t, years), rel=1e-12)
+
+@pytest.mark.parametrize("rate", [0.0, 0.07, 0.1, 0.25])
+def test_value_where_growth_equals_discount(rate):
+    # q == 1: the geometric sum degenerates to `years` terms of fcf
+    assert TitanDCF.value(2.0, rate, rate, 15) == pytest.approx(loop_value(2.0, rate, rate, 15), rel=1e-12)
+    assert TitanDCF.value(2.0, rate + 1e-13, rate, 15) == pytest.approx(loop_value(2.0, rate + 1e-13, rate, 15), rel=1e-9)
+
+def test_grid_matches_loop():
+    growths, discounts, terminals = [-0.1, 0.0, 0.1, 0.2], [0.08, 0.1, 0.12], [10, 15, 20]
+    cube = TitanDCF.grid(3.0, growths, discounts, terminals)
+    assert cube.shape == (4, 3, 3)
+    for i, g in enumerate(growths):
+        for j, r in enumerate(discounts):
+            for k, t in enumerate(terminals):
+                assert cube[i, j, k] == pytest.approx(loop_value(3.0, g, r, t), rel=1e-12)
+
+def test_implied_growth_round_trips_through_value():
+    rng = np.random.default_rng(0)
+    fcf = rng.uniform(0.5, 10, 200)
+    growth = rng.uniform(-0.3, 0.6, 200)
+    price = TitanDCF.value(fcf, growth, 0.10, 15)
+    implied = TitanDCF.implied_growth(price, fcf)
+    np.testing.assert_allclose(implied, growth, atol=1e-10)
+    np.testing.assert_allclose(TitanDCF.value(fcf, implied, 0.10, 15), price, rtol=1e-10)
+
+def test_implied_growth_outside_range_is_nan():
+    price = [0, 10, TitanDCF.value(1.0, 2.0, 0.10, 15), TitanDCF.value(1.0, -0.9, 0.10, 15)]
+    out = TitanDCF.implied_growth(price, [1.0, -1.0, 1.0, 1.0])
+    assert np.isnan(out).all()
+    assert TitanDCF.implied_growth(TitanDCF.value(2.0, 0.12, 0.09, 20), 2.0, 0.09, 20) == pytest.approx(0.12, abs=1e-10)
@@ -0,0 +1,48 @@
+import json
+import numpy as np
+import pandas as pd
+import pytest
+import logic.indicators as indicators
+from logic.indicators import TitanIndicatorState
+from logic.technicals import TitanTechnicals
+
+FIELDS = ["price", "rsi", "sma50", "sma200", "upper_bb", "lower_bb", "macd", "macd_signal"]
+
+def closes(seed=0, bars=300):
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("2023-01-02", periods=bars, tz="America/New_York")
+    return pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.02, bars))), index=index)
+
+def assert_matches(tech, ref):
+    for f in FIELDS: assert tech[f] == pytest.approx(ref[f], rel=1e-9, abs=1e-9), f
+    assert tech["signals"] == ref["signals"]
+    assert tech["status"] == ref["status"]
+
+@pytest.mark.parametrize("seed", range(3))
+def test_push_after_round_trip_matches_full_recompute(seed):
+    close = closes(seed)
+    state = TitanIndicatorState.from_series(close.iloc[:230])
+    state = TitanIndicatorState.from_dict(json.loads(json.dumps(state.to_dict())))
+    for when, value in close.iloc[230:-1].items(): state.push(value, when)
+    # Committed bars only, and with the last bar previewed as still forming
+    assert_matches(state.snapshot(), TitanTechnicals.analyze_close(close.iloc[:-1]))
+    assert_matches(state.snapshot(close.iloc[-1]), TitanTechnicals.analyze_close(close))
+
+def test_refresh_rebuilds_after_history_rewrite(monkeypatch):
+    close = closes(4)
+    history = {"close": close.iloc[:250]}
+    monkeypatch.setattr(indicators, "get_history", lambda ticker, period="1y": pd.DataFrame({"Close": history["close"]}))
+    _, state_dict = TitanIndicatorState.refresh("TEST")
+
+    # New bars on an unchanged history: extended incrementally
+    history["close"] = close.iloc[:270]
+    assert TitanIndicatorState.from_dict(state_dict).continues(history["close"])
+    tech, _ = TitanIndicatorState.refresh("TEST", state_dict)
+    assert_matches(tech, TitanTechnicals.analyze_close(history["close"]))
+
+    # Adjusted history (2:1 split) plus new bars: the cached state no longer continues it
+    history["close"] = close * 0.5
+    assert not TitanIndicatorState.from_dict(state_dict).continues(history["close"])
+    tech, rebuilt = TitanIndicatorState.refresh("TEST", state_dict)
+    assert_matches(tech, TitanTechnicals.analyze_close(history["close"]))
+    assert rebuilt["last_close"] == pytest.approx(history["close"].iloc[-2])
@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+from logic.scoring import TitanScoring, RULESETS
+
+BASE = {"currentPrice": 100.0, "fiftyTwoWeekHigh": 110.0, "returnOnEquity": 0.2, "operatingMargins": 0.2,
+        "debtToEquity": 50.0, "currentRatio": 1.5, "pegRatio": 1.2, "trailingPE": 20.0, "earningsGrowth": 0.1}
+
+@pytest.mark.parametrize("ruleset", list(RULESETS))
+def test_string_only_columns_count_as_missing(ruleset):
+    # Every metric column holds only strings (pandas 3 string dtype)
+    infos = [{k: v for k, v in dict(BASE, **{m: "N/A" for m in BASE}).items()} for _ in range(3)]
+    frame = TitanScoring.score_frame(infos, ruleset)
+    blank = TitanScoring.score_frame([{}] * 3, ruleset)
+    assert frame["score"].tolist() == blank["score"].tolist()
+
+@pytest.mark.parametrize("ruleset", list(RULESETS))
+def test_mixed_columns_keep_numbers_only(ruleset):
+    infos = [BASE, dict(BASE, trailingPE="N/A", debtToEquity="Infinity", pegRatio=None), dict(BASE, currentRatio="-")]
+    frame = TitanScoring.score_frame(infos, ruleset)
+    for info, score in zip(infos, frame["score"]):
+        clean = {k: v for k, v in info.items() if isinstance(v, (int, float))}
+        assert score == TitanScoring.score_frame([clean], ruleset)["score"].iloc[0]
+
+def test_score_one_with_placeholder_string():
+    TitanScoring.score_one(dict(BASE, trailingPE="N/A"), "titan")
+    metrics = TitanScoring.metric_frame([dict(BASE, debtToEquity="Infinity")], numeric_only=False)
+    assert np.isfinite(metrics["debt_to_equity"]).all()
@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+import pytest
+from logic.technicals import TitanTechnicals
+
+FIELDS = ["price", "rsi", "sma50", "sma200", "upper_bb", "lower_bb", "macd", "macd_signal"]
+
+def closes(seed=0, bars=300, tickers=("A", "B", "C")):
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("2023-01-02", periods=bars)
+    walk = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, (bars, len(tickers))), axis=0))
+    return pd.DataFrame(walk, index=index, columns=list(tickers))
+
+def assert_matches(row, ref):
+    for f in FIELDS: assert row[f] == pytest.approx(ref[f], rel=1e-9, abs=1e-9), f
+    assert row["signals"] == ref["signals"]
+    assert row["status"] == ref["status"]
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matrix_matches_analyze_close(seed):
+    frame = closes(seed)
+    out = TitanTechnicals.analyze_matrix(frame)
+    for t in frame.columns: assert_matches(out.loc[t], TitanTechnicals.analyze_close(frame[t]))
+
+def test_matrix_with_nan_padded_columns():
+    frame = closes(1, tickers=("FULL", "LISTED", "HALTED", "SHORT"))
+    frame.iloc[:60, 1] = np.nan       # Listed later
+    frame.iloc[100:110, 2] = np.nan   # Halted mid-history
+    frame.iloc[:150, 3] = np.nan      # Fewer than 200 bars
+    out = TitanTechnicals.analyze_matrix(frame)
+    assert list(out.index) == ["FULL", "LISTED", "HALTED"]
+    for t in out.index: assert_matches(out.loc[t], TitanTechnicals.analyze_close(frame[t].dropna()))
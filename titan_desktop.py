@@ -1,5 +1,5 @@
 import customtkinter as ctk
-import yfinance as yf
+import tkinter as tk
 import threading
 import json
 import os
@@ -11,6 +11,11 @@ import numpy as np
 import requests
 from PIL import Image
 from io import BytesIO
+from logic.data_provider import get_provider
+from logic.memory_cache import get_info
+from logic.scheduler import TitanScheduler
+from logic.scoring import TitanScoring
+from logic.dcf import TitanDCF, MC_PATHS
 
 # --- Configuration ---
 ctk.set_appearance_mode("Dark")
@@ -18,116 +23,44 @@ ctk.set_default_color_theme("dark-blue")
 
 DATA_FILE = "titan_watchlist.json"
 
+# --- VS Mode ---
+# (label, info key, higher is better, large number)
+VS_METRICS = [
+    ("Market Cap", 'marketCap', True, True),
+    ("P/E Ratio", 'trailingPE', False, False),
+    ("PEG Ratio", 'manualPEG', False, False),
+    ("ROE", 'returnOnEquity', True, False),
+    ("Gross Margin", 'grossMargins', True, False),
+    ("Rev Growth", 'revenueGrowth', True, False),
+    ("Debt/Equity", 'debtToEquity', False, False)
+]
+VS_MAX_WORKERS = 32 # Lookups in flight; the shared rate limiter still paces the network calls
+
+# --- DCF Sensitivity Heatmap ---
+# Offsets around the current inputs: growth rows x discount-rate columns, evaluated
+# over a range of terminal multiples in one TitanDCF.grid call
+HEAT_GROWTH_STEPS = np.arange(-10, 11, 2) / 100   # +/-10pp
+HEAT_DISCOUNT_STEPS = np.arange(-4, 5, 1) / 100   # +/-4pp
+HEAT_TERMINAL_SCALE = np.linspace(0.5, 1.5, 11)   # x terminal multiple
+HEAT_CELL_W, HEAT_CELL_H, HEAT_LABEL_W = 62, 22, 70
+
+def heat_color(upside):
+    # -50% red .. fair value slate .. +50% green
+    t = max(-1.0, min(1.0, upside / 0.5))
+    base, end = (51, 65, 85), ((74, 222, 128) if t > 0 else (239, 68, 68))
+    return "#%02x%02x%02x" % tuple(int(b + (e - b) * abs(t)) for b, e in zip(base, end))
+
 # --- Scoring & Logic Engine ---
 class TitanLogic:
     @staticmethod
     def calculate_score(info):
-        score = 0
-        max_score = 0
-        flags = []
-        breakdown = [] 
-
-        def get(key, default=0):
-            val = info.get(key)
-            return val if val is not None else default
-
-        def add_points(category, points, reason, description=""):
-            nonlocal score, max_score
-            max_score += category
-            if points > 0:
-                score += points
-                # CK3 Style: Icon, Title, Description
-                breakdown.append(f"✅ {reason} (+{points})\n    └ {description}")
-            else:
-                breakdown.append(f"⚪ {reason} (0)\n    └ {description}")
-
-        # --- 1. QUALITY (Moat & Efficiency) ---
-        breakdown.append("--- 🛡️ MOAT & QUALITY ---")
-        
-        roe = get('returnOnEquity', 0) * 100
-        if roe > 20: add_points(20, 20, "Elite ROE", f"Return on Equity is {roe:.1f}%, showing elite capital efficiency.")
-        elif roe > 12: add_points(20, 12, "Solid ROE", f"ROE is {roe:.1f}%, which is respectable.")
-        else: add_points(20, 0, "Weak ROE", f"ROE of {roe:.1f}% suggests inefficient use of capital.")
-        
-        op_margin = get('operatingMargins', 0) * 100
-        if op_margin > 20: add_points(10, 10, "High Margins", f"Operating Margin of {op_margin:.1f}% indicates pricing power.")
-        elif op_margin > 10: add_points(10, 5, "Decent Margins", f"Operating Margin is {op_margin:.1f}%.")
-        else: add_points(10, 0, "Low Margins", f"Razor thin margins of {op_margin:.1f}%.")
-
-        # --- 2. SAFETY (Fortress) ---
-        breakdown.append("\n--- 🏰 FINANCIAL FORTRESS ---")
-        
-        debt_eq = get('debtToEquity', 1000)
-        if debt_eq < 50: add_points(15, 15, "Fortress Balance Sheet", f"Debt/Equity is only {debt_eq:.0f}%. Minimal leverage.")
-        elif debt_eq < 100: add_points(15, 10, "Manageable Debt", f"Debt/Equity is {debt_eq:.0f}%. Standard leverage.")
-        else: 
-            add_points(15, 0, "High Leverage", f"Debt/Equity is {debt_eq:.0f}%. Risk in high rate environments.")
-            if debt_eq > 200: flags.append(f"High Debt/Eq ({debt_eq:.0f}%)")
-
-        current_ratio = get('currentRatio', 0)
-        if current_ratio > 1.5: add_points(15, 15, "High Liquidity", f"Current Ratio {current_ratio:.2f}x. Can pay short term debts easily.")
-        elif current_ratio > 1.0: add_points(15, 10, "Safe Liquidity", f"Current Ratio {current_ratio:.2f}x.")
-        else: 
-            add_points(15, 0, "Liquidity Crunch", f"Current Ratio {current_ratio:.2f}x. Liabilities exceed assets.")
-            if current_ratio < 0.8: flags.append(f"Liquidity Risk ({current_ratio:.2f}x)")
-
-        # --- 3. VALUATION ---
-        breakdown.append("\n--- ⚡ VALUATION ---")
-        
-        # Manual PEG Fallback
-        peg = get('pegRatio', 0)
-        if peg == 0 or peg is None: 
-            pe = get('trailingPE', 0)
-            growth = get('earningsGrowth', 0)
-            if pe > 0 and growth > 0: peg = pe / (growth * 100)
-        
-        if 0 < peg < 1.0: add_points(20, 20, "Undervalued Growth", f"PEG {peg:.2f} implies growth is cheap.")
-        elif 0 < peg < 1.5: add_points(20, 15, "Fair Value", f"PEG {peg:.2f} is reasonable.")
-        elif peg < 2.5: add_points(20, 5, "Premium Pricing", f"PEG {peg:.2f} is expensive.")
-        else: 
-            add_points(20, 0, "Overvalued", f"PEG {peg:.2f} is very high.")
-            if peg > 4.0: flags.append(f"Extreme Valuation (PEG {peg:.2f})")
-
-        # --- 4. MOMENTUM ---
-        breakdown.append("\n--- 📈 MOMENTUM ---")
-        
-        price = get('currentPrice', 0)
-        high52 = get('fiftyTwoWeekHigh', price)
-        if high52:
-            dist = price / high52
-            if dist > 0.85: add_points(20, 20, "Strong Trend", "Trading near 52-week highs.")
-            elif dist > 0.70: add_points(20, 10, "Consolidating", "Trading within 30% of highs.")
-            else: 
-                add_points(20, 0, "Downtrend", "Trading >30% below highs (Falling Knife?).")
-                flags.append("Weak Momentum")
-
-        final_score = int((score / max_score) * 100) if max_score > 0 else 0
-        
-        tier = "Speculative"
-        if final_score >= 85: tier = "💎 ELITE GEM"
-        elif final_score >= 70: tier = "🥇 High Quality"
-        elif final_score >= 55: tier = "🥈 Investable"
-        elif final_score >= 40: tier = "🥉 Average"
-        else: tier = "⚠️ AVOID"
-
-        return final_score, tier, flags, breakdown
+        # Rules live in logic/scoring.py ("desktop" ruleset)
+        return TitanScoring.score_one(info, "desktop")
 
     @staticmethod
     def calculate_reverse_dcf(price, fcf_per_share, growth_rate=0.0, discount_rate=0.10, terminal_multiple=15, years=10):
-        if fcf_per_share <= 0: return 0
-        
-        future_values = []
-        current_fcf = fcf_per_share
-        
-        for i in range(1, years + 1):
-            current_fcf *= (1 + growth_rate)
-            discounted = current_fcf / ((1 + discount_rate) ** i)
-            future_values.append(discounted)
-        
-        # Terminal Value
-        terminal_val = (current_fcf * terminal_multiple) / ((1 + discount_rate) ** years)
-        intrinsic_value = sum(future_values) + terminal_val
-        return intrinsic_value
+        # Closed form, see logic/dcf.py
+        return TitanDCF.value(fcf_per_share, growth_rate, discount_rate, terminal_multiple, years)
 
 # --- CUSTOM TOOLTIP (CK3 Style) ---
 class ToolTip(object):
@@ -305,6 +238,10 @@ class TitanApp(ctk.CTk):
         self.vs_scroll.pack(fill="both", expand=True, padx=10, pady=10)
         self.vs_container = ctk.CTkFrame(self.vs_scroll, fg_color="transparent")
         self.vs_container.pack(fill="both", expand=True)
+        self.vs_cols = {}   # ticker -> {"header": label, info key: label}
+        self.vs_values = {} # ticker -> {info key: value}, None while loading / failed
+        self.vs_colors = {} # label -> current text colour, so highlighting only touches changed cells
+        self.vs_run = 0
 
     def create_dcf_tab(self):
         f = ctk.CTkFrame(self.tab_dcf, fg_color="transparent")
@@ -330,6 +267,25 @@ class TitanApp(ctk.CTk):
         self.lbl_dcf_result = ctk.CTkLabel(f, text="---", font=("Arial", 24, "bold"))
         self.lbl_dcf_result.pack()
 
+        # Monte Carlo around the same inputs
+        self.btn_mc = ctk.CTkButton(f, text=f"MONTE CARLO ({MC_PATHS:,} PATHS)", command=self.run_monte_carlo, fg_color="#334155", height=32)
+        self.btn_mc.pack(fill="x", pady=(15, 5))
+        self.lbl_mc = ctk.CTkLabel(f, text="", font=("Consolas", 12), justify="left")
+        self.lbl_mc.pack(anchor="w")
+
+        # Sensitivity heatmap, redrawn live while the inputs are edited
+        ctk.CTkLabel(f, text="Sensitivity: intrinsic value by growth (rows) and discount rate (columns)", text_color="gray").pack(anchor="w", pady=(20, 5))
+        self.dcf_canvas = tk.Canvas(f, bg="#0f172a", highlightthickness=0,
+                                    width=HEAT_LABEL_W + HEAT_CELL_W * len(HEAT_DISCOUNT_STEPS),
+                                    height=HEAT_CELL_H * (len(HEAT_GROWTH_STEPS) + 1))
+        self.dcf_canvas.pack(anchor="w")
+        self.lbl_dcf_range = ctk.CTkLabel(f, text="", text_color="gray")
+        self.lbl_dcf_range.pack(anchor="w")
+        self.heat_items = None
+        self.dcf_after = None
+        for entry in self.dcf_inputs.values():
+            entry.bind("<KeyRelease>", lambda e: self.schedule_dcf_heatmap())
+
     def create_insiders_tab(self):
         # Header Row
         header = ctk.CTkFrame(self.tab_insiders, fg_color="#1e293b", height=30)
@@ -367,8 +323,8 @@ class TitanApp(ctk.CTk):
 
     def fetch_data(self, ticker):
         try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            provider = get_provider()
+            info = get_info(ticker) # Shared with VS mode, so the comparison starts with this ticker cached
             self.current_info = info
             if not info or ('regularMarketPrice' not in info and 'currentPrice' not in info):
                 raise Exception("No data found")
@@ -402,9 +358,10 @@ class TitanApp(ctk.CTk):
             # Financial Trends
             trends_data = {}
             try:
-                fin = stock.financials
-                bal = stock.balance_sheet
-                cf = stock.cashflow
+                statements = provider.statements(ticker)
+                fin = statements['financials']
+                bal = statements['balance_sheet']
+                cf = statements['cashflow']
                 if not fin.empty:
                     trends_data['net_income'] = fin.loc['Net Income'].head(3).tolist()[::-1]
                     trends_data['revenue'] = fin.loc['Total Revenue'].head(3).tolist()[::-1]
@@ -419,7 +376,7 @@ class TitanApp(ctk.CTk):
             # Insiders
             insiders_data = []
             try:
-                ins = stock.insider_transactions
+                ins = provider.insider_transactions(ticker)
                 if ins is not None and not ins.empty:
                     for index, row in ins.head(15).iterrows():
                         insiders_data.append({
@@ -560,72 +517,102 @@ class TitanApp(ctk.CTk):
         self.dcf_inputs["Expected Growth %"].insert(0, f"{defs['growth']:.1f}")
         self.dcf_inputs["Terminal Multiple"].delete(0, "end")
         self.dcf_inputs["Terminal Multiple"].insert(0, f"{defs['terminal']:.1f}")
+        self.schedule_dcf_heatmap()
 
     # --- VS MODE ---
     def run_comparison(self):
         comp_input = self.entry_vs.get().upper()
         if not comp_input or not self.current_ticker: return
-        tickers = [t.strip() for t in comp_input.split(',')]
+        tickers = [t.strip() for t in comp_input.split(',') if t.strip()]
         if self.current_ticker not in tickers: tickers.insert(0, self.current_ticker)
+        tickers = list(dict.fromkeys(tickers))
+        self.vs_run += 1
+        self.layout_comparison(tickers)
         self.btn_vs.configure(text="Loading...", state="disabled")
-        threading.Thread(target=self.fetch_comparison, args=(tickers,), daemon=True).start()
+        threading.Thread(target=self.fetch_comparison, args=(tickers, self.vs_run), daemon=True).start()
 
-    def fetch_comparison(self, tickers):
+    def fetch_comparison(self, tickers, run):
+        # All tickers at once through the shared info cache; each column fills in as soon as its ticker lands
+        def on_result(t, info): self.after(0, lambda: self.fill_comparison(t, info, run))
+        def on_error(t, e): self.after(0, lambda: self.fill_comparison(t, None, run))
         try:
-            results = []
-            for t in tickers:
-                try:
-                    info = yf.Ticker(t).info
-                    peg = info.get('pegRatio')
-                    if not peg:
-                         pe = info.get('trailingPE', 0)
-                         g = info.get('earningsGrowth', 0)
-                         peg = (pe / (g*100)) if g > 0 else 0
-                    info['manualPEG'] = peg
-                    results.append((t, info))
-                except: pass
-            
-            metrics = [
-                ("Market Cap", 'marketCap', True, True),
-                ("P/E Ratio", 'trailingPE', False, False),
-                ("PEG Ratio", 'manualPEG', False, False),
-                ("ROE", 'returnOnEquity', True, False),
-                ("Gross Margin", 'grossMargins', True, False),
-                ("Rev Growth", 'revenueGrowth', True, False),
-                ("Debt/Equity", 'debtToEquity', False, False)
-            ]
-            self.after(0, lambda: self.render_comparison(results, metrics))
+            TitanScheduler(max_workers=min(VS_MAX_WORKERS, len(tickers))).run(tickers, get_info, on_result, on_error)
         except:
             print(traceback.format_exc())
         finally:
             self.after(0, lambda: self.btn_vs.configure(text="COMPARE ALL", state="normal"))
 
-    def render_comparison(self, results, metrics):
-        for w in self.vs_container.winfo_children(): w.destroy()
-        
-        # Header Row
-        h_frame = ctk.CTkFrame(self.vs_container, fg_color="transparent")
-        h_frame.pack(fill="x", pady=5)
-        ctk.CTkLabel(h_frame, text="METRIC", width=120, font=("Arial", 12, "bold")).pack(side="left")
-        for t, _ in results:
-             ctk.CTkLabel(h_frame, text=t, width=100, font=("Arial", 12, "bold"), text_color="#38bdf8").pack(side="left", padx=5)
-
-        for label, key, higher_better, is_large_num in metrics:
-            row = ctk.CTkFrame(self.vs_container, fg_color="#0f172a")
-            row.pack(fill="x", pady=2)
-            ctk.CTkLabel(row, text=label, width=120, anchor="w", text_color="gray").pack(side="left", padx=10)
-            
-            vals = []
-            for _, info in results: vals.append(info.get(key, 0) or 0)
+    @staticmethod
+    def comparison_values(info):
+        # Cached info dicts are shared, so the manual PEG goes into a copy of the values
+        values = {key: info.get(key, 0) or 0 for _, key, _, _ in VS_METRICS}
+        peg = info.get('pegRatio')
+        if not peg:
+            pe = info.get('trailingPE', 0) or 0
+            g = info.get('earningsGrowth', 0) or 0
+            peg = (pe / (g*100)) if g > 0 else 0
+        values['manualPEG'] = peg
+        return values
+
+    def layout_comparison(self, tickers):
+        # Grid of labels that outlives a comparison: metric names are created once, ticker
+        # columns only when a ticker is new, and dropped tickers lose just their column
+        if not self.vs_cols and not self.vs_container.winfo_children():
+            ctk.CTkLabel(self.vs_container, text="METRIC", width=120, font=("Arial", 12, "bold")).grid(row=0, column=0, pady=5)
+            for r, (label, _, _, _) in enumerate(VS_METRICS, 1):
+                ctk.CTkLabel(self.vs_container, text=label, width=120, anchor="w", text_color="gray",
+                             fg_color="#0f172a").grid(row=r, column=0, sticky="ew", pady=2)
+
+        for t in [t for t in self.vs_cols if t not in tickers]:
+            for lbl in self.vs_cols.pop(t).values():
+                self.vs_colors.pop(lbl, None)
+                lbl.destroy()
+            self.vs_values.pop(t, None)
+
+        for c, t in enumerate(tickers, 1):
+            col = self.vs_cols.get(t)
+            if col is None:
+                col = {"header": ctk.CTkLabel(self.vs_container, text=t, width=100, font=("Arial", 12, "bold"), text_color="#38bdf8")}
+                for _, key, _, _ in VS_METRICS:
+                    col[key] = ctk.CTkLabel(self.vs_container, text="…", width=100, text_color="gray", fg_color="#0f172a", font=("Consolas", 12))
+                self.vs_cols[t] = col
+                self.vs_values[t] = None
+            col["header"].grid(row=0, column=c, padx=5, pady=5)
+            for r, (_, key, _, _) in enumerate(VS_METRICS, 1):
+                col[key].grid(row=r, column=c, padx=5, pady=2, sticky="ew")
+
+    def fill_comparison(self, ticker, info, run):
+        col = self.vs_cols.get(ticker)
+        if col is None: return # Dropped from the comparison meanwhile
+        if info is None:
+            # Keep what an earlier comparison showed; only a never-loaded column shows the failure
+            if self.vs_values.get(ticker) is None and run == self.vs_run:
+                col["header"].configure(text_color="#ef4444")
+                for _, key, _, _ in VS_METRICS: col[key].configure(text="-")
+            return
+        values = self.comparison_values(info)
+        self.vs_values[ticker] = values
+        col["header"].configure(text_color="#38bdf8")
+        for label, key, _, is_large_num in VS_METRICS:
+            val = values[key]
+            fmt_val = self.fmt_num(val) if is_large_num else f"{val:.2f}"
+            if "ROE" in label or "Margin" in label or "Growth" in label:
+                 fmt_val = f"{val*100:.1f}%" if not is_large_num else fmt_val
+            col[key].configure(text=fmt_val)
+        self.highlight_comparison()
+
+    def highlight_comparison(self):
+        # Best value per metric in green, among the columns loaded so far
+        loaded = {t: v for t, v in self.vs_values.items() if v}
+        for _, key, higher_better, _ in VS_METRICS:
+            vals = [v[key] for v in loaded.values()]
             best_val = max(vals) if higher_better else min([v for v in vals if v > 0] or [0])
-
-            for i, val in enumerate(vals):
-                color = "white"
-                if val == best_val and val != 0: color = "#4ade80"
-                fmt_val = self.fmt_num(val) if is_large_num else f"{val:.2f}"
-                if "ROE" in label or "Margin" in label or "Growth" in label:
-                     fmt_val = f"{val*100:.1f}%" if not is_large_num else fmt_val
-                ctk.CTkLabel(row, text=fmt_val, width=100, text_color=color, font=("Consolas", 12)).pack(side="left", padx=5)
+            for t, v in loaded.items():
+                lbl = self.vs_cols[t][key]
+                color = "#4ade80" if v[key] == best_val and v[key] != 0 else "white"
+                if self.vs_colors.get(lbl) != color:
+                    lbl.configure(text_color=color)
+                    self.vs_colors[lbl] = color
 
     def run_dcf(self):
         try:
@@ -650,8 +637,94 @@ class TitanApp(ctk.CTk):
             upside = ((val - price) / price) * 100
             color = "#4ade80" if val > price else "#ef4444"
             self.lbl_dcf_result.configure(text=f"Intrinsic Value: ${val:.2f} ({upside:+.1f}%)", text_color=color)
+            self.schedule_dcf_heatmap()
         except: self.lbl_dcf_result.configure(text="Error in Calculation", text_color="red")
 
+    def run_monte_carlo(self):
+        info = self.current_info
+        if not info: return
+        fcf, shares, price = info.get('freeCashflow'), info.get('sharesOutstanding'), info.get('currentPrice', 0)
+        if not fcf or not shares or fcf <= 0 or not price:
+            self.lbl_mc.configure(text="Missing or negative FCF - Cannot Simulate", text_color="red")
+            return
+        try:
+            # Centered on the inputs, which start out as fetch_data's dcf_defaults
+            g = float(self.dcf_inputs["Expected Growth %"].get()) / 100
+            r = float(self.dcf_inputs["Discount Rate %"].get()) / 100
+            term = float(self.dcf_inputs["Terminal Multiple"].get())
+        except ValueError:
+            self.lbl_mc.configure(text="Error in Inputs", text_color="red")
+            return
+        self.btn_mc.configure(state="disabled", text="Simulating...")
+        threading.Thread(target=self._monte_carlo_thread, args=(fcf / shares, price, g, r, term), daemon=True).start()
+
+    def _monte_carlo_thread(self, fcf_per_share, price, g, r, term):
+        try: res = TitanDCF.monte_carlo(fcf_per_share, price, g, r, term)
+        except Exception as e:
+            print(f"Monte Carlo Error: {e}")
+            res = None
+        self.after(0, lambda: self.show_monte_carlo(res, price))
+
+    def show_monte_carlo(self, res, price):
+        self.btn_mc.configure(state="normal", text=f"MONTE CARLO ({MC_PATHS:,} PATHS)")
+        if not res:
+            self.lbl_mc.configure(text="Error in Simulation", text_color="red")
+            return
+        pct = "  ".join(f"P{p}: ${v:,.2f}" for p, v in res['percentiles'].items())
+        color = "#4ade80" if res['p_above'] >= 0.5 else "#ef4444"
+        self.lbl_mc.configure(text=f"{pct}\nMean: ${res['mean']:,.2f}   P(Value > ${price:,.2f}): {res['p_above'] * 100:.1f}%", text_color=color)
+
+    def schedule_dcf_heatmap(self):
+        # Debounced: a burst of keystrokes redraws once
+        if self.dcf_after: self.after_cancel(self.dcf_after)
+        self.dcf_after = self.after(60, self.update_dcf_heatmap)
+
+    def update_dcf_heatmap(self):
+        self.dcf_after = None
+        info = self.current_info
+        if not info: return
+        fcf, shares, price = info.get('freeCashflow'), info.get('sharesOutstanding'), info.get('currentPrice', 0)
+        if not fcf or not shares or fcf <= 0 or not price: return # Same cases run_dcf reports
+        try:
+            g = float(self.dcf_inputs["Expected Growth %"].get()) / 100
+            r = float(self.dcf_inputs["Discount Rate %"].get()) / 100
+            term = float(self.dcf_inputs["Terminal Multiple"].get())
+        except ValueError: return # Half-typed input
+
+        growths, discounts, terminals = g + HEAT_GROWTH_STEPS, r + HEAT_DISCOUNT_STEPS, term * HEAT_TERMINAL_SCALE
+        cube = TitanDCF.grid(fcf / shares, growths, discounts, terminals)
+        mid_g, mid_r, mid_t = len(growths) // 2, len(discounts) // 2, len(terminals) // 2
+        self.draw_dcf_heatmap(cube[:, :, mid_t], growths, discounts, price)
+        spread = cube[mid_g, mid_r]
+        self.lbl_dcf_range.configure(text=f"Terminal {terminals[0]:.1f}x - {terminals[-1]:.1f}x at your growth / discount: ${spread.min():.2f} - ${spread.max():.2f}")
+
+    def draw_dcf_heatmap(self, values, growths, discounts, price):
+        # Items are created once and only recoloured / relabelled afterwards
+        c = self.dcf_canvas
+        rows, cols = values.shape
+        if self.heat_items is None:
+            self.heat_items = {"rows": [], "cols": [], "cells": {}}
+            for j in range(cols):
+                x = HEAT_LABEL_W + j * HEAT_CELL_W + HEAT_CELL_W / 2
+                self.heat_items["cols"].append(c.create_text(x, HEAT_CELL_H / 2, fill="gray", font=("Arial", 9)))
+            for i in range(rows):
+                y = (i + 1) * HEAT_CELL_H
+                self.heat_items["rows"].append(c.create_text(HEAT_LABEL_W - 8, y + HEAT_CELL_H / 2, anchor="e", fill="gray", font=("Arial", 9)))
+                for j in range(cols):
+                    x = HEAT_LABEL_W + j * HEAT_CELL_W
+                    rect = c.create_rectangle(x, y, x + HEAT_CELL_W - 1, y + HEAT_CELL_H - 1, width=0)
+                    text = c.create_text(x + HEAT_CELL_W / 2, y + HEAT_CELL_H / 2, fill="white", font=("Consolas", 9))
+                    self.heat_items["cells"][(i, j)] = (rect, text)
+            mid = self.heat_items["cells"][(rows // 2, cols // 2)][0]
+            c.itemconfigure(mid, outline="white", width=2) # Current inputs
+
+        for j, item in enumerate(self.heat_items["cols"]): c.itemconfigure(item, text=f"r {discounts[j] * 100:.0f}%")
+        for i, item in enumerate(self.heat_items["rows"]): c.itemconfigure(item, text=f"g {growths[i] * 100:.0f}%")
+        for (i, j), (rect, text) in self.heat_items["cells"].items():
+            v = values[i, j]
+            c.itemconfigure(rect, fill=heat_color(v / price - 1))
+            c.itemconfigure(text, text=f"{v:,.0f}" if v >= 100 else f"{v:.2f}")
+
     def fmt_num(self, num):
         if not num: return "-"
         if num > 1e12: return f"${num/1e12:.2f}T"
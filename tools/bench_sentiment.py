@@ -0,0 +1,89 @@
+import argparse
+import glob
+import json
+import os
+import pickle
+import sqlite3
+import sys
+import time
+import numpy as np
+
+# --- SENTIMENT SCORER BENCHMARK ---
+# Throughput of every registered scorer, and how often each one agrees with TextBlob,
+# on a recorded headline corpus (no network, no headline cache).
+#   python tools/bench_sentiment.py                       # replay recordings + cached feeds
+#   python tools/bench_sentiment.py --corpus titles.txt   # one headline per line
+#   python tools/bench_sentiment.py --corpus titan_replay # a TITAN_REPLAY_DIR
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from logic.scorers import SCORERS, build_scorer
+from logic.data_provider import DEFAULT_REPLAY_DIR
+from logic.cache_store import CACHE_DB
+
+NEUTRAL_BAND = 0.1 # Same thresholds as the headline colours in the app
+REFERENCE = "textblob"
+
+def load_corpus(path=None):
+    titles = []
+    if path and os.path.isfile(path):
+        with open(path, 'r', encoding='utf-8') as f: titles = [line.strip() for line in f]
+    else:
+        # Recorded provider responses (news/*.pkl)
+        for pkl in glob.glob(os.path.join(path or os.path.join(ROOT, DEFAULT_REPLAY_DIR), "news", "*.pkl")):
+            with open(pkl, 'rb') as f: titles += [e['title'] for e in pickle.load(f)]
+        # Feeds stored by the conditional-GET fetcher
+        db = os.path.join(ROOT, CACHE_DB)
+        if path is None and os.path.exists(db):
+            try:
+                conn = sqlite3.connect(db)
+                for (entries,) in conn.execute("SELECT entries FROM feeds"):
+                    titles += [e['title'] for e in json.loads(entries)]
+            except sqlite3.Error as e:
+                print(f"Feed Cache Error: {e}")
+    return [t for t in dict.fromkeys(titles) if t]
+
+def classify(scores):
+    s = np.asarray(scores)
+    return np.where(s > NEUTRAL_BAND, 1, np.where(s < -NEUTRAL_BAND, -1, 0))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare headline sentiment scorers")
+    parser.add_argument("--corpus", help="Headline file (one per line) or replay directory")
+    parser.add_argument("--repeat", type=int, default=1, help="Score the corpus this many times")
+    args = parser.parse_args(argv)
+
+    titles = load_corpus(args.corpus)
+    if not titles:
+        print("No headlines found. Record some with TITAN_PROVIDER=record or pass --corpus.")
+        return 1
+    batch = titles * max(1, args.repeat)
+    print(f"Corpus: {len(titles)} unique headlines, {len(batch)} scored per backend")
+
+    results = {}
+    for name in SCORERS:
+        try:
+            scorer = build_scorer(name)
+            scorer.score_batch(titles[:5]) # Warm-up: imports, lazy model loading
+            t0 = time.perf_counter()
+            scores = scorer.score_batch(batch)
+            took = time.perf_counter() - t0
+        except Exception as e:
+            print(f"{name:<10} Error: {e}")
+            continue
+        results[name] = np.asarray(scores[:len(titles)], dtype=np.float64)
+        print(f"{name:<10} {len(batch) / took:12,.0f} headlines/s  ({took * 1000:.1f} ms)")
+
+    if REFERENCE in results:
+        ref = results[REFERENCE]
+        print(f"--- AGREEMENT WITH {REFERENCE.upper()} ---")
+        for name, scores in results.items():
+            if name == REFERENCE: continue
+            same = (classify(scores) == classify(ref)).mean() * 100
+            corr = np.corrcoef(scores, ref)[0, 1] if scores.std() > 0 and ref.std() > 0 else float('nan')
+            mad = np.abs(scores - ref).mean()
+            print(f"{name:<10} bullish/neutral/bearish agree {same:5.1f}%  corr {corr:5.2f}  mean |diff| {mad:.3f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+import argparse
+import os
+import re
+import subprocess
+import sys
+import statistics
+
+# --- COLD START REGRESSION CHECK ---
+# Launches main.py until its first painted window (TITAN_STARTUP_EXIT=1), a few times,
+# and fails when the median time-to-window exceeds the budget or when a module that
+# is meant to load lazily shows up on the startup path. Needs a display.
+#   python tools/check_startup.py [--budget 2.0] [--runs 3]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from logic.startup import STARTUP_BUDGET, EXIT_ENV
+
+# Must not be imported before the first paint (not PIL: customtkinter imports it itself)
+LAZY_MODULES = ("yfinance", "pandas", "matplotlib", "requests", "textblob", "feedparser")
+
+def run_once():
+    env = dict(os.environ, **{EXIT_ENV: "1"})
+    proc = subprocess.run([sys.executable, "-X", "importtime", "main.py"], cwd=ROOT, env=env,
+                          capture_output=True, text=True, timeout=120)
+    paint = re.search(r"^first paint\s+(\d+) ms", proc.stdout, re.M)
+    if proc.returncode != 0 or not paint:
+        raise RuntimeError(f"main.py did not reach first paint (exit {proc.returncode}):\n{proc.stderr[-2000:]}")
+    # "import time: self [us] | cumulative | imported package"; top-level rows have no indent
+    imports = {}
+    for m in re.finditer(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)", proc.stderr, re.M):
+        imports[m.group(4)] = (int(m.group(2)), len(m.group(3)))
+    return int(paint.group(1)) / 1000, proc.stdout, imports
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fail if time-to-window grows beyond a budget")
+    parser.add_argument("--budget", type=float, default=STARTUP_BUDGET, help="Seconds to first paint")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=12, help="Slowest top-level imports to list")
+    args = parser.parse_args(argv)
+
+    times = []
+    for _ in range(max(1, args.runs)):
+        seconds, report, imports = run_once()
+        times.append(seconds)
+
+    print(report.strip())
+    print("--- SLOWEST IMPORTS (cumulative, last run) ---")
+    top = sorted(((us, name) for name, (us, depth) in imports.items() if depth == 0), reverse=True)
+    for us, name in top[:args.top]: print(f"{name:<32}{us / 1000:8.1f} ms")
+
+    failed = False
+    eager = sorted({name.split('.')[0] for name in imports} & set(LAZY_MODULES))
+    if eager:
+        print(f"FAIL: imported before first paint: {', '.join(eager)}")
+        failed = True
+    median = statistics.median(times)
+    print(f"Time to window: median {median:.2f}s over {len(times)} runs (budget {args.budget:.2f}s)")
+    if median > args.budget:
+        print("FAIL: startup budget exceeded")
+        failed = True
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+import numpy as np
+import customtkinter as ctk
+import matplotlib.dates as mdates
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+def lttb(x, y, n_out):
+    # Largest-Triangle-Three-Buckets: keeps the visual shape of a series with n_out points
+    n = len(x)
+    if n_out >= n or n_out < 3: return x, y
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], max(edges[i + 1], edges[i] + 1)
+        # Average of the next bucket is the third triangle corner
+        nlo, nhi = edges[i + 1], edges[i + 2] if i + 2 < len(edges) else n
+        cx, cy = x[nlo:max(nhi, nlo + 1)].mean(), y[nlo:max(nhi, nlo + 1)].mean()
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return x[keep], y[keep]
+
+class PriceChart(ctk.CTkFrame):
+    # One figure, canvas, line and fill for the whole session. New data only
+    # replaces the artists' data; nothing is rebuilt or leaked on period switches.
+    def __init__(self, master, bg="#020617", color="#38bdf8", grid_color="#334155"):
+        super().__init__(master, fg_color=bg)
+        self.color = color
+
+        self.figure = Figure(figsize=(5, 4), dpi=100, facecolor=bg)
+        self.ax = self.figure.add_subplot(111)
+        self.ax.set_facecolor(bg)
+        self.line, = self.ax.plot([], [], color=color, linewidth=1.5)
+        # Area under the line down to 0, as fill_between draws it; show() only swaps its polygon
+        self.fill = self.ax.add_collection(PolyCollection([], alpha=0.1, color=color), autolim=False)
+
+        locator = mdates.AutoDateLocator()
+        self.ax.xaxis.set_major_locator(locator)
+        self.ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+        self.ax.grid(True, color=grid_color, linestyle='--', alpha=0.3)
+        self.ax.tick_params(axis='x', colors='gray', rotation=0, labelsize=8)
+        self.ax.tick_params(axis='y', colors='gray', labelsize=8)
+        for spine in self.ax.spines.values(): spine.set_visible(False)
+
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True)
+        self.lbl_message = ctk.CTkLabel(self, text="", text_color="gray")
+
+    def target_points(self):
+        # About one point per horizontal pixel (call on the Tk thread)
+        width = self.winfo_width()
+        return width if width > 100 else 1000
+
+    @staticmethod
+    def prepare(close, max_points):
+        # Worker-thread side: plain float arrays, already downsampled for the screen.
+        # Exchange wall-clock time, so intraday ticks read like the market's own hours.
+        close = close.dropna()
+        index = close.index.tz_localize(None) if getattr(close.index, 'tz', None) is not None else close.index
+        x = mdates.date2num(index.to_pydatetime())
+        y = close.to_numpy(dtype=np.float64)
+        return lttb(x, y, max_points)
+
+    @staticmethod
+    def area(x, y):
+        # Polygon under the curve: along the data, then back along the baseline
+        xs = np.concatenate((x[:1], x, x[-1:]))
+        ys = np.concatenate(([0.0], y, [0.0]))
+        return np.column_stack((xs, ys))
+
+    def show(self, x, y):
+        # Tk thread only
+        self.lbl_message.place_forget()
+        self.line.set_data(x, y)
+        self.fill.set_verts([self.area(x, y)] if len(x) else [])
+        if len(x) > 1: self.ax.set_xlim(x[0], x[-1])
+        if len(y): self.ax.set_ylim(0, float(np.nanmax(y)) * 1.05)
+        self.canvas.draw_idle()
+
+    def show_message(self, text):
+        self.line.set_data([], [])
+        self.fill.set_verts([])
+        self.canvas.draw_idle()
+        self.lbl_message.configure(text=text)
+        self.lbl_message.place(relx=0.5, rely=0.5, anchor="center")
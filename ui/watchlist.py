@@ -0,0 +1,132 @@
+import sys
+import customtkinter as ctk
+
+# --- VIRTUALIZED WATCHLIST ---
+# Only the rows that fit on screen exist as widgets. Scrolling rebinds that fixed pool
+# of rows to other items, and every row remembers what it last displayed, so a rebind
+# or a score patch only configures the cells whose text or colour actually changed.
+# Patches are coalesced and flushed once per idle cycle.
+ROW_HEIGHT = 37 # 35px button + 2px gap
+WHEEL_ROWS = 3  # Rows per mouse-wheel notch
+
+class WatchRow:
+    # One recycled sidebar row: ticker button, implied growth, score badge
+    def __init__(self, master, card_color):
+        self.frame = ctk.CTkFrame(master, fg_color="transparent", height=ROW_HEIGHT - 2)
+        self.btn = ctk.CTkButton(self.frame, text="", fg_color=card_color, anchor="w", height=35, font=("Arial", 12, "bold"))
+        self.btn.pack(side="left", fill="x", expand=True)
+        self.lbl_g = ctk.CTkLabel(self.frame, text="", width=52, font=("Consolas", 11))
+        self.lbl_g.pack(side="right", padx=(5,0))
+        self.lbl_score = ctk.CTkLabel(self.frame, text="", width=30, text_color="black", corner_radius=4)
+        self.lbl_score.pack(side="right", padx=(5,0))
+        self.ticker = None
+        self.cells = (None,) * 5 # text, score text, score colour, growth text, growth colour
+
+    def show(self, ticker, cells):
+        self.ticker = ticker
+        old = self.cells
+        if cells == old: return
+        if cells[0] != old[0]: self.btn.configure(text=cells[0])
+        if cells[1:3] != old[1:3]: self.lbl_score.configure(text=cells[1], fg_color=cells[2])
+        if cells[3:5] != old[3:5]: self.lbl_g.configure(text=cells[3], text_color=cells[4])
+        self.cells = cells
+
+    def widgets(self):
+        return (self.frame, self.btn, self.lbl_g, self.lbl_score)
+
+class WatchlistView(ctk.CTkFrame):
+    # formatter(item) -> (text, score text, score colour, growth text, growth colour)
+    def __init__(self, master, on_select, formatter, card_color="#1e293b"):
+        super().__init__(master, fg_color="transparent")
+        self.on_select = on_select
+        self.formatter = formatter
+        self.card_color = card_color
+        self.items = []
+        self.index = {}   # ticker -> position in items
+        self.offset = 0   # Scroll position in pixels
+        self.rows = []
+        self.dirty = set()
+        self.flush_pending = False
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.body = ctk.CTkFrame(self, fg_color="transparent")
+        self.body.pack(side="left", fill="both", expand=True)
+        self.body.bind("<Configure>", lambda e: self.layout())
+        self.bind_wheel(self.body)
+
+    # --- Public API ---
+    def set_items(self, items):
+        # New order / membership: rebind the visible rows, nothing is recreated
+        self.items = list(items)
+        self.index = {item['ticker']: i for i, item in enumerate(self.items)}
+        self.dirty.clear()
+        self.scroll_to(self.offset)
+
+    def patch(self, item):
+        # One item changed; its row (if on screen) is updated at the next idle moment
+        self.dirty.add(item['ticker'])
+        if not self.flush_pending:
+            self.flush_pending = True
+            self.after_idle(self.flush)
+
+    def flush(self):
+        self.flush_pending = False
+        dirty, self.dirty = self.dirty, set()
+        for row in self.rows:
+            if row.ticker in dirty and row.ticker in self.index:
+                row.show(row.ticker, self.formatter(self.items[self.index[row.ticker]]))
+
+    # --- Scrolling ---
+    def view_height(self):
+        # In widget units, like ROW_HEIGHT and place() coordinates (CTk scales both)
+        return max(self.body.winfo_height() / ctk.ScalingTracker.get_widget_scaling(self), 1)
+
+    def scroll_to(self, offset):
+        view = self.view_height()
+        total = len(self.items) * ROW_HEIGHT
+        self.offset = int(max(0, min(offset, total - view)))
+        self.render()
+        if total <= view: self.scrollbar.set(0, 1)
+        else: self.scrollbar.set(self.offset / total, (self.offset + view) / total)
+
+    def on_scrollbar(self, *args):
+        # Tk scrollbar protocol: ("moveto", fraction) or ("scroll", n, "units"/"pages")
+        total = len(self.items) * ROW_HEIGHT
+        if args[0] == "moveto": self.scroll_to(float(args[1]) * total)
+        elif args[0] == "scroll":
+            step = self.view_height() if args[2] == "pages" else ROW_HEIGHT
+            self.scroll_to(self.offset + int(args[1]) * step)
+
+    def on_wheel(self, event):
+        if event.num == 4: notches = 1
+        elif event.num == 5: notches = -1
+        else: notches = event.delta / 120 if sys.platform.startswith("win") else event.delta
+        self.scroll_to(self.offset - notches * WHEEL_ROWS * ROW_HEIGHT)
+        return "break"
+
+    def bind_wheel(self, widget):
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"): widget.bind(seq, self.on_wheel)
+
+    # --- Rendering ---
+    def layout(self):
+        # Pool size follows the visible height (+1 for the partly visible row)
+        needed = int(self.view_height() // ROW_HEIGHT) + 2
+        while len(self.rows) < needed:
+            row = WatchRow(self.body, self.card_color)
+            row.btn.configure(command=lambda r=row: r.ticker and self.on_select(r.ticker))
+            for w in row.widgets(): self.bind_wheel(w)
+            self.rows.append(row)
+        self.scroll_to(self.offset)
+
+    def render(self):
+        first, shift = divmod(self.offset, ROW_HEIGHT)
+        for i, row in enumerate(self.rows):
+            pos = first + i
+            if pos >= len(self.items):
+                row.frame.place_forget()
+                row.ticker = None
+                continue
+            item = self.items[pos]
+            row.show(item['ticker'], self.formatter(item))
+            row.frame.place(x=0, y=i * ROW_HEIGHT - shift, relwidth=1.0)